@@ -0,0 +1,77 @@
+"""
+Micro-benchmark comparing the conversion of records to and from rows using
+the compiled plans of the Record class against interpreting the schema
+columns with the general serializer and deserializer for every record.
+
+Run from the repository root with
+`python -m benchmarks.record_plans [ROW_COUNT]`.
+"""
+
+import datetime
+import sys
+import typing
+
+import dynamo_io as dio
+from benchmarks import schema_lookups
+from dynamo_io import _deserializer
+from dynamo_io import _serializer
+
+Item = schema_lookups.Item
+
+
+def _interpreted_to_row(record: dio.Record) -> dict:
+    """Serializes the record by interpreting each column of the schema."""
+    ignores = (None, "", dio.DELETE)
+    fields = {
+        (column.key or column.name): _serializer.serialize(value, column)
+        for column in record.schema.all_columns
+        if (value := record.get_value_for(column)) not in ignores
+    }
+    return {**record.table_key, **fields}
+
+
+def _interpreted_from_row(row: dict) -> dio.Record:
+    """Deserializes the row by interpreting each column of the schema."""
+    schema = Item.schema
+    keys = {
+        c.name: _deserializer.deserialize(row[c.key], c)
+        for c in schema.loaded_key_columns
+    }
+    fields = {
+        c.name: _deserializer.deserialize(row[c.key or c.name], c)
+        for c in schema.loaded_columns
+        if (c.key or c.name) in row
+    }
+    return Item(**keys, **fields)
+
+
+def main(count: int = 100_000):
+    """Runs the benchmark for the specified number of rows."""
+    rows = schema_lookups._make_rows(count)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    records: typing.List[typing.Any] = [
+        Item(
+            item_id=f"item:{index}",
+            version="version:1",
+            title=f"Item {index}",
+            count=index,
+            price=index / 100,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+    print(f"Converting {count:,} records and rows")
+
+    measure = schema_lookups._measure
+    interpreted = measure("interpreted to_row", _interpreted_to_row, records)
+    compiled = measure("compiled to_row", lambda r: r.to_row(), records)
+    print(f"{'speedup':<30} {interpreted / compiled:8.2f}x")
+
+    interpreted = measure("interpreted from_row", _interpreted_from_row, rows)
+    compiled = measure("compiled from_row", Item.from_row, rows)
+    print(f"{'speedup':<30} {interpreted / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
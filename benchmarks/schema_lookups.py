@@ -0,0 +1,119 @@
+"""
+Micro-benchmark comparing row matching and deserialization using the
+lookups precomputed by the Schema against recomputing the same column
+collections for every row, as was done before the lookups existed.
+
+Run from the repository root with
+`python -m benchmarks.schema_lookups [ROW_COUNT]`.
+"""
+
+import dataclasses
+import sys
+import time
+import typing
+
+import dynamo_io as dio
+from dynamo_io import _deserializer
+
+
+@dataclasses.dataclass(frozen=True)
+class Item(dio.Record):
+    """Record with enough columns to resemble a typical wide item."""
+
+    item_id: dio.TypeHints.KeyColumn = None
+    version: dio.TypeHints.KeyColumn = None
+    title: dio.TypeHints.String = None
+    count: dio.TypeHints.Integer = None
+    price: dio.TypeHints.Float = None
+    active: dio.TypeHints.Boolean = None
+    tags: dio.TypeHints.StringSet = None
+
+    schema: typing.ClassVar[dio.Schema] = dio.Schema(
+        partition_key=dio.PartitionColumn("item_id", "item:"),
+        sort_key=dio.SortColumn("version", "version:"),
+        columns=(
+            dio.Column("title", dio.DynamoTypes.STRING),
+            dio.Column("count", dio.DynamoTypes.INTEGER),
+            dio.Column("price", dio.DynamoTypes.FLOAT),
+            dio.Column("active", dio.DynamoTypes.BOOLEAN),
+            dio.Column("tags", dio.DynamoTypes.STRING_SET),
+        ),
+    )
+
+
+def _legacy_all_columns(schema: dio.Schema) -> typing.Tuple[typing.Any, ...]:
+    """Builds the column tuple the way it was built on every access."""
+    return tuple(list(schema.columns) + list(schema.common))
+
+
+def _legacy_matches(schema: dio.Schema, row: dict) -> bool:
+    """Matches the row while rebuilding the set of schema keys for each row."""
+    if not row["pk"]["S"].startswith(schema.partition_key.value_prefix):
+        return False
+    if not row.get("sk", {}).get("S", "").startswith("version:"):
+        return False
+    schema_keys = {c.key or c.name for c in _legacy_all_columns(schema)}
+    return len({k for k in row if k not in ("pk", "sk")} - schema_keys) == 0
+
+
+def _legacy_from_row(row: dict) -> dio.Record:
+    """Deserializes the row while recomputing the columns for each row."""
+    schema = Item.schema
+    keys = {
+        "item_id": _deserializer.deserialize(row["pk"], schema.partition_key),
+        "version": _deserializer.deserialize(row["sk"], schema.sort_key),
+    }
+    fields = {
+        c.name: _deserializer.deserialize(row[c.key or c.name], c)
+        for c in _legacy_all_columns(schema)
+        if (c.key or c.name) in row and c.name not in keys and not c.computed
+    }
+    return Item(**keys, **fields)
+
+
+def _make_rows(count: int) -> typing.List[dict]:
+    """Creates serialized rows for the benchmark."""
+    return [
+        Item(
+            item_id=f"item:{index}",
+            version="version:1",
+            title=f"Item {index}",
+            count=index,
+            price=index / 100,
+            active=index % 2 == 0,
+            tags=["a", "b"],
+        ).to_row()
+        for index in range(count)
+    ]
+
+
+def _measure(
+    label: str,
+    function: typing.Callable[[typing.Any], typing.Any],
+    rows: typing.Sequence[typing.Any],
+) -> float:
+    """Prints and returns the time taken to apply the function to every row."""
+    start = time.perf_counter()
+    for row in rows:
+        function(row)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<30} {elapsed:8.3f}s {len(rows) / elapsed:12,.0f} rows/s")
+    return elapsed
+
+
+def main(count: int = 100_000):
+    """Runs the benchmark for the specified number of rows."""
+    rows = _make_rows(count)
+    print(f"Matching and deserializing {count:,} rows")
+
+    legacy = _measure("legacy matches", lambda r: _legacy_matches(Item.schema, r), rows)
+    current = _measure("precomputed matches", Item.schema.matches, rows)
+    print(f"{'speedup':<30} {legacy / current:8.2f}x")
+
+    legacy = _measure("legacy from_row", _legacy_from_row, rows)
+    current = _measure("precomputed from_row", Item.from_row, rows)
+    print(f"{'speedup':<30} {legacy / current:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -4,7 +4,13 @@ from importlib import metadata as _metadata
 
 import toml as _toml
 
+from dynamo_io.caching import PartitionCache  # noqa: F401
+from dynamo_io.caching import RecordCache  # noqa: F401
+from dynamo_io.caching import SingleFlight  # noqa: F401
 from dynamo_io.definitions import DELETE  # noqa: F401
+from dynamo_io.definitions import BatchRowResponse  # noqa: F401
+from dynamo_io.definitions import BatchWriteResponse  # noqa: F401
+from dynamo_io.definitions import BatchWriteStats  # noqa: F401
 from dynamo_io.definitions import BinarySetColumn  # noqa: F401
 from dynamo_io.definitions import BooleanColumn  # noqa: F401
 from dynamo_io.definitions import BytesColumn  # noqa: F401
@@ -31,12 +37,21 @@ from dynamo_io.definitions import PartitionColumn  # noqa: F401
 from dynamo_io.definitions import Response  # noqa: F401
 from dynamo_io.definitions import ResponseType  # noqa: F401
 from dynamo_io.definitions import Schema  # noqa: F401
+from dynamo_io.definitions import SegmentedScanResponse  # noqa: F401
+from dynamo_io.definitions import SegmentProgress  # noqa: F401
 from dynamo_io.definitions import SingleRowResponse  # noqa: F401
 from dynamo_io.definitions import SortColumn  # noqa: F401
+from dynamo_io.definitions import StreamedRowResponse  # noqa: F401
 from dynamo_io.definitions import StringColumn  # noqa: F401
 from dynamo_io.definitions import StringSetColumn  # noqa: F401
 from dynamo_io.definitions import TimestampColumn  # noqa: F401
 from dynamo_io.definitions import TypeHints  # noqa: F401
+from dynamo_io.definitions import add_to_set  # noqa: F401
+from dynamo_io.definitions import decrement  # noqa: F401
+from dynamo_io.definitions import delete_from_set  # noqa: F401
+from dynamo_io.definitions import increment  # noqa: F401
+from dynamo_io.dispatching import RecordDispatcher  # noqa: F401
+from dynamo_io.reader import batch_get_records  # noqa: F401
 from dynamo_io.reader import get_indexed_record  # noqa: F401
 from dynamo_io.reader import get_indexed_records  # noqa: F401
 from dynamo_io.reader import get_indexed_row  # noqa: F401
@@ -45,12 +60,25 @@ from dynamo_io.reader import get_record  # noqa: F401
 from dynamo_io.reader import get_records_for_partition  # noqa: F401
 from dynamo_io.reader import get_row  # noqa: F401
 from dynamo_io.reader import get_rows_for_partition  # noqa: F401
+from dynamo_io.reader import iter_entire_table  # noqa: F401
+from dynamo_io.reader import iter_records_for_partition  # noqa: F401
+from dynamo_io.reader import iter_rows_for_partition  # noqa: F401
 from dynamo_io.reader import read_entire_table  # noqa: F401
+from dynamo_io.recorder import BatchRecordResponse  # noqa: F401
 from dynamo_io.recorder import PagedRecordResponse  # noqa: F401
 from dynamo_io.recorder import Record  # noqa: F401
 from dynamo_io.recorder import SingleRecordResponse  # noqa: F401
+from dynamo_io.recorder import StreamedRecordResponse  # noqa: F401
+from dynamo_io.recorder import UpdateRequest  # noqa: F401
+from dynamo_io.retries import DEFAULT_RETRY_POLICY  # noqa: F401
+from dynamo_io.retries import RetryPolicy  # noqa: F401
+from dynamo_io.writer import BatchWriter  # noqa: F401
+from dynamo_io.writer import CoalescingWriter  # noqa: F401
+from dynamo_io.writer import WriteBehindQueue  # noqa: F401
 from dynamo_io.writer import insert_records  # noqa: F401
+from dynamo_io.writer import purge_partition  # noqa: F401
 from dynamo_io.writer import remove  # noqa: F401
+from dynamo_io.writer import remove_records  # noqa: F401
 from dynamo_io.writer import transacts  # noqa: F401
 from dynamo_io.writer import upsert  # noqa: F401
 
@@ -0,0 +1,62 @@
+import itertools
+import typing
+from concurrent import futures
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+
+def iter_batches(
+    items: typing.Iterable[T],
+    size: int,
+) -> typing.Iterator[typing.List[T]]:
+    """
+    Yields lists of up to the specified number of items, consuming the
+    items lazily such that only one batch is held in memory at a time.
+    """
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def map_bounded(
+    function: typing.Callable[[int, T], R],
+    batches: typing.Iterable[T],
+    max_workers: int,
+) -> typing.List[R]:
+    """
+    Calls the function with the index and value of each batch, running up
+    to `max_workers` calls concurrently on a thread pool. Batches are only
+    taken from the iterable as workers become available, so the number of
+    batches held in memory is bounded regardless of how many there are.
+    Returns the results in the order of the batches. If any call fails, no
+    further batches are started and the error is raised once the calls in
+    flight have finished.
+
+    :param function:
+        Function called with the zero-based index and value of each batch.
+    :param batches:
+        Batches to process, which may be a lazy iterable.
+    :param max_workers:
+        Number of calls to run concurrently. Calls run sequentially on the
+        calling thread if this is 1 or less.
+    """
+    if max_workers <= 1:
+        return [function(index, batch) for index, batch in enumerate(batches)]
+
+    results: typing.Dict[int, R] = {}
+    pending: typing.Dict[futures.Future, int] = {}
+    iterator = enumerate(batches)
+
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for index, batch in itertools.islice(iterator, max_workers):
+            pending[executor.submit(function, index, batch)] = index
+
+        while pending:
+            done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+                for index, batch in itertools.islice(iterator, 1):
+                    pending[executor.submit(function, index, batch)] = index
+
+    return [results[index] for index in sorted(results)]
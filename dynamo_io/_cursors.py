@@ -0,0 +1,68 @@
+import base64
+import json
+import typing
+
+#: Request arguments that identify the origin of a paginated read. A cursor
+#: can only be used to resume a request with the same values for these.
+ORIGIN_ARGUMENTS = (
+    "TableName",
+    "IndexName",
+    "KeyConditionExpression",
+    "ExpressionAttributeValues",
+    "TotalSegments",
+)
+
+
+def _origin(request: dict) -> typing.Dict[str, typing.Any]:
+    """Returns the subset of the request that identifies where it reads from."""
+    return {k: request[k] for k in ORIGIN_ARGUMENTS if k in request}
+
+
+def encode(
+    request: dict,
+    last_evaluated_key: typing.Union[dict, list, None],
+) -> typing.Optional[str]:
+    """
+    Returns an opaque, url-safe continuation token that encodes the last
+    evaluated key along with the index and key condition of the request
+    that produced it, or None if there is nothing left to read.
+
+    :param request:
+        The request arguments of the paginated read.
+    :param last_evaluated_key:
+        The LastEvaluatedKey of the final page returned for the request, or
+        a list of per-segment states for parallel scans.
+    """
+    if not last_evaluated_key:
+        return None
+
+    payload = {"key": last_evaluated_key, "origin": _origin(request)}
+    serialized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return base64.urlsafe_b64encode(serialized.encode()).decode()
+
+
+def decode(cursor: str, request: dict) -> typing.Any:
+    """
+    Returns the exclusive start key encoded in the cursor after verifying
+    that the cursor originated from a request reading the same table,
+    index and key condition as the specified one.
+
+    :param cursor:
+        A continuation token previously created by the `encode` function.
+    :param request:
+        The request arguments of the paginated read to resume.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        key = payload["key"]
+        origin = payload["origin"]
+    except (ValueError, TypeError, KeyError) as error:
+        raise ValueError("Invalid pagination cursor.") from error
+
+    if origin != _origin(request):
+        raise ValueError(
+            "Pagination cursor does not match the table, index and key "
+            "condition of the request it is resuming."
+        )
+
+    return key
@@ -15,6 +15,41 @@ def _as_bytes(raw: typing.Union[str, bytes]) -> bytes:
     return raw
 
 
+#: Functions converting DynamoDB primitive values of each data type, by
+#: name, into native values. Data types not listed are returned as is.
+_NATIVE_CONVERTERS: typing.Dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+    definitions.DynamoTypes.TIMESTAMP.name: (
+        lambda v: datetime.datetime.fromtimestamp(int(v), datetime.timezone.utc)
+    ),
+    definitions.DynamoTypes.DATETIME.name: (
+        lambda v: datetime.datetime.fromisoformat("{}+00:00".format(v.rstrip("Z")))
+    ),
+    definitions.DynamoTypes.DATE.name: (
+        lambda v: datetime.datetime.fromisoformat(v).date()
+    ),
+    definitions.DynamoTypes.BOOLEAN.name: bool,
+    definitions.DynamoTypes.FLOAT.name: float,
+    definitions.DynamoTypes.FLOAT_SET.name: float,
+    definitions.DynamoTypes.INTEGER.name: int,
+    definitions.DynamoTypes.INTEGER_SET.name: int,
+    definitions.DynamoTypes.BYTES.name: _as_bytes,
+    definitions.DynamoTypes.BINARY_SET.name: _as_bytes,
+}
+
+#: Data types that are deserialized from a list of primitive values.
+_HOMOGENEOUS_SET_TYPES = (
+    definitions.DynamoTypes.BINARY_SET,
+    definitions.DynamoTypes.FLOAT_SET,
+    definitions.DynamoTypes.INTEGER_SET,
+    definitions.DynamoTypes.STRING_SET,
+)
+
+
+def _identity(value: typing.Any) -> typing.Any:
+    """Returns the value unchanged."""
+    return value
+
+
 def unstringify(value: str, dtype: definitions.DynamoType) -> typing.Any:
     """Convert a string value to its native Python type based on the DynamoDB type.
 
@@ -26,30 +61,7 @@ def unstringify(value: str, dtype: definitions.DynamoType) -> typing.Any:
         The value converted to its native Python type (datetime, bool, float, int,
         bytes, etc.).
     """
-    types = definitions.DynamoTypes
-
-    if dtype.name == types.TIMESTAMP.name:
-        return datetime.datetime.fromtimestamp(int(value), datetime.timezone.utc)
-
-    if dtype.name == types.DATETIME.name:
-        return datetime.datetime.fromisoformat("{}+00:00".format(value.rstrip("Z")))
-
-    if dtype.name == types.DATE.name:
-        return datetime.datetime.fromisoformat(value).date()
-
-    if dtype.name == types.BOOLEAN.name:
-        return bool(value)
-
-    if dtype.name in (types.FLOAT.name, types.FLOAT_SET.name):
-        return float(value)
-
-    if dtype.name in (types.INTEGER.name, types.INTEGER_SET.name):
-        return int(value)
-
-    if dtype.name in (types.BYTES.name, types.BINARY_SET.name):
-        return _as_bytes(value)
-
-    return value
+    return _NATIVE_CONVERTERS.get(dtype.name, _identity)(value)
 
 
 def _deserialize_map_column(
@@ -85,13 +97,6 @@ def deserialize(
 
     raw = value[column.data_type.value]
 
-    homogeneous_set_types = (
-        definitions.DynamoTypes.BINARY_SET,
-        definitions.DynamoTypes.FLOAT_SET,
-        definitions.DynamoTypes.INTEGER_SET,
-        definitions.DynamoTypes.STRING_SET,
-    )
-
     if isinstance(column, definitions.MapColumn):
         return _deserialize_map_column(raw, column)
     elif column.data_type == definitions.DynamoTypes.MAP:
@@ -110,7 +115,49 @@ def deserialize(
             for k, data in typing.cast(typing.Dict[str, dict], raw).items()
         }
 
-    if column.data_type in homogeneous_set_types:
+    if column.data_type in _HOMOGENEOUS_SET_TYPES:
         return [unstringify(v, column.data_type) for v in typing.cast(list, raw)]
 
     return unstringify(typing.cast(str, raw), column.data_type)
+
+
+def compile_deserializer(
+    column: definitions.AnyColumnType | None,
+) -> typing.Callable[[typing.Dict[str, typing.Any]], typing.Any]:
+    """Compile a function that deserializes DynamoDB values for the column.
+
+    The returned function behaves exactly like `deserialize` for the column,
+    but resolves the column data type conversions once up front so that
+    Record classes can reuse it for every row they load.
+
+    Args:
+        column: Optional column definition specifying the data type and structure.
+
+    Returns:
+        A function taking a raw DynamoDB value dictionary and returning the
+        deserialized Python value.
+    """
+    if column is None:
+        return lambda value: None
+
+    if column.data_type == definitions.DynamoTypes.MAP:
+        # Maps are nested and comparatively rare, so they are left to the
+        # general deserializer.
+        return lambda value: deserialize(value, column)
+
+    key = column.data_type.value
+    convert = _NATIVE_CONVERTERS.get(column.data_type.name, _identity)
+
+    if column.data_type in _HOMOGENEOUS_SET_TYPES:
+
+        def deserialize_set(value: typing.Dict[str, typing.Any]) -> typing.Any:
+            raw = value[key]
+            return None if raw is None else [convert(v) for v in raw]
+
+        return deserialize_set
+
+    def deserialize_value(value: typing.Dict[str, typing.Any]) -> typing.Any:
+        raw = value[key]
+        return None if raw is None else convert(raw)
+
+    return deserialize_value
@@ -0,0 +1,347 @@
+import time
+import typing
+
+from dynamo_io import _cursors
+from dynamo_io import caching
+from dynamo_io import definitions
+from dynamo_io import recorder
+
+#: Values DynamoDB accepts for the ReturnValues of an update.
+UPSERT_RETURN_VALUES = ("NONE", "UPDATED_NEW", "ALL_NEW", "ALL_OLD")
+
+#: Attributes to read for record functions, either as a sequence of column
+#: names resolved against the record schemas or a Record class whose schema
+#: columns are read. None reads all attributes.
+RecordProjection = typing.Union[
+    typing.Sequence[str],
+    typing.Type["recorder.Record"],
+    None,
+]
+
+
+def apply_projection(
+    request: dict,
+    attribute_keys: typing.Optional[typing.Sequence[str]],
+) -> dict:
+    """
+    Adds a projection expression to the request that limits the returned
+    attributes to the specified attribute keys, using `#pN` attribute name
+    placeholders to avoid collisions with the DynamoDB expression language.
+    """
+    if not attribute_keys:
+        return request
+
+    names = dict(request.get("ExpressionAttributeNames") or {})
+    placeholders = []
+    for index, key in enumerate(dict.fromkeys(attribute_keys)):
+        names[f"#p{index}"] = key
+        placeholders.append(f"#p{index}")
+
+    request["ExpressionAttributeNames"] = names
+    request["ProjectionExpression"] = ", ".join(placeholders)
+    return request
+
+
+def record_projection(
+    projection: RecordProjection,
+    record_classes: typing.Sequence[typing.Type["recorder.Record"]],
+) -> typing.Optional[typing.List[str]]:
+    """Resolves the record projection into the attribute keys to read."""
+    if projection is None:
+        return None
+
+    if isinstance(projection, type):
+        return list(projection.schema.get_attribute_keys())
+
+    return [k for c in record_classes for k in c.schema.get_attribute_keys(projection)]
+
+
+def to_get_item_request(
+    table_name: str,
+    partition_key_value: str,
+    sort_key_value: typing.Optional[str],
+    projection: typing.Optional[typing.Sequence[str]],
+) -> dict:
+    """Creates the get_item arguments for reading a row by its primary key."""
+    key = {"pk": {"S": str(partition_key_value)}}
+    if sort_key_value is not None:
+        key["sk"] = {"S": str(sort_key_value)}
+
+    return apply_projection({"TableName": table_name, "Key": key}, projection)
+
+
+def _assemble_get_rows_for_partition_key_params(
+    index: definitions.Index,
+    partition_key_value: str,
+    sort_key_starts: typing.Optional[str],
+    before_sort_key: typing.Optional[str],
+    after_sort_key: typing.Optional[str],
+) -> typing.Tuple[dict, dict, str]:
+    """
+    Assemble the attribute names, values and key expression required for dynamo.
+
+    :param index:
+        Object describing the indexes of the dynamo table.
+    :param partition_key_value:
+        The value defining the partition to query.
+    :param sort_key_starts:
+        The value the sort key must begin with.
+    :param before_sort_key:
+        The sort key value that all records must be before.
+    :param after_sort_key:
+        The sort key value that all records must be after.
+    :return:
+        A tuple of attribute_names, attribute_values, and key_conditions.
+    """
+    attribute_names = {"#k0": index.partition_key}
+    attribute_values = {":v0": {"S": str(partition_key_value)}}
+    key_condition = "#k0=:v0"
+
+    if index.sort_key and sort_key_starts:
+        attribute_names["#k1"] = index.sort_key
+        attribute_values[":v1"] = {"S": str(sort_key_starts)}
+        key_condition += " AND begins_with ( #k1, :v1 )"
+
+    if index.sort_key and before_sort_key:
+        attribute_names["#k2"] = index.sort_key
+        attribute_values[":v2"] = {"S": str(before_sort_key)}
+        key_condition += " AND #k2 < :v2"
+
+    if index.sort_key and after_sort_key:
+        attribute_names["#k3"] = index.sort_key
+        attribute_values[":v3"] = {"S": str(after_sort_key)}
+        key_condition += " AND #k3 > :v3"
+
+    return attribute_names, attribute_values, key_condition
+
+
+def assemble_get_rows_for_partition_request(
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: typing.Optional[str],
+    before_sort_key: typing.Optional[str],
+    after_sort_key: typing.Optional[str],
+    index: definitions.Index,
+    limit: int,
+) -> dict:
+    """
+    Assemble the query request arguments for reading rows from a partition.
+
+    :param table_name:
+        The table to pull rows from.
+    :param partition_key_value:
+        The value defining the partition to query.
+    :param sort_key_starts:
+        The value the sort key must begin with.
+    :param before_sort_key:
+        The sort key value that all records must be before.
+    :param after_sort_key:
+        The sort key value that all records must be after.
+    :param index:
+        Object describing the indexes of the dynamo table.
+    :param limit:
+        The number of rows to pull per page.
+    :return:
+        The keyword arguments for the DynamoDB query operation.
+    """
+    (
+        attribute_names,
+        attribute_values,
+        key_condition,
+    ) = _assemble_get_rows_for_partition_key_params(
+        index,
+        partition_key_value,
+        sort_key_starts,
+        before_sort_key,
+        after_sort_key,
+    )
+
+    request: dict = {
+        "TableName": table_name,
+        "ExpressionAttributeNames": attribute_names,
+        "ExpressionAttributeValues": attribute_values,
+        "KeyConditionExpression": key_condition,
+    }
+
+    if limit > 0:
+        request["Limit"] = limit
+
+    if index.name:
+        request["IndexName"] = index.name
+
+    return request
+
+
+def apply_start_key(
+    request: dict,
+    exclusive_start_key: typing.Optional[dict],
+    cursor: typing.Optional[str],
+) -> dict:
+    """
+    Adds the ExclusiveStartKey to the request from either the explicitly
+    specified key or the decoded cursor, which must have originated from
+    a request for the same table, index and key condition.
+    """
+    if cursor:
+        exclusive_start_key = _cursors.decode(cursor, request)
+
+    if exclusive_start_key:
+        request["ExclusiveStartKey"] = exclusive_start_key
+
+    return request
+
+
+def written_rows(items: typing.Iterable[dict]) -> typing.Iterator[dict]:
+    """Yields the rows of the put requests and the keys of delete requests."""
+    for item in items:
+        if "PutRequest" in item:
+            yield item["PutRequest"]["Item"]
+        else:
+            yield item["DeleteRequest"]["Key"]
+
+
+#: Result of writing a single batch as its stats, its BatchWriteItem request
+#: and the raw response of its final call.
+BatchWriteResult = typing.Tuple[definitions.BatchWriteStats, dict, dict]
+
+
+def to_batch_write_response(
+    results: typing.Sequence[BatchWriteResult],
+) -> definitions.BatchWriteResponse:
+    """
+    Creates the response of a batch write from the results of its batches,
+    with the request and raw response of the final batch.
+    """
+    _, request, response = results[-1] if results else (None, {}, {})
+    return definitions.BatchWriteResponse(
+        request=request,
+        response=response,
+        batches=tuple(stats for stats, _, _ in results),
+    )
+
+
+class BatchWriteProgress:
+    """
+    Tracks the items of a batch write that remain unprocessed across its
+    attempts, such that the sync and async writers share the bookkeeping of
+    the UnprocessedItems and the stats of the batch. The cached reads of the
+    items processed by each attempt are invalidated as soon as the attempt
+    completes, so they are not left stale when the retries of the remaining
+    items are exhausted.
+    """
+
+    def __init__(self, table_name: str, index: int, items: typing.List[dict]):
+        self.table_name = table_name
+        self.index = index
+        self.items = items
+        #: BatchWriteItem request of the first attempt, with every item.
+        self.request = {"RequestItems": {table_name: items}}
+        #: Request items to send in the next attempt.
+        self.unprocessed_items: dict = {table_name: items}
+        self.retried_item_count = 0
+        self._started = time.monotonic()
+
+    def update(
+        self,
+        attempt: int,
+        response: dict,
+    ) -> typing.Optional[definitions.BatchWriteStats]:
+        """
+        Records the response of the zero-based attempt, invalidating the
+        cached reads of the items it processed, and returns the stats of the
+        batch once every item was processed or None when items remain to be
+        retried.
+        """
+        sent = self.unprocessed_items.get(self.table_name) or []
+        self.unprocessed_items = response.get("UnprocessedItems") or {}
+        remaining = self.unprocessed_items.get(self.table_name) or []
+        processed = [item for item in sent if item not in remaining]
+        if processed:
+            caching.invalidate(self.table_name, written_rows(processed))
+
+        if self.unprocessed_items:
+            self.retried_item_count += len(remaining)
+            return None
+
+        return definitions.BatchWriteStats(
+            batch=self.index,
+            item_count=len(self.items),
+            attempt_count=attempt + 1,
+            retried_item_count=self.retried_item_count,
+            elapsed=time.monotonic() - self._started,
+        )
+
+
+def to_upsert_request(
+    table_name: str,
+    record: "recorder.Record",
+    return_values: str,
+) -> dict:
+    """Creates the update_item arguments for upserting the record."""
+    if return_values not in UPSERT_RETURN_VALUES:
+        raise ValueError(f"Return values must be one of {UPSERT_RETURN_VALUES}.")
+
+    return {
+        **record.to_update_request().to_request(table_name),
+        "ReturnValues": return_values,
+    }
+
+
+def to_upsert_response(
+    record: "recorder.Record",
+    request: dict,
+    response: dict,
+) -> "recorder.SingleRecordResponse":
+    """
+    Creates the response of an upsert, which loads the record from the
+    returned attributes and the key of the upserted record when accessed.
+    """
+    key = request["Key"]
+    return recorder.SingleRecordResponse(
+        response=response,
+        request=request,
+        row=response.get("Attributes") or None,
+        record=None,
+        loader=lambda row: record.from_row({**key, **row}),
+    )
+
+
+def to_transact_request(
+    table_name: str,
+    puts: typing.Optional[typing.Iterable["recorder.Record"]],
+    updates: typing.Optional[typing.Iterable["recorder.Record"]],
+    deletes: typing.Optional[typing.Iterable["recorder.Record"]],
+) -> dict:
+    """Creates the transact_write_items arguments for the records."""
+    put_items = [
+        {
+            "Put": dict(
+                TableName=table_name,
+                Item=record.to_row(),
+            )
+        }
+        for record in (puts or [])
+    ]
+
+    update_items = [
+        {"Update": record.to_update_request().to_request(table_name)}
+        for record in (updates or [])
+    ]
+
+    delete_items = [
+        {
+            "Delete": dict(
+                TableName=table_name,
+                Key=record.table_key,
+            )
+        }
+        for record in (deletes or [])
+    ]
+
+    return {
+        "TransactItems": [
+            *put_items,
+            *update_items,
+            *delete_items,
+        ]
+    }
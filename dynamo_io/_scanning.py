@@ -0,0 +1,116 @@
+import queue
+import threading
+import typing
+from concurrent import futures
+
+from botocore.client import BaseClient
+
+from dynamo_io import definitions
+from dynamo_io import retries
+
+#: Marker placed on the queue by a worker once its segment is exhausted.
+_SEGMENT_DONE = object()
+
+
+def _put(
+    pages: queue.Queue,
+    item: typing.Tuple[int, typing.Any],
+    stopped: threading.Event,
+) -> bool:
+    """
+    Places the item on the bounded queue, waiting for space while the scan
+    has not been stopped. Returns whether the item was placed.
+    """
+    while not stopped.is_set():
+        try:
+            pages.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _scan_segment(
+    client: BaseClient,
+    request: dict,
+    progress: definitions.SegmentProgress,
+    pages: queue.Queue,
+    stopped: threading.Event,
+    retry_policy: typing.Optional[retries.RetryPolicy] = None,
+):
+    """Scans the segment, placing each page on the queue as it arrives."""
+    segment_request = {**request, "Segment": progress.segment}
+    if progress.last_evaluated_key:
+        segment_request["ExclusiveStartKey"] = progress.last_evaluated_key
+
+    try:
+        for page in retries.paginate(client, "scan", segment_request, retry_policy):
+            if not _put(pages, (progress.segment, page), stopped):
+                return
+    except Exception as error:
+        _put(pages, (progress.segment, error), stopped)
+    finally:
+        _put(pages, (progress.segment, _SEGMENT_DONE), stopped)
+
+
+def iter_segment_pages(
+    client: BaseClient,
+    request: dict,
+    progress: typing.Dict[int, definitions.SegmentProgress],
+    max_workers: int,
+    queue_size: int,
+    retry_policy: typing.Optional[retries.RetryPolicy] = None,
+) -> typing.Iterator[typing.Tuple[int, dict]]:
+    """
+    Scans the incomplete segments concurrently on a thread pool and yields
+    each page along with its segment number as the pages arrive. Pages are
+    streamed through a bounded queue so that workers pause when the
+    consumer falls behind. Any error raised by a worker is re-raised here
+    and stopping iteration early stops the workers.
+
+    :param client:
+        Boto client used to scan the table.
+    :param request:
+        Scan request arguments including the TotalSegments.
+    :param progress:
+        Progress of each segment, from which incomplete segments resume.
+    :param max_workers:
+        Number of segments to scan concurrently.
+    :param queue_size:
+        Maximum number of pages buffered between the workers and consumer.
+    :param retry_policy:
+        Policy for retrying throttled page requests, which resume from the
+        last page of the segment that was received.
+    """
+    pending = [p for p in progress.values() if not p.completed]
+    if not pending:
+        return
+
+    pages: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+    stopped = threading.Event()
+    executor = futures.ThreadPoolExecutor(max_workers=max(max_workers, 1))
+
+    try:
+        for segment_progress in pending:
+            executor.submit(
+                _scan_segment,
+                client,
+                request,
+                segment_progress,
+                pages,
+                stopped,
+                retry_policy,
+            )
+
+        remaining = len(pending)
+        while remaining:
+            segment, item = pages.get()
+            if item is _SEGMENT_DONE:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield segment, item
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
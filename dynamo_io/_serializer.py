@@ -15,6 +15,37 @@ def _as_bytes(raw: typing.Union[str, bytes]) -> bytes:
     return raw
 
 
+def _datetime_to_primitive(value: typing.Any) -> str:
+    """Convert the datetime to an ISO-8601 string in UTC with a Z suffix."""
+    if isinstance(value, datetime.datetime):
+        value = value.replace(microsecond=0, tzinfo=datetime.timezone.utc)
+    return f"{value.isoformat()}Z".replace("+00:00", "")
+
+
+#: Functions converting values of each data type, by name, into their
+#: DynamoDB primitive values. Data types not listed are converted to strings.
+_PRIMITIVE_CONVERTERS: typing.Dict[str, typing.Callable[[typing.Any], typing.Any]] = {
+    definitions.DynamoTypes.TIMESTAMP.name: lambda v: str(int(v.timestamp())),
+    definitions.DynamoTypes.DATETIME.name: _datetime_to_primitive,
+    definitions.DynamoTypes.DATE.name: lambda v: v.isoformat(),
+    definitions.DynamoTypes.BOOLEAN.name: bool,
+    definitions.DynamoTypes.FLOAT.name: lambda v: str(float(v)),
+    definitions.DynamoTypes.FLOAT_SET.name: lambda v: str(float(v)),
+    definitions.DynamoTypes.INTEGER.name: lambda v: str(int(v)),
+    definitions.DynamoTypes.INTEGER_SET.name: lambda v: str(int(v)),
+    definitions.DynamoTypes.BYTES.name: _as_bytes,
+    definitions.DynamoTypes.BINARY_SET.name: _as_bytes,
+}
+
+#: Data types that are serialized as a list of primitive values.
+_HOMOGENEOUS_SET_TYPES = (
+    definitions.DynamoTypes.BINARY_SET,
+    definitions.DynamoTypes.FLOAT_SET,
+    definitions.DynamoTypes.INTEGER_SET,
+    definitions.DynamoTypes.STRING_SET,
+)
+
+
 def _to_primitive(
     value: typing.Any,
     dtype: definitions.DynamoType,
@@ -23,32 +54,7 @@ def _to_primitive(
     Convert the specified value to its dynamoDB primitive value equivalent that is the
     necessary serialization to be valid when written to a DynamoDB table.
     """
-    types = definitions.DynamoTypes
-
-    if dtype.name == types.TIMESTAMP.name:
-        return str(int(value.timestamp()))
-
-    if dtype.name == types.DATETIME.name:
-        if isinstance(value, datetime.datetime):
-            value = value.replace(microsecond=0, tzinfo=datetime.timezone.utc)
-        return f"{value.isoformat()}Z".replace("+00:00", "")
-
-    if dtype.name == types.DATE.name:
-        return value.isoformat()
-
-    if dtype.name == types.BOOLEAN.name:
-        return bool(value)
-
-    if dtype.name in (types.FLOAT.name, types.FLOAT_SET.name):
-        return str(float(value))
-
-    if dtype.name in (types.INTEGER.name, types.INTEGER_SET.name):
-        return str(int(value))
-
-    if dtype.name in (types.BYTES.name, types.BINARY_SET.name):
-        return _as_bytes(value)
-
-    return str(value)
+    return _PRIMITIVE_CONVERTERS.get(dtype.name, str)(value)
 
 
 def serialize(
@@ -72,13 +78,6 @@ def serialize(
     if value is None or value == "":
         return None
 
-    homogeneous_set_types = (
-        definitions.DynamoTypes.BINARY_SET,
-        definitions.DynamoTypes.FLOAT_SET,
-        definitions.DynamoTypes.INTEGER_SET,
-        definitions.DynamoTypes.STRING_SET,
-    )
-
     key = column.data_type.value
 
     if isinstance(column, definitions.MapColumn):
@@ -90,7 +89,59 @@ def serialize(
             if value[child.name] not in (None, "")
         }
         return {key: value}
-    elif column.data_type in homogeneous_set_types:
+    elif column.data_type in _HOMOGENEOUS_SET_TYPES:
         return {key: [_to_primitive(v, column.data_type) for v in value]}
 
     return {key: _to_primitive(value, column.data_type)}
+
+
+def compile_serializer(
+    column: definitions.AnyColumnType,
+) -> typing.Callable[[typing.Any], typing.Optional[typing.Dict[str, typing.Any]]]:
+    """
+    Returns a function that serializes values for the column exactly as the
+    `serialize` function does, but with the column data type conversions
+    resolved once up front. This is used to build the serialization plans
+    of Record classes that are reused for every record written.
+
+    :param column:
+        The Column definition specifying the data type value for serialization.
+    """
+    key = column.data_type.value
+
+    if isinstance(column, definitions.MapColumn):
+        children = tuple(
+            (child.name, compile_serializer(typing.cast(typing.Any, child)))
+            for child in column.children
+        )
+
+        def serialize_map(value: typing.Any) -> typing.Optional[dict]:
+            if value is None or value == "":
+                return None
+            return {
+                key: {
+                    name: encode(value[name])
+                    for name, encode in children
+                    if value[name] not in (None, "")
+                }
+            }
+
+        return serialize_map
+
+    convert = _PRIMITIVE_CONVERTERS.get(column.data_type.name, str)
+
+    if column.data_type in _HOMOGENEOUS_SET_TYPES:
+
+        def serialize_set(value: typing.Any) -> typing.Optional[dict]:
+            if value is None or value == "":
+                return None
+            return {key: [convert(v) for v in value]}
+
+        return serialize_set
+
+    def serialize_value(value: typing.Any) -> typing.Optional[dict]:
+        if value is None or value == "":
+            return None
+        return {key: convert(value)}
+
+    return serialize_value
@@ -0,0 +1,404 @@
+import asyncio
+import typing
+
+from dynamo_io import _batching
+from dynamo_io import _requests
+from dynamo_io import caching
+from dynamo_io import definitions
+from dynamo_io import dispatching
+from dynamo_io import reader
+from dynamo_io import recorder
+from dynamo_io import retries
+from dynamo_io import writer
+
+
+async def _iter_pages(
+    client: typing.Any,
+    operation: str,
+    request: dict,
+    max_items: int = 0,
+    retry_policy: typing.Optional[retries.RetryPolicy] = None,
+) -> typing.AsyncIterator[dict]:
+    """
+    Yields the response pages for the paginated operation request, stopping
+    once the positive max items have been returned with the final page
+    request sized to the remainder.
+    """
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    remaining = max_items if max_items > 0 else None
+    page_request = dict(request)
+    while remaining is None or remaining > 0:
+        if remaining is not None:
+            page_request["Limit"] = min(request.get("Limit") or remaining, remaining)
+        page = await policy.call_async(getattr(client, operation), **page_request)
+        yield page
+
+        if remaining is not None:
+            remaining -= len(page.get("Items") or [])
+        last_evaluated_key = page.get("LastEvaluatedKey")
+        if not last_evaluated_key:
+            return
+        page_request["ExclusiveStartKey"] = last_evaluated_key
+
+
+async def get_row(
+    client: typing.Any,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_value: typing.Optional[str],
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.SingleRowResponse:
+    """Async counterpart of `reader.get_row`."""
+    request = _requests.to_get_item_request(
+        table_name, partition_key_value, sort_key_value, projection
+    )
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    response = await policy.call_async(client.get_item, **request)
+    return definitions.SingleRowResponse(
+        request=request,
+        response=response,
+        row=response.get("Item"),
+    )
+
+
+async def get_record(
+    client: typing.Any,
+    table_name: str,
+    source: "recorder.Record",
+    projection: reader.RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> recorder.SingleRecordResponse:
+    """Async counterpart of `reader.get_record`."""
+    attribute_keys = _requests.record_projection(projection, [type(source)])
+    response = await get_row(
+        client,
+        table_name,
+        source.partition_key_value,
+        source.sort_key_value,
+        projection=attribute_keys,
+        retry_policy=retry_policy,
+    )
+    row = response.row
+    return recorder.SingleRecordResponse(
+        request=response.request,
+        response=response.response,
+        row=row,
+        record=source.from_row(row, attribute_keys) if row else None,
+    )
+
+
+def _to_partition_request(
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: typing.Optional[str],
+    before_sort_key: typing.Optional[str],
+    after_sort_key: typing.Optional[str],
+    index: definitions.Index,
+    limit: int,
+    exclusive_start_key: typing.Optional[dict],
+    cursor: typing.Optional[str],
+    projection: typing.Optional[typing.Sequence[str]],
+) -> dict:
+    """Creates the query request for reading rows from a partition."""
+    request = _requests.assemble_get_rows_for_partition_request(
+        table_name=table_name,
+        partition_key_value=partition_key_value,
+        sort_key_starts=sort_key_starts,
+        before_sort_key=before_sort_key,
+        after_sort_key=after_sort_key,
+        index=index,
+        limit=limit,
+    )
+    _requests.apply_start_key(request, exclusive_start_key, cursor)
+    return _requests.apply_projection(request, projection)
+
+
+async def get_rows_for_partition(
+    client: typing.Any,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: str | None = None,
+    before_sort_key: str | None = None,
+    after_sort_key: str | None = None,
+    index: definitions.Index = definitions.Indexes.STANDARD,
+    limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.PagedRowResponse:
+    """Async counterpart of `reader.get_rows_for_partition`."""
+    request = _to_partition_request(
+        table_name,
+        partition_key_value,
+        sort_key_starts,
+        before_sort_key,
+        after_sort_key,
+        index,
+        limit,
+        exclusive_start_key,
+        cursor,
+        projection,
+    )
+    rows: typing.List[dict] = []
+    pages: typing.List[dict] = []
+
+    async for page in _iter_pages(client, "query", request, max_items, retry_policy):
+        pages.append(page)
+        rows += page.get("Items") or []
+
+    return definitions.PagedRowResponse(
+        request=request,
+        pages=tuple(pages),
+        rows=tuple(rows),
+    )
+
+
+async def iter_rows_for_partition(
+    client: typing.Any,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: str | None = None,
+    before_sort_key: str | None = None,
+    after_sort_key: str | None = None,
+    index: definitions.Index = definitions.Indexes.STANDARD,
+    limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> typing.AsyncIterator[dict]:
+    """
+    Async counterpart of `reader.iter_rows_for_partition`, which yields the
+    rows of the partition as the pages are requested lazily.
+    """
+    request = _to_partition_request(
+        table_name,
+        partition_key_value,
+        sort_key_starts,
+        before_sort_key,
+        after_sort_key,
+        index,
+        limit,
+        exclusive_start_key,
+        cursor,
+        projection,
+    )
+    async for page in _iter_pages(client, "query", request, max_items, retry_policy):
+        for row in page.get("Items") or []:
+            yield row
+
+
+async def get_records_for_partition(
+    client: typing.Any,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: str | None = None,
+    before_sort_key: str | None = None,
+    after_sort_key: str | None = None,
+    index: definitions.Index = definitions.Indexes.STANDARD,
+    record_classes: typing.List[typing.Type["recorder.Record"]] | None = None,
+    limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: reader.RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> recorder.PagedRecordResponse:
+    """Async counterpart of `reader.get_records_for_partition`."""
+    attribute_keys = _requests.record_projection(projection, record_classes or [])
+    result = await get_rows_for_partition(
+        client=client,
+        table_name=table_name,
+        partition_key_value=partition_key_value,
+        sort_key_starts=sort_key_starts,
+        before_sort_key=before_sort_key,
+        after_sort_key=after_sort_key,
+        index=index,
+        limit=limit,
+        max_items=max_items,
+        exclusive_start_key=exclusive_start_key,
+        cursor=cursor,
+        projection=attribute_keys,
+        retry_policy=retry_policy,
+    )
+    dispatcher = dispatching.get_dispatcher(tuple(record_classes or []))
+    records = [
+        r
+        for r in (dispatcher.to_record(row, attribute_keys) for row in result.rows)
+        if r
+    ]
+    return recorder.PagedRecordResponse(
+        request=result.request,
+        pages=result.pages,
+        rows=result.rows,
+        records=tuple(records),
+    )
+
+
+async def iter_records_for_partition(
+    client: typing.Any,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: str | None = None,
+    before_sort_key: str | None = None,
+    after_sort_key: str | None = None,
+    index: definitions.Index = definitions.Indexes.STANDARD,
+    record_classes: typing.List[typing.Type["recorder.Record"]] | None = None,
+    limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: reader.RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> typing.AsyncIterator["recorder.Record"]:
+    """
+    Async counterpart of `reader.iter_records_for_partition`, which yields
+    the records matching the rows of the partition as the pages are
+    requested lazily.
+    """
+    dispatcher = dispatching.get_dispatcher(tuple(record_classes or []))
+    attribute_keys = _requests.record_projection(projection, record_classes or [])
+    rows = iter_rows_for_partition(
+        client=client,
+        table_name=table_name,
+        partition_key_value=partition_key_value,
+        sort_key_starts=sort_key_starts,
+        before_sort_key=before_sort_key,
+        after_sort_key=after_sort_key,
+        index=index,
+        limit=limit,
+        max_items=max_items,
+        exclusive_start_key=exclusive_start_key,
+        cursor=cursor,
+        projection=attribute_keys,
+        retry_policy=retry_policy,
+    )
+    async for row in rows:
+        record = dispatcher.to_record(row, attribute_keys)
+        if record:
+            yield record
+
+
+async def upsert(
+    client: typing.Any,
+    table_name: str,
+    record: "recorder.Record",
+    retry_policy: "retries.RetryPolicy | None" = None,
+    return_values: str = "ALL_NEW",
+) -> "recorder.SingleRecordResponse":
+    """Async counterpart of `writer.upsert`."""
+    request = _requests.to_upsert_request(table_name, record, return_values)
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    response = await policy.call_async(client.update_item, **request)
+    caching.invalidate_records(table_name, [record])
+    return _requests.to_upsert_response(record, request, response)
+
+
+async def _write_batch(
+    client: typing.Any,
+    table_name: str,
+    index: int,
+    items: typing.List[dict],
+    policy: retries.RetryPolicy,
+) -> _requests.BatchWriteResult:
+    """Async counterpart of `writer._write_batch`."""
+    progress = _requests.BatchWriteProgress(table_name, index, items)
+    error: typing.Optional[Exception] = None
+
+    for attempt, delay in enumerate(policy.delays()):
+        if delay:
+            await asyncio.sleep(delay)
+        try:
+            response = await client.batch_write_item(
+                RequestItems=progress.unprocessed_items
+            )
+        except Exception as caught:
+            if not policy.is_retryable(caught):
+                raise
+            error = caught
+            continue
+        stats = progress.update(attempt, response)
+        if stats is not None:
+            return stats, progress.request, response
+
+    raise error or RuntimeError("Failed to write all items in the batch.")
+
+
+async def insert_records(
+    client: typing.Any,
+    table_name: str,
+    records: typing.Iterable["recorder.Record"],
+    max_workers: int = 1,
+    batch_size: int = writer.MAX_BATCH_WRITE_ITEMS,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.BatchWriteResponse:
+    """
+    Async counterpart of `writer.insert_records`, where `max_workers` is the
+    number of batches written concurrently on the event loop.
+    """
+    if not 0 < batch_size <= writer.MAX_BATCH_WRITE_ITEMS:
+        raise ValueError(
+            f"Batch size must be between 1 and {writer.MAX_BATCH_WRITE_ITEMS} items."
+        )
+
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    items = ({"PutRequest": {"Item": r.to_row()}} for r in records)
+    batches = enumerate(_batching.iter_batches(items, batch_size))
+    results: typing.Dict[int, _requests.BatchWriteResult] = {}
+
+    async def work():
+        # Batches are taken from the shared iterator as each worker becomes
+        # free, which is safe because the workers run on one event loop.
+        for index, batch in batches:
+            results[index] = await _write_batch(
+                client, table_name, index, batch, policy
+            )
+
+    workers = [asyncio.ensure_future(work()) for _ in range(max(max_workers, 1))]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        # Stop the other workers from writing further batches once a batch
+        # fails, retrieving their errors so none are left unobserved.
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    return _requests.to_batch_write_response(
+        [results[index] for index in sorted(results)]
+    )
+
+
+async def remove(
+    client: typing.Any,
+    table_name: str,
+    record: "recorder.Record",
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> "definitions.Response":
+    """Async counterpart of `writer.remove`."""
+    request = {"TableName": table_name, "Key": record.table_key}
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    response = await policy.call_async(client.delete_item, **request)
+    caching.invalidate(table_name, [record.table_key])
+    return definitions.Response(response=response, request=request)
+
+
+async def transacts(
+    client: typing.Any,
+    table_name: str,
+    puts: typing.Iterable["recorder.Record"] | None = None,
+    updates: typing.Iterable["recorder.Record"] | None = None,
+    deletes: typing.Iterable["recorder.Record"] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> "definitions.Response":
+    """Async counterpart of `writer.transacts`."""
+    records = [list(r or []) for r in (puts, updates, deletes)]
+    request = _requests.to_transact_request(table_name, *records)
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    response = await policy.call_async(client.transact_write_items, **request)
+    caching.invalidate_records(table_name, (r for group in records for r in group))
+    return definitions.Response(response=response, request=request)
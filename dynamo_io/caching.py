@@ -0,0 +1,551 @@
+import collections
+import itertools
+import json
+import threading
+import time
+import typing
+import weakref
+from concurrent import futures
+
+from dynamo_io import definitions
+from dynamo_io import recorder
+
+T = typing.TypeVar("T")
+
+#: Identity of a lookup as the table name, the index id and the partition
+#: and sort key values that are looked up in the index.
+_Lookup = typing.Tuple[str, str, typing.Optional[str], typing.Optional[str]]
+
+#: Identity of a cached read as the lookup, the record class that is read
+#: and the projection of the read.
+_CacheKey = typing.Tuple[_Lookup, type, typing.Hashable]
+
+#: Attributes that are the partition key of an index, whose values identify
+#: the partitions that are modified by writing a row.
+_PARTITION_KEYS = tuple(
+    dict.fromkeys(i.partition_key for i in definitions.INDEXES_LIST)
+)
+
+#: Record and partition caches that are invalidated by writes made within
+#: this process.
+_caches: "weakref.WeakSet[typing.Any]" = weakref.WeakSet()
+_caches_lock = threading.Lock()
+
+#: Tokens identifying the clients that read through the caches, held weakly
+#: such that a token is never reused by another client, unlike `id()`.
+_client_tokens: "weakref.WeakKeyDictionary[typing.Any, int]" = (
+    weakref.WeakKeyDictionary()
+)
+_client_counter = itertools.count()
+_client_lock = threading.Lock()
+
+
+def _client_token(client: typing.Any) -> int:
+    """Returns the token of the client, assigning one on its first use."""
+    with _client_lock:
+        token = _client_tokens.get(client)
+        if token is None:
+            token = _client_tokens[client] = next(_client_counter)
+        return token
+
+
+class _PartitionEntry(typing.NamedTuple):
+    """Cached response along with its expiry and the partition versions read."""
+
+    expires_at: float
+    response: definitions.PagedRowResponse
+    versions: typing.Tuple[typing.Tuple[int, int], ...]
+
+
+class _CacheEntry(typing.NamedTuple):
+    """Cached response along with its expiry and the lookups linked to it."""
+
+    expires_at: float
+    response: "recorder.SingleRecordResponse"
+    links: typing.Tuple[_Lookup, ...]
+
+
+def _attribute_value(row: dict, key: typing.Optional[str]) -> typing.Optional[str]:
+    """Returns the serialized key attribute of the row as a string."""
+    value = row.get(key) if key else None
+    return str(next(iter(value.values()))) if value else None
+
+
+def _row_lookups(table_name: str, row: dict) -> typing.List[_Lookup]:
+    """Returns the lookups in every index of the table that find the row."""
+    return [
+        (
+            table_name,
+            index.id,
+            _attribute_value(row, index.partition_key),
+            _attribute_value(row, index.sort_key),
+        )
+        for index in definitions.INDEXES_LIST
+        if all(k in row for k in (index.partition_key, index.sort_key) if k)
+    ]
+
+
+def _source_lookup(
+    table_name: str,
+    index: definitions.Index,
+    source: "recorder.Record",
+) -> _Lookup:
+    """Returns the lookup of the source record key values in the index."""
+    partition_value, sort_value = (
+        source.get_value_for(source.schema.get_column(key))
+        for key in (index.partition_key, index.sort_key)
+    )
+    return (
+        table_name,
+        index.id,
+        None if partition_value is None else str(partition_value),
+        None if sort_value is None else str(sort_value),
+    )
+
+
+def _projection_key(projection: typing.Any) -> typing.Hashable:
+    """Returns a hashable identity for the projection of a read."""
+    if projection is None or isinstance(projection, type):
+        return projection
+    return tuple(projection)
+
+
+class RecordCache:
+    """
+    Read-through cache of single record reads, which is passed as the cache
+    of `get_record` and `get_indexed_record`. Reads are cached by table,
+    index, key values, record class and projection for a time-to-live that
+    can be configured per record class, and the least recently used reads
+    are evicted once the cache is full. Reads that find no record are also
+    cached, for the negative TTL when one is specified.
+
+    Writes made within this process by `upsert`, `remove`, `insert_records`,
+    `transacts` and the other write functions invalidate the cached reads
+    of the written keys in every cache. Writes made by other processes are
+    only seen once the cached reads expire. Reads that were in flight when
+    a write invalidated their keys are not cached. The keys are tracked by
+    striped version counters, so a write to another key sharing a stripe
+    may occasionally skip caching such a read. Cached responses are shared
+    between callers and should not be modified.
+
+    .. code-block:: python
+
+        cache = dio.RecordCache(max_size=10_000, ttls={Currency: 3600})
+        response = dio.get_record(client, "reference", key, cache=cache)
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        ttls: typing.Optional[
+            typing.Mapping[typing.Type["recorder.Record"], float]
+        ] = None,
+        negative_ttl: typing.Optional[float] = None,
+        stripes: int = 1024,
+    ):
+        self.max_size = max(max_size, 1)
+        #: Seconds that reads are cached for record classes without a TTL.
+        self.ttl = ttl
+        #: Seconds that reads are cached for each record class, including
+        #: subclasses that do not have a TTL of their own.
+        self.ttls = dict(ttls or {})
+        #: Seconds that reads finding no record are cached, or None to use
+        #: the TTL of the record class. Zero disables negative caching.
+        self.negative_ttl = negative_ttl
+        self.hit_count = 0
+        self.miss_count = 0
+        self._entries: "collections.OrderedDict[_CacheKey, _CacheEntry]" = (
+            collections.OrderedDict()
+        )
+        self._links: typing.Dict[_Lookup, typing.Set[_CacheKey]] = {}
+        self._versions = [0] * max(stripes, 1)
+        self._lock = threading.Lock()
+        with _caches_lock:
+            _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_ttl(self, record_class: typing.Type["recorder.Record"]) -> float:
+        """
+        Returns the seconds that reads of the record class are cached, using
+        the TTL of the closest base class when the class has none.
+        """
+        ttl = next((self.ttls[c] for c in record_class.__mro__ if c in self.ttls), None)
+        return self.ttl if ttl is None else ttl
+
+    def _stripe(self, lookup: _Lookup) -> int:
+        """Returns the version counter stripe of the lookup."""
+        return hash(lookup) % len(self._versions)
+
+    def _discard(self, key: _CacheKey):
+        """Removes the cached read and its links to lookups."""
+        entry = self._entries.pop(key, None)
+        for lookup in entry.links if entry else ():
+            keys = self._links.get(lookup)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._links[lookup]
+
+    def _get(self, key: _CacheKey) -> typing.Optional[_CacheEntry]:
+        """Returns the cached read if it has not expired, marking it as used."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(
+        self,
+        key: _CacheKey,
+        response: "recorder.SingleRecordResponse",
+        versions: typing.List[int],
+    ):
+        """
+        Caches the response unless a write invalidated any of its lookups
+        while it was being read, evicting the least recently used reads
+        when full.
+        """
+        ttl = self.get_ttl(key[1])
+        if response.row is None and self.negative_ttl is not None:
+            ttl = self.negative_ttl
+        table_name = key[0][0]
+        links = (key[0], *_row_lookups(table_name, response.row or {}))
+        if ttl <= 0 or any(
+            self._versions[s] != versions[s] for s in map(self._stripe, links)
+        ):
+            return
+
+        self._discard(key)
+        self._entries[key] = _CacheEntry(time.monotonic() + ttl, response, links)
+        for lookup in links:
+            self._links.setdefault(lookup, set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._discard(next(iter(self._entries)))
+
+    def read(
+        self,
+        table_name: str,
+        index: definitions.Index,
+        source: "recorder.Record",
+        projection: typing.Any,
+        load: typing.Callable[[], "recorder.SingleRecordResponse"],
+    ) -> "recorder.SingleRecordResponse":
+        """
+        Returns the cached read of the source record key values in the index,
+        or loads and caches it when it is not cached or has expired.
+
+        :param table_name:
+            Name of the table that is read.
+        :param index:
+            Index in which the source record key values are looked up.
+        :param source:
+            Record containing the key values that are read.
+        :param projection:
+            Projection of the read, which is part of the cache key.
+        :param load:
+            Function reading the record from DynamoDB.
+        """
+        lookup = _source_lookup(table_name, index, source)
+        key: _CacheKey = (lookup, type(source), _projection_key(projection))
+        with self._lock:
+            entry = self._get(key)
+            if entry is not None:
+                self.hit_count += 1
+                return entry.response
+            self.miss_count += 1
+            versions = list(self._versions)
+
+        response = load()
+        with self._lock:
+            self._store(key, response, versions)
+        return response
+
+    def invalidate(self, table_name: str, rows: typing.Iterable[dict]):
+        """
+        Removes the cached reads that found the rows, or that would find
+        them in any index of the table, including cached misses.
+
+        :param table_name:
+            Name of the table the rows were written to.
+        :param rows:
+            Written rows or the keys of deleted rows.
+        """
+        with self._lock:
+            for row in rows:
+                for lookup in _row_lookups(table_name, row):
+                    self._versions[self._stripe(lookup)] += 1
+                    for key in list(self._links.get(lookup, ())):
+                        self._discard(key)
+
+    def clear(self):
+        """Removes all cached reads."""
+        with self._lock:
+            self._versions = [v + 1 for v in self._versions]
+            self._entries.clear()
+            self._links.clear()
+
+
+class PartitionCache:
+    """
+    Cache of partition query results, which is passed as the cache of
+    `get_rows_for_partition` and `get_records_for_partition`. Results are
+    cached by the client and their full query request, including the index,
+    key condition, sort key bounds, start key and projection, for up to the
+    TTL, so clients of other accounts or regions never share results, and the
+    least recently used results are evicted once the cache is full.
+
+    Writes made within this process bump a version counter for every
+    partition of the rows they write, in every index, and cached results
+    are only returned while the versions of the queried partition and of
+    the partitions of the rows they contain are unchanged. The counters
+    are striped, so writes to another partition sharing a stripe may
+    invalidate results unnecessarily but never leave them stale. Writes
+    made by other processes are only seen once the cached results expire.
+    Cached responses are shared between callers and should not be modified.
+
+    .. code-block:: python
+
+        cache = dio.PartitionCache(max_size=100, ttl=30.0)
+        rows = dio.get_rows_for_partition(client, "metrics", "day:1", cache=cache)
+    """
+
+    def __init__(self, max_size: int = 256, ttl: float = 60.0, stripes: int = 1024):
+        self.max_size = max(max_size, 1)
+        #: Seconds that query results are cached.
+        self.ttl = ttl
+        self.hit_count = 0
+        self.miss_count = 0
+        self._entries: "collections.OrderedDict[str, _PartitionEntry]" = (
+            collections.OrderedDict()
+        )
+        self._versions = [0] * max(stripes, 1)
+        self._lock = threading.Lock()
+        with _caches_lock:
+            _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _stripe(self, table_name: str, key: str, value: typing.Any) -> int:
+        """Returns the version counter stripe of the partition."""
+        return hash((table_name, key, str(value))) % len(self._versions)
+
+    def _get(self, key: str) -> typing.Optional[_PartitionEntry]:
+        """
+        Returns the cached result if it has not expired and none of the
+        partitions it depends upon were written, marking it as used.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic() or any(
+            self._versions[s] != v for s, v in entry.versions
+        ):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def read(
+        self,
+        client: typing.Any,
+        request: dict,
+        max_items: int,
+        load: typing.Callable[[], definitions.PagedRowResponse],
+    ) -> definitions.PagedRowResponse:
+        """
+        Returns the cached result of the partition query request, or loads
+        and caches it when it is not cached, has expired or was invalidated.
+
+        :param client:
+            Client making the query, whose identity is part of the cache key.
+        :param request:
+            Query request for the partition, with the partition key as the
+            first key condition.
+        :param max_items:
+            Maximum number of items read, which is part of the cache key.
+        :param load:
+            Function querying the partition in DynamoDB.
+        """
+        key = json.dumps(
+            [_client_token(client), request, max_items], sort_keys=True, default=str
+        )
+        table_name = request["TableName"]
+        with self._lock:
+            entry = self._get(key)
+            if entry is not None:
+                self.hit_count += 1
+                return entry.response
+            self.miss_count += 1
+            versions = list(self._versions)
+
+        response = load()
+        if self.ttl <= 0:
+            return response
+
+        stripes = {
+            self._stripe(
+                table_name,
+                request["ExpressionAttributeNames"]["#k0"],
+                request["ExpressionAttributeValues"][":v0"]["S"],
+            ),
+            *(
+                self._stripe(table_name, "pk", _attribute_value(row, "pk"))
+                for row in response.rows or ()
+                if "pk" in row
+            ),
+        }
+        with self._lock:
+            self._entries[key] = _PartitionEntry(
+                expires_at=time.monotonic() + self.ttl,
+                response=response,
+                versions=tuple((s, versions[s]) for s in stripes),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return response
+
+    def invalidate(self, table_name: str, rows: typing.Iterable[dict]):
+        """
+        Bumps the versions of the partitions of the rows in every index of
+        the table, which invalidates the cached results that depend on them.
+
+        :param table_name:
+            Name of the table the rows were written to.
+        :param rows:
+            Written rows or the keys of deleted rows.
+        """
+        with self._lock:
+            for row in rows:
+                for key in _PARTITION_KEYS:
+                    if key in row:
+                        stripe = self._stripe(
+                            table_name, key, _attribute_value(row, key)
+                        )
+                        self._versions[stripe] += 1
+
+    def clear(self):
+        """
+        Removes all cached results and bumps every partition version, such
+        that results read while the cache was cleared are not cached.
+        """
+        with self._lock:
+            self._versions = [v + 1 for v in self._versions]
+            self._entries.clear()
+
+
+def invalidate(table_name: str, rows: typing.Iterable[dict]):
+    """
+    Invalidates the cached reads of the rows in every record and partition
+    cache of this process. The rows are only iterated when caches exist.
+
+    :param table_name:
+        Name of the table the rows were written to.
+    :param rows:
+        Written rows or the keys of deleted rows.
+    """
+    with _caches_lock:
+        caches = list(_caches)
+    if not caches:
+        return
+
+    written = list(rows)
+    for cache in caches:
+        cache.invalidate(table_name, written)
+
+
+def invalidate_records(
+    table_name: str,
+    records: typing.Iterable["recorder.Record"],
+):
+    """
+    Invalidates the cached reads of the written records in every record and
+    partition cache of this process. The records are only converted to rows
+    when caches exist.
+
+    :param table_name:
+        Name of the table the records were written to.
+    :param records:
+        Written records.
+    """
+    invalidate(table_name, (record.to_row() for record in records))
+
+
+def single_flight_key(
+    client: typing.Any, operation: str, request: dict, *args: typing.Any
+) -> str:
+    """
+    Returns the identity of a request, which is equal for requests of the
+    same client and operation with equal arguments regardless of their key
+    order, so requests of clients of other accounts or regions are never
+    coalesced. Clients are identified by a token that is never reused, even
+    once a client is garbage collected.
+    """
+    return json.dumps(
+        [_client_token(client), operation, request, *args],
+        sort_keys=True,
+        default=str,
+    )
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical reads, which is passed as the single
+    flight of `get_row`, `get_rows_for_partition` and the functions built
+    upon them. While a request is in flight, other threads making the same
+    request wait for it and share its response or error instead of making
+    their own request, which avoids consuming capacity for duplicate reads
+    when many threads miss a cache for the same key at once. Requests made
+    after the in-flight request completes are made again, so responses are
+    never reused beyond the requests they overlap.
+
+    .. code-block:: python
+
+        flight = dio.SingleFlight()
+        response = dio.get_record(client, "catalog", key, single_flight=flight)
+    """
+
+    def __init__(self) -> None:
+        #: Number of requests that shared the response of another request.
+        self.shared_count = 0
+        self._calls: typing.Dict[typing.Hashable, futures.Future] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: typing.Hashable, function: typing.Callable[[], T]) -> T:
+        """
+        Returns the result of the in-flight call with the same key, or calls
+        the function when there is none, sharing its result or error with
+        the calls of the same key made while it is in flight.
+
+        :param key:
+            Identity of the request made by the function.
+        :param function:
+            Function making the request.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leading = future is None
+            if future is None:
+                future = self._calls[key] = futures.Future()
+            else:
+                self.shared_count += 1
+
+        if not leading:
+            return future.result()
+
+        try:
+            result = function()
+            future.set_result(result)
+            return result
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -2,6 +2,9 @@ import dataclasses
 import datetime
 import typing
 
+from dynamo_io import _cursors
+from dynamo_io import sizing
+
 
 # This does not currently pass mypy due to the limitation outlined in:
 # https://github.com/python/mypy/issues/5374
@@ -63,6 +66,37 @@ class PagedRowResponse:
     def first_row(self) -> typing.Optional[dict]:
         return next(iter(self.rows or []), None)
 
+    @property
+    def last_evaluated_key(self) -> typing.Optional[dict]:
+        """Key at which the read stopped or None if it read all rows."""
+        last_page = self.pages[-1] if self.pages else {}
+        return last_page.get("LastEvaluatedKey")
+
+    @property
+    def cursor(self) -> typing.Optional[str]:
+        """
+        Opaque continuation token that resumes the read where this response
+        stopped, or None if there are no more rows to read.
+        """
+        return _cursors.encode(self.request, self.last_evaluated_key)
+
+    @property
+    def estimated_size_bytes(self) -> int:
+        """Estimated total size in bytes of the rows returned by the read."""
+        return sum(sizing.item_size(row) for row in self.rows or [])
+
+    @property
+    def estimated_read_capacity_units(self) -> float:
+        """
+        Read capacity units estimated from the size of the returned rows,
+        which understates reads that project a subset of the attributes
+        since DynamoDB charges for the size of the whole items.
+        """
+        return sizing.read_capacity_units(
+            self.estimated_size_bytes,
+            consistent_read=bool(self.request.get("ConsistentRead")),
+        )
+
     def iter_rows(self) -> typing.Iterator[dict]:
         return iter(self.rows or [])
 
@@ -86,6 +120,9 @@ class ScannedRowResponse(PagedRowResponse):
     """Response containing rows from a DynamoDB table scan operation."""
 
     completed: bool
+    #: Checkpoint from which a segmented parallel scan can be resumed when
+    #: it did not complete.
+    checkpoint: typing.Optional[str] = dataclasses.field(default=None, kw_only=True)
 
     def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
         cleaned_pages = []
@@ -96,6 +133,7 @@ class ScannedRowResponse(PagedRowResponse):
 
         return {
             "completed": self.completed,
+            "checkpoint": self.checkpoint,
             "request": self.request,
             "pages": cleaned_pages,
             "page_count": len(cleaned_pages),
@@ -103,15 +141,324 @@ class ScannedRowResponse(PagedRowResponse):
         }
 
 
+@dataclasses.dataclass(frozen=True)
+class BatchRowResponse:
+    """Response containing rows from one or more DynamoDB batch get operations."""
+
+    #: Source payload arguments that specified the interaction.
+    request: dict
+    #: Raw boto3 responses for each batch get call.
+    responses: typing.Tuple[dict, ...]
+    #: Rows aligned to the order of the requested keys with None for
+    #: keys that did not exist in the table.
+    rows: typing.Tuple[typing.Optional[dict], ...]
+
+    def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "request": self.request,
+            "response_count": len(self.responses or []),
+            "row_count": len(self.rows or []),
+            "missing_count": len([r for r in self.rows or [] if r is None]),
+        }
+
+
+class StreamedRowResponse:
+    """
+    Response that yields rows page by page as they are returned from a
+    paginated DynamoDB query without retaining them in memory. The summary
+    metadata attributes are updated as pages are consumed and are complete
+    once iteration has finished. When iterating rows, a page is only
+    consumed once all of its rows have been yielded, such that the cursor
+    can be used to resume the read without skipping rows. The response can
+    only be iterated once.
+    """
+
+    def __init__(self, request: dict, pages: typing.Iterable[dict]):
+        #: Source payload arguments that specified the interaction.
+        self.request = request
+        #: Number of pages consumed so far.
+        self.page_count = 0
+        #: Number of rows yielded so far.
+        self.row_count = 0
+        #: Key of the last evaluated item in the most recently consumed page,
+        #: which will be None once all pages have been consumed.
+        self.last_evaluated_key: typing.Optional[dict] = None
+        #: Total capacity units reported by the consumed pages.
+        self.consumed_capacity_units = 0.0
+        #: Whether all pages have been consumed.
+        self.completed = False
+        self._pages = iter(pages)
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return self.iter_rows()
+
+    @property
+    def cursor(self) -> typing.Optional[str]:
+        """
+        Opaque continuation token that resumes the read after the most
+        recently consumed page, or None if there are no more rows to read.
+        """
+        return _cursors.encode(self.request, self.last_evaluated_key)
+
+    def _advance(self, page: dict):
+        """Records the summary metadata of the consumed page."""
+        self.page_count += 1
+        self.last_evaluated_key = page.get("LastEvaluatedKey")
+        capacity = page.get("ConsumedCapacity") or {}
+        self.consumed_capacity_units += capacity.get("CapacityUnits") or 0.0
+
+    def iter_pages(self) -> typing.Iterator[dict]:
+        """Yields the raw pages, each of which is consumed once yielded."""
+        for page in self._pages:
+            self._advance(page)
+            yield page
+        self.completed = True
+
+    def iter_rows(self) -> typing.Iterator[dict]:
+        """
+        Yields the rows of each page, consuming the page once all of its
+        rows have been yielded.
+        """
+        for page in self._pages:
+            for row in page.get("Items") or []:
+                self.row_count += 1
+                yield row
+            self._advance(page)
+        self.completed = True
+
+    def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
+        """Returns a dictionary version of the object for debug logging."""
+        return {
+            "request": self.request,
+            "completed": self.completed,
+            "page_count": self.page_count,
+            "row_count": self.row_count,
+            "last_evaluated_key": self.last_evaluated_key,
+            "consumed_capacity_units": self.consumed_capacity_units,
+        }
+
+
+@dataclasses.dataclass(frozen=True)
+class SegmentProgress:
+    """Progress of a single segment within a segmented parallel scan."""
+
+    #: Zero-based segment number.
+    segment: int
+    #: Number of pages consumed from the segment.
+    page_count: int = 0
+    #: Number of rows consumed from the segment.
+    row_count: int = 0
+    #: Key after which the segment scan resumes.
+    last_evaluated_key: typing.Optional[dict] = None
+    #: Whether every page of the segment has been consumed.
+    completed: bool = False
+
+
+class SegmentedScanResponse:
+    """
+    Response that yields rows from a segmented parallel scan as the
+    segment pages arrive. Progress is tracked per segment and is only
+    advanced once all rows of a page have been consumed, such that the
+    checkpoint can be used to resume the scan without skipping rows. The
+    response can only be iterated once.
+    """
+
+    def __init__(
+        self,
+        request: dict,
+        pages: typing.Iterable[typing.Tuple[int, dict]],
+        progress: typing.Dict[int, SegmentProgress],
+    ):
+        #: Source payload arguments that specified the interaction.
+        self.request = request
+        #: Progress of each segment keyed by segment number.
+        self.progress = progress
+        self._pages = iter(pages)
+
+    def __iter__(self) -> typing.Iterator[dict]:
+        return self.iter_rows()
+
+    @property
+    def completed(self) -> bool:
+        """Whether every segment has been scanned."""
+        return all(p.completed for p in self.progress.values())
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages consumed across all segments."""
+        return sum(p.page_count for p in self.progress.values())
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows consumed across all segments."""
+        return sum(p.row_count for p in self.progress.values())
+
+    @property
+    def checkpoint(self) -> typing.Optional[str]:
+        """
+        Opaque token from which the scan can be resumed, or None if the
+        scan has completed.
+        """
+        if self.completed:
+            return None
+
+        states = [
+            {"key": p.last_evaluated_key, "completed": p.completed}
+            for _, p in sorted(self.progress.items())
+        ]
+        return _cursors.encode(self.request, states)
+
+    def _advance(self, segment: int, page: dict):
+        """Advances the progress of the segment past the consumed page."""
+        last_evaluated_key = page.get("LastEvaluatedKey")
+        current = self.progress[segment]
+        self.progress[segment] = dataclasses.replace(
+            current,
+            page_count=current.page_count + 1,
+            row_count=current.row_count + len(page.get("Items") or []),
+            last_evaluated_key=last_evaluated_key,
+            completed=not last_evaluated_key,
+        )
+
+    def iter_pages(self) -> typing.Iterator[dict]:
+        """Yields the raw pages, each of which is consumed once yielded."""
+        for segment, page in self._pages:
+            self._advance(segment, page)
+            yield page
+
+    def iter_rows(self) -> typing.Iterator[dict]:
+        """Yields the rows of each page as the pages are consumed."""
+        for segment, page in self._pages:
+            yield from page.get("Items") or []
+            self._advance(segment, page)
+
+    def close(self):
+        """Stops the scan, discarding any pages that have not been consumed."""
+        close = getattr(self._pages, "close", None)
+        if close:
+            close()
+
+    def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
+        """Returns a dictionary version of the object for debug logging."""
+        return {
+            "request": self.request,
+            "completed": self.completed,
+            "page_count": self.page_count,
+            "row_count": self.row_count,
+            "progress": [dataclasses.asdict(p) for p in self.progress.values()],
+        }
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchWriteStats:
+    """Statistics for a single batch within a chunked batch write."""
+
+    #: Zero-based position of the batch within the written items.
+    batch: int
+    #: Number of items written by the batch.
+    item_count: int
+    #: Number of batch write calls made for the batch, including retries.
+    attempt_count: int
+    #: Total number of unprocessed items that were retried.
+    retried_item_count: int
+    #: Seconds spent writing the batch, including retry delays.
+    elapsed: float
+
+
+@dataclasses.dataclass(frozen=True)
+class BatchWriteResponse(Response):
+    """
+    Response from writing items in batches. Only the items of the final batch
+    are retained so that arbitrarily many items can be streamed through a
+    batch write. The request is the BatchWriteItem request of the final
+    batch and the response is the raw response of its final call.
+    """
+
+    #: Statistics for each batch in the order the batches were created.
+    batches: typing.Tuple[BatchWriteStats, ...] = ()
+
+    @property
+    def batch_count(self) -> int:
+        """Number of batches written."""
+        return len(self.batches)
+
+    @property
+    def item_count(self) -> int:
+        """Number of items written across all batches."""
+        return sum(b.item_count for b in self.batches)
+
+    @property
+    def attempt_count(self) -> int:
+        """Number of batch write calls made across all batches."""
+        return sum(b.attempt_count for b in self.batches)
+
+    @property
+    def retried_item_count(self) -> int:
+        """Number of unprocessed items retried across all batches."""
+        return sum(b.retried_item_count for b in self.batches)
+
+    def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
+        """Returns a dictionary version of the object for debug logging."""
+        return {
+            "batch_count": self.batch_count,
+            "item_count": self.item_count,
+            "attempt_count": self.attempt_count,
+            "retried_item_count": self.retried_item_count,
+            **super(BatchWriteResponse, self).to_debug_dict(),
+        }
+
+
 class SpecialOperation(typing.NamedTuple):
-    """Represents a special DynamoDB operation like delete."""
+    """
+    Represents a special DynamoDB operation like delete. Operations with a
+    value are applied atomically by upserts with the update expression
+    clause of the same name, e.g. `ADD` to increment a number or add to a
+    set and `DELETE` to remove elements from a set, while operations without
+    a value remove the attribute.
+    """
 
     operation: str
+    #: Operand of the update clause, or None to remove the attribute.
+    value: typing.Any = None
 
 
 DELETE = SpecialOperation(operation="delete")
 
 
+def increment(amount: typing.Union[int, float] = 1) -> SpecialOperation:
+    """Atomically adds the amount to a number, which starts from zero."""
+    return SpecialOperation(operation="add", value=amount)
+
+
+def decrement(amount: typing.Union[int, float] = 1) -> SpecialOperation:
+    """Atomically subtracts the amount from a number, which starts from zero."""
+    return SpecialOperation(operation="add", value=-amount)
+
+
+def _set_operand(values: typing.Iterable[typing.Any]) -> typing.List[typing.Any]:
+    """Returns the values as a set operand, which DynamoDB requires non-empty."""
+    operand = list(values)
+    if not operand:
+        raise ValueError("Set operations require at least one value.")
+    return operand
+
+
+def add_to_set(values: typing.Iterable[typing.Any]) -> SpecialOperation:
+    """
+    Atomically adds the values to a set, creating it if it does not exist.
+    Raises a ValueError if there are no values.
+    """
+    return SpecialOperation(operation="add", value=_set_operand(values))
+
+
+def delete_from_set(values: typing.Iterable[typing.Any]) -> SpecialOperation:
+    """
+    Atomically removes the values from a set if they are in it. Raises a
+    ValueError if there are no values.
+    """
+    return SpecialOperation(operation="delete", value=_set_operand(values))
+
+
 class TypeHints:
     """Type hint definitions for DynamoDB data types and operations."""
 
@@ -720,6 +1067,20 @@ AnyColumnType = typing.Union[
 ]
 
 
+def _index_columns(
+    columns: typing.Sequence[typing.Any],
+) -> typing.Dict[str, typing.Any]:
+    """
+    Returns lookups of the columns by their table key and name, in which
+    the first of any columns sharing a key or name takes precedence.
+    """
+    return {
+        "columns_by_key": {(c.key or c.name): c for c in reversed(columns)},
+        "columns_by_name": {c.name: c for c in reversed(columns)},
+        "stored_keys": frozenset(c.key or c.name for c in columns),
+    }
+
+
 @dataclasses.dataclass(frozen=True)
 class Schema:
     """Data structure defining a DynamoDB table"""
@@ -737,10 +1098,101 @@ class Schema:
         ),
     )
 
+    # The remaining fields are lookups derived from the columns above. They
+    # are computed once when the schema is created because schemas are
+    # consulted for every row that is read or written.
+
+    #: Custom and common columns.
+    all_columns: typing.Tuple[typing.Any, ...] = dataclasses.field(
+        init=False, repr=False, compare=False, default=()
+    )
+    #: Columns, including the primary key columns, by their table key.
+    columns_by_key: typing.Dict[str, typing.Any] = dataclasses.field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    #: Columns, including the primary key columns, by their name.
+    columns_by_name: typing.Dict[str, typing.Any] = dataclasses.field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    #: Table keys of the primary keys and all columns, which are the only
+    #: attributes that a row matching this schema may contain.
+    stored_keys: typing.FrozenSet[str] = dataclasses.field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+    #: Primary key columns that are loaded into records.
+    loaded_key_columns: typing.Tuple[typing.Any, ...] = dataclasses.field(
+        init=False, repr=False, compare=False, default=()
+    )
+    #: Columns that are loaded into records, excluding computed columns and
+    #: columns that share a name with a loaded primary key column.
+    loaded_columns: typing.Tuple[typing.Any, ...] = dataclasses.field(
+        init=False, repr=False, compare=False, default=()
+    )
+
+    def __post_init__(self):
+        all_columns = (*self.columns, *self.common)
+        key_columns = tuple(c for c in (self.partition_key, self.sort_key) if c)
+        loaded_key_columns = tuple(c for c in key_columns if not c.computed)
+        key_names = {c.name for c in loaded_key_columns}
+
+        self._set_lookups(
+            **_index_columns((*key_columns, *all_columns)),
+            all_columns=all_columns,
+            loaded_key_columns=loaded_key_columns,
+            loaded_columns=tuple(
+                c for c in all_columns if not c.computed and c.name not in key_names
+            ),
+        )
+
+    def _set_lookups(self, **lookups: typing.Any):
+        """Assigns the lookups, which frozen dataclasses must do this way."""
+        for name, value in lookups.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def partition_key_name(self) -> str:
+        """Name of the partition key attribute in the table."""
+        return self.partition_key.key or "pk"
+
     @property
-    def all_columns(self) -> tuple[ColumnType | Column, ...]:
-        """Custom and common columns."""
-        return tuple(list(self.columns) + list(self.common))
+    def sort_key_name(self) -> str:
+        """Name of the sort key attribute in the table."""
+        return getattr(self.sort_key, "key", None) or "sk"
+
+    def get_column(self, key: typing.Optional[str]) -> typing.Optional[typing.Any]:
+        """
+        Returns the column, including the primary key columns, stored under
+        the table key or with the name, or None if there is no such column.
+
+        :param key:
+            Table key or name of the column.
+        """
+        if key is None:
+            return None
+        return self.columns_by_key.get(key) or self.columns_by_name.get(key)
+
+    def get_attribute_keys(
+        self,
+        names: typing.Optional[typing.Sequence[str]] = None,
+    ) -> typing.Tuple[str, ...]:
+        """
+        Returns the table attribute keys for the named columns, which always
+        include the table primary keys such that projected rows can still be
+        matched and loaded into records. Names that are not columns within
+        the schema are treated as attribute keys. If no names are specified
+        the keys of all columns that are loaded into records are returned.
+
+        :param names:
+            Names of the columns to include.
+        """
+        if names is None:
+            names = [c.name for c in self.all_columns if not c.computed]
+
+        keys = ["pk", "sk"]
+        for name in names:
+            column = self.columns_by_name.get(name)
+            keys.append((column.key or column.name) if column else name)
+        return tuple(dict.fromkeys(keys))
 
     def matches(self, row: dict) -> bool:
         """
@@ -757,18 +1209,18 @@ class Schema:
         if not sk_prefix_match:
             return False
 
-        return self._is_exact_match(row, pk_name, sk_name)
+        return self._is_exact_match(row)
 
     def _is_partition_key_prefix_match(self, row: dict) -> typing.Optional[str]:
         """Match the partition key with the row and return the comparison."""
-        partition_key_name = self.partition_key.key or "pk"
+        partition_key_name = self.partition_key_name
         partition_key = row[partition_key_name]["S"]
         is_match = partition_key.startswith(self.partition_key.value_prefix)
         return partition_key_name if is_match else None
 
     def _is_sort_key_prefix_match(self, row: dict) -> typing.Tuple[bool, str]:
         """Match the sort key with the row and return the comparison."""
-        sort_key_name = getattr(self.sort_key, "key", None) or "sk"
+        sort_key_name = self.sort_key_name
         sort_key = row.get(sort_key_name, {}).get("S")
         value_prefix = getattr(self.sort_key, "value_prefix", None)
         is_mismatch = (
@@ -778,15 +1230,8 @@ class Schema:
         )
         return not is_mismatch, sort_key_name
 
-    def _is_exact_match(
-        self,
-        row: dict,
-        partition_key_name: str,
-        sort_key_name: str,
-    ) -> bool:
+    def _is_exact_match(self, row: dict) -> bool:
         """Only match if all keys in the row are present in the schema."""
-        key_names = (partition_key_name, sort_key_name)
-        schema_keys = {c.key or c.name for c in self.all_columns}
-        row_keys = {k for k in row.keys() if k not in key_names}
-        mismatches = row_keys - schema_keys
-        return len(mismatches) == 0
+        # The stored keys include the primary keys, which have already been
+        # verified to be present in the row when needed at this point.
+        return row.keys() <= self.stored_keys
@@ -0,0 +1,119 @@
+import functools
+import typing
+
+from dynamo_io import recorder
+
+
+class _Candidate(typing.NamedTuple):
+    """Precomputed matching criteria for a record class."""
+
+    #: Position of the record class in the dispatch order.
+    order: int
+    record_class: typing.Type["recorder.Record"]
+    #: Name of the sort key attribute in the table.
+    sort_key: str
+    #: Value prefix of the sort key, or None if the schema has no sort key.
+    sort_prefix: typing.Optional[str]
+    #: All attribute keys that a matching row is allowed to contain.
+    allowed_keys: typing.FrozenSet[str]
+
+
+class RecordDispatcher:
+    """
+    Maps rows onto the first of an ordered sequence of record classes whose
+    schema matches the row. This produces the same results as checking
+    `schema.matches` for each record class in order, but it precompiles the
+    partition key value prefixes of the record classes into a lookup table
+    such that only the record classes sharing a prefix with the row are
+    verified against its sort key and attributes.
+    """
+
+    def __init__(self, record_classes: typing.Sequence[typing.Type["recorder.Record"]]):
+        self.record_classes = tuple(record_classes)
+        self._partition_keys: typing.Tuple[str, ...] = ()
+        self._prefix_lengths: typing.Tuple[int, ...] = ()
+        self._lookup: typing.Dict[typing.Tuple[str, str], typing.List[_Candidate]] = {}
+        for order, record_class in enumerate(self.record_classes):
+            self._add(order, record_class)
+
+    def _add(self, order: int, record_class: typing.Type["recorder.Record"]):
+        """Compiles the matching criteria of the record class into the lookup."""
+        schema = record_class.schema
+        partition_key = schema.partition_key_name
+        sort_key = schema.sort_key_name
+        prefix = schema.partition_key.value_prefix
+
+        candidate = _Candidate(
+            order=order,
+            record_class=record_class,
+            sort_key=sort_key,
+            sort_prefix=schema.sort_key.value_prefix if schema.sort_key else None,
+            allowed_keys=schema.stored_keys | {partition_key, sort_key},
+        )
+        self._lookup.setdefault((partition_key, prefix), []).append(candidate)
+        self._partition_keys = tuple(
+            dict.fromkeys((*self._partition_keys, partition_key))
+        )
+        self._prefix_lengths = tuple(sorted({*self._prefix_lengths, len(prefix)}))
+
+    def _candidates(self, row: dict) -> typing.Iterator[_Candidate]:
+        """Yields the candidates whose partition key prefix matches the row."""
+        for partition_key in self._partition_keys:
+            value = (row.get(partition_key) or {}).get("S")
+            if value is None:
+                continue
+            for length in self._prefix_lengths:
+                if length > len(value):
+                    break
+                yield from self._lookup.get((partition_key, value[:length]), [])
+
+    @staticmethod
+    def _is_match(candidate: _Candidate, row: dict) -> bool:
+        """Verifies the sort key and attributes of the row for the candidate."""
+        sort_value = (row.get(candidate.sort_key) or {}).get("S")
+        if candidate.sort_prefix is None or sort_value is None:
+            sort_match = candidate.sort_prefix is None and sort_value is None
+        else:
+            sort_match = not sort_value or sort_value.startswith(candidate.sort_prefix)
+        return sort_match and row.keys() <= candidate.allowed_keys
+
+    def match(self, row: dict) -> typing.Optional[typing.Type["recorder.Record"]]:
+        """
+        Returns the first record class whose schema matches the row, or None
+        if the row does not match any of the record classes.
+
+        :param row:
+            A DynamoDB row record.
+        """
+        matches = (c for c in self._candidates(row) if self._is_match(c, row))
+        best = min(matches, key=lambda c: c.order, default=None)
+        return best.record_class if best else None
+
+    def to_record(
+        self,
+        row: dict,
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> typing.Optional["recorder.Record"]:
+        """
+        Converts the row into the first record class whose schema matches
+        the row, or returns None if the row does not match any of them.
+
+        :param row:
+            A DynamoDB row record.
+        :param projection:
+            Attribute keys the row was read with, if it was read with a
+            projection.
+        """
+        record_class = self.match(row)
+        return record_class.from_row(row, projection) if record_class else None
+
+
+@functools.lru_cache(maxsize=256)
+def get_dispatcher(
+    record_classes: typing.Tuple[typing.Type["recorder.Record"], ...],
+) -> RecordDispatcher:
+    """
+    Returns a dispatcher for the ordered record classes, which is compiled
+    once and then reused for subsequent reads with the same record classes.
+    """
+    return RecordDispatcher(record_classes)
@@ -1,3 +1,4 @@
+import asyncio as _asyncio
 import datetime as _datetime
 import typing as _typing
 
@@ -12,6 +13,7 @@ from dynamo_io.mock._comparisons import is_like  # noqa: F401
 from dynamo_io.mock._comparisons import is_match  # noqa: F401
 from dynamo_io.mock._comparisons import is_not_null  # noqa: F401
 from dynamo_io.mock._comparisons import is_optional  # noqa: F401
+from dynamo_io.mock._paginators import AsyncPaginator  # noqa: F401
 from dynamo_io.mock._paginators import Paginator  # noqa: F401
 from dynamo_io.mock._tables import Key  # noqa: F401
 from dynamo_io.mock._tables import MockTable  # noqa: F401
@@ -121,6 +123,25 @@ def date_time(
     )
 
 
+def _returned_attributes(
+    return_values: str,
+    old_row: dict,
+    new_row: dict,
+    names: _typing.Iterable[str],
+) -> dict:
+    """
+    Selects the attributes returned by an update for the ReturnValues of
+    the request. Unlike DynamoDB, which returns nothing by default, updates
+    without ReturnValues return the whole updated item.
+    """
+    if return_values in ("ALL_OLD", "ALL_NEW"):
+        return dict(old_row if return_values == "ALL_OLD" else new_row)
+    if return_values in ("UPDATED_OLD", "UPDATED_NEW"):
+        source = old_row if return_values == "UPDATED_OLD" else new_row
+        return {k: source[k] for k in names if k in source}
+    return {}
+
+
 class MockDynamoClient:
     def __init__(
         self,
@@ -144,20 +165,30 @@ class MockDynamoClient:
     def table(self) -> MockTable:
         return self._table
 
+    def _to_key(self, key_data: dict) -> Key:
+        """Converts the DynamoDB key dictionary into a table key."""
+        return Key(
+            partition_key_value=key_data[self.partition_key]["S"],
+            sort_key_value=key_data.get(self.sort_key, {}).get("S"),
+        )
+
     def get_item(self, **kwargs) -> dict:
         key = Key(
             partition_key_value=kwargs["Key"][self.partition_key]["S"],
             sort_key_value=kwargs["Key"][self.sort_key]["S"],
         )
         row = self._table.rows.get(key)
-        return {"Item": row.to_dict() if row else None, "ConsumedCapacity": {}}
+        item = _paginators.project(row.to_dict(), **kwargs) if row else None
+        return {"Item": item, "ConsumedCapacity": {}}
 
     def update_item(self, **kwargs) -> dict:
         key = Key(
             partition_key_value=kwargs["Key"][self.partition_key]["S"],
             sort_key_value=kwargs["Key"][self.sort_key]["S"],
         )
-        row = self._table.rows.get(key) or Row(kwargs["Key"].copy())
+        existing = self._table.rows.get(key)
+        old_row = existing.to_dict() if existing else {}
+        row = existing or Row(kwargs["Key"].copy())
         row.update_from_expression(
             names=kwargs["ExpressionAttributeNames"],
             values=kwargs["ExpressionAttributeValues"],
@@ -167,7 +198,16 @@ class MockDynamoClient:
         if key not in self._table.rows:
             self._table.add_row(raw_row)
 
-        return {"Attributes": raw_row.copy(), "ConsumedCapacity": {}}
+        attributes = _returned_attributes(
+            return_values=kwargs.get("ReturnValues", "ALL_NEW"),
+            old_row=old_row,
+            new_row=raw_row,
+            names=kwargs["ExpressionAttributeNames"].values(),
+        )
+        response: dict = {"ConsumedCapacity": {}}
+        if attributes:
+            response["Attributes"] = attributes
+        return response
 
     def delete_item(self, **kwargs) -> dict:
         key = Key(
@@ -182,6 +222,16 @@ class MockDynamoClient:
             "ItemCollectionMetrics": {},
         }
 
+    def batch_get_item(self, **kwargs) -> dict:
+        responses = {}
+        for table_name, request in (kwargs.get("RequestItems") or {}).items():
+            rows = (self._table.rows.get(self._to_key(k)) for k in request["Keys"])
+            responses[table_name] = [
+                _paginators.project(r.to_dict(), **request) for r in rows if r
+            ]
+
+        return {"Responses": responses, "UnprocessedKeys": {}}
+
     def batch_write_item(self, **kwargs) -> dict:
         items = list((kwargs.get("RequestItems") or {}).values())[0]
         for item in items:
@@ -189,13 +239,7 @@ class MockDynamoClient:
                 puts = item["PutRequest"]
                 self._table.add_row(puts["Item"])
             elif "DeleteRequest" in item:
-                deletes = item["DeleteRequest"]
-                self._table.delete_key(
-                    Key(
-                        partition_key_value=deletes[self.partition_key]["S"],
-                        sort_key_value=deletes[self.sort_key]["S"],
-                    )
-                )
+                self._table.delete_key(self._to_key(item["DeleteRequest"]["Key"]))
 
         return {"UnprocessedItems": {}}
 
@@ -228,6 +272,14 @@ class MockDynamoClient:
 
         return {"ConsumedCapacity": [], "ItemCollectionMetrics": {}}
 
+    def query(self, **kwargs) -> dict:
+        rows = _paginators.query_matches(self._table, **kwargs)
+        return _paginators.page(rows, **kwargs)
+
+    def scan(self, **kwargs) -> dict:
+        rows = _paginators.scan_matches(self._table, **kwargs)
+        return _paginators.page(rows, **kwargs)
+
     def get_paginator(self, operation: str) -> "_paginators.Paginator":
         if operation == "query":
             return _paginators.QueryPaginator(self._table)
@@ -237,3 +289,77 @@ class MockDynamoClient:
         raise NotImplementedError(
             f'Pagination for "{operation}" is not currently supported.'
         )
+
+
+class AsyncMockDynamoClient:
+    """
+    Async counterpart of the MockDynamoClient with awaitable client methods
+    and async paginators, for use with the `dynamo_io.aio` functions. The
+    rows are stored in the table of the wrapped synchronous client, so both
+    clients can be used on the same data. Every call waits for the latency
+    in seconds before it is performed, which simulates the round trips of
+    a real endpoint when benchmarking concurrent code.
+
+    .. code-block:: python
+
+        client = mock.AsyncMockDynamoClient(latency=0.005)
+        responses = await asyncio.gather(
+            *(aio.get_record(client, "NA", key) for key in keys)
+        )
+    """
+
+    def __init__(
+        self,
+        client: _typing.Optional[MockDynamoClient] = None,
+        latency: float = 0.0,
+    ):
+        self.client = client or MockDynamoClient()
+        self.latency = latency
+        #: Number of calls made to the awaitable client methods.
+        self.call_count = 0
+
+    async def __aenter__(self) -> "AsyncMockDynamoClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        return None
+
+    @property
+    def table(self) -> MockTable:
+        return self.client.table
+
+    async def _call(self, operation: str, kwargs: dict) -> dict:
+        """Waits for the latency and performs the synchronous operation."""
+        self.call_count += 1
+        await _asyncio.sleep(self.latency)
+        return getattr(self.client, operation)(**kwargs)
+
+    async def get_item(self, **kwargs) -> dict:
+        return await self._call("get_item", kwargs)
+
+    async def update_item(self, **kwargs) -> dict:
+        return await self._call("update_item", kwargs)
+
+    async def delete_item(self, **kwargs) -> dict:
+        return await self._call("delete_item", kwargs)
+
+    async def batch_get_item(self, **kwargs) -> dict:
+        return await self._call("batch_get_item", kwargs)
+
+    async def batch_write_item(self, **kwargs) -> dict:
+        return await self._call("batch_write_item", kwargs)
+
+    async def transact_write_items(self, **kwargs) -> dict:
+        return await self._call("transact_write_items", kwargs)
+
+    async def query(self, **kwargs) -> dict:
+        return await self._call("query", kwargs)
+
+    async def scan(self, **kwargs) -> dict:
+        return await self._call("scan", kwargs)
+
+    def get_paginator(self, operation: str) -> "_paginators.AsyncPaginator":
+        return _paginators.AsyncPaginator(
+            self.client.get_paginator(operation),
+            latency=self.latency,
+        )
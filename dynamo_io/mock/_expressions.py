@@ -1,3 +1,4 @@
+import decimal
 import re
 import typing
 
@@ -80,6 +81,53 @@ def parse_removes(expression: str) -> typing.List[Update]:
     return [Update("REMOVE", item.strip(), "", "remove") for item in clause.split(",")]
 
 
+def _parse_operands(keyword: str, expression: str) -> typing.List[Update]:
+    clause = get_clause(keyword, expression)
+    if not clause:
+        return []
+
+    operand_rx = re.compile(r"#(?P<name>[^,\s]+)\s+:(?P<value>[^,\s]+)")
+    return [
+        Update(keyword, f"#{name_key}", f":{value_key}", keyword.lower())
+        for name_key, value_key in operand_rx.findall(clause)
+    ]
+
+
+def parse_adds(expression: str) -> typing.List[Update]:
+    return _parse_operands("ADD", expression)
+
+
+def parse_deletes(expression: str) -> typing.List[Update]:
+    return _parse_operands("DELETE", expression)
+
+
+def add_values(existing: typing.Optional[dict], value: dict) -> dict:
+    """
+    Adds the number to the existing number, or the set elements to the
+    existing set, as DynamoDB does for the ADD update action.
+    """
+    if "N" in value:
+        current = decimal.Decimal((existing or {}).get("N") or "0")
+        return {"N": str(current + decimal.Decimal(value["N"]))}
+
+    set_type, elements = next(iter(value.items()))
+    current_elements = list((existing or {}).get(set_type) or [])
+    added = [e for e in elements if e not in current_elements]
+    return {set_type: current_elements + added}
+
+
+def delete_values(
+    existing: typing.Optional[dict], value: dict
+) -> typing.Optional[dict]:
+    """
+    Removes the set elements from the existing set as DynamoDB does for the
+    DELETE update action, returning None once the set is empty.
+    """
+    set_type, elements = next(iter(value.items()))
+    remaining = [e for e in (existing or {}).get(set_type) or [] if e not in elements]
+    return {set_type: remaining} if remaining else None
+
+
 def row_update_from_expression(
     expression: str,
     names: typing.Dict[str, str],
@@ -105,4 +153,16 @@ def row_update_from_expression(
         if name in existing_row:
             del out[name]
 
+    for addition in parse_adds(expression):
+        name = names[addition.name_key]
+        out[name] = add_values(out.get(name), values[addition.value_key])
+
+    for deletion in parse_deletes(expression):
+        name = names[deletion.name_key]
+        remaining = delete_values(out.get(name), values[deletion.value_key])
+        if remaining is None:
+            out.pop(name, None)
+        else:
+            out[name] = remaining
+
     return out
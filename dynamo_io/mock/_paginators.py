@@ -1,5 +1,7 @@
+import asyncio
 import typing
 
+from dynamo_io import definitions
 from dynamo_io.mock import _conditioner
 from dynamo_io.mock import _tables
 
@@ -21,22 +23,136 @@ class Paginator:
 
 class ScanPaginator(Paginator):
     def paginate(self, **kwargs) -> typing.List[dict]:
-        return [{"Items": [r.to_dict() for r in self._table.rows.values()]}]
+        rows = scan_matches(self._table, **kwargs)
+        if not any(k in kwargs for k in ("Limit", "ExclusiveStartKey")):
+            return [{"Items": [project(r, **kwargs) for r in rows]}]
+
+        return pages(rows, **kwargs)
 
 
 class QueryPaginator(Paginator):
     def paginate(self, **kwargs) -> typing.List[dict]:
-        limit = kwargs.get("Limit") or len(self._table.rows)
-        names = kwargs.get("ExpressionAttributeNames") or {}
-        values = kwargs.get("ExpressionAttributeValues") or {}
-        conditions = _conditioner.parse_expression(
-            kwargs.get("KeyConditionExpression") or ""
-        )
-
-        matches = [
-            r.to_dict()
-            for r in self._table.rows.values()
-            if _conditioner.is_query_match(r, conditions, names, values)
-        ]
-
-        return [{"Items": []}, {"Items": matches[:limit]}]
+        rows = query_matches(self._table, **kwargs)
+        return pages(rows, **kwargs)
+
+
+class AsyncPaginator:
+    """
+    Paginator of an async client that yields the pages of the wrapped
+    paginator asynchronously, waiting for the latency before each page.
+    """
+
+    def __init__(self, paginator: Paginator, latency: float = 0.0):
+        self._paginator = paginator
+        self._latency = latency
+
+    async def _pages(self, kwargs: dict) -> typing.AsyncIterator[dict]:
+        for result in self._paginator.paginate(**kwargs):
+            await asyncio.sleep(self._latency)
+            yield result
+
+    def paginate(self, **kwargs) -> typing.AsyncIterator[dict]:
+        return self._pages(kwargs)
+
+
+def query_matches(table: _tables.MockTable, **kwargs) -> typing.List[dict]:
+    """Returns all rows in the table that match the key condition expression."""
+    names = kwargs.get("ExpressionAttributeNames") or {}
+    values = kwargs.get("ExpressionAttributeValues") or {}
+    conditions = _conditioner.parse_expression(
+        kwargs.get("KeyConditionExpression") or ""
+    )
+    return [
+        r.to_dict()
+        for r in table.rows.values()
+        if _conditioner.is_query_match(r, conditions, names, values)
+    ]
+
+
+def scan_matches(table: _tables.MockTable, **kwargs) -> typing.List[dict]:
+    """
+    Returns all rows in the table, or only those within the requested
+    segment when the scan is divided into segments.
+    """
+    rows = [r.to_dict() for r in table.rows.values()]
+    total_segments = kwargs.get("TotalSegments") or 1
+    if total_segments <= 1:
+        return rows
+
+    index = definitions.Indexes.STANDARD
+    ordered = sorted(rows, key=lambda r: _ordering(r, index))
+    return ordered[kwargs.get("Segment") or 0 :: total_segments]
+
+
+def project(row: dict, **kwargs) -> dict:
+    """
+    Returns the row limited to the attributes named in the ProjectionExpression
+    of the request, or the entire row if the request has no projection.
+    """
+    expression = kwargs.get("ProjectionExpression")
+    if not expression:
+        return row
+
+    names = kwargs.get("ExpressionAttributeNames") or {}
+    keys = [names.get(p.strip(), p.strip()) for p in expression.split(",")]
+    return {k: v for k, v in row.items() if k in keys}
+
+
+def _get_index(name: typing.Optional[str]) -> definitions.Index:
+    """Returns the index definition with the given name."""
+    return next(
+        (i for i in definitions.INDEXES_LIST if i.name == name),
+        definitions.Indexes.STANDARD,
+    )
+
+
+def _ordering(row: dict, index: definitions.Index) -> typing.Tuple[str, ...]:
+    """Returns the sort ordering of the row within the index."""
+    wrapped = _tables.Row(row)
+    return (
+        wrapped.get_key_value(index.sort_key) or "",
+        wrapped.get_key_value("pk") or "",
+        wrapped.get_key_value("sk") or "",
+    )
+
+
+def pages(rows: typing.List[dict], **kwargs) -> typing.List[dict]:
+    """
+    Returns every page of the rows starting after the ExclusiveStartKey,
+    following the LastEvaluatedKey of each page as a paginator does.
+    """
+    results = [page(rows, **kwargs)]
+    while "LastEvaluatedKey" in results[-1]:
+        start_key = results[-1]["LastEvaluatedKey"]
+        results.append(page(rows, **{**kwargs, "ExclusiveStartKey": start_key}))
+    return results
+
+
+def page(rows: typing.List[dict], **kwargs) -> dict:
+    """
+    Returns a single page of the rows in index order starting after the
+    ExclusiveStartKey and limited to the Limit, including a LastEvaluatedKey
+    when rows remain beyond the returned page.
+    """
+    index = _get_index(kwargs.get("IndexName"))
+    ordered = sorted(rows, key=lambda r: _ordering(r, index))
+
+    start_key = kwargs.get("ExclusiveStartKey")
+    if start_key:
+        start = _ordering(start_key, index)
+        ordered = [r for r in ordered if _ordering(r, index) > start]
+
+    limit = kwargs.get("Limit") or len(ordered)
+    items = ordered[:limit]
+    result: typing.Dict[str, typing.Any] = {
+        "Items": [project(r, **kwargs) for r in items],
+        "Count": len(items),
+    }
+
+    if items and len(ordered) > limit:
+        key_names = {"pk", "sk", index.partition_key, index.sort_key}
+        result["LastEvaluatedKey"] = {
+            k: v for k, v in items[-1].items() if k in key_names
+        }
+
+    return result
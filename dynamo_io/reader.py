@@ -2,8 +2,20 @@ import typing
 
 from botocore.client import BaseClient
 
+from dynamo_io import _batching
+from dynamo_io import _cursors
+from dynamo_io import _requests
+from dynamo_io import _scanning
+from dynamo_io import caching
 from dynamo_io import definitions
+from dynamo_io import dispatching
 from dynamo_io import recorder
+from dynamo_io import retries
+
+#: Attributes to read for record functions, either as a sequence of column
+#: names resolved against the record schemas or a Record class whose schema
+#: columns are read. None reads all attributes.
+RecordProjection = _requests.RecordProjection
 
 
 def get_row(
@@ -11,6 +23,9 @@ def get_row(
     table_name: str,
     partition_key_value: str,
     sort_key_value: typing.Optional[str],
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+    single_flight: "caching.SingleFlight | None" = None,
 ) -> definitions.SingleRowResponse:
     """Retrieve a single row from a DynamoDB table by its primary key.
 
@@ -19,17 +34,26 @@ def get_row(
         table_name: The name of the DynamoDB table.
         partition_key_value: The partition key value to query.
         sort_key_value: Optional sort key value for the item.
+        projection: Optional attribute keys to read instead of the whole item.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
+        single_flight: Optional single flight sharing the response of an
+            identical request that is already in flight.
 
     Returns:
         SingleRowResponse containing the request, response, and row data.
     """
-    key = {"pk": {"S": str(partition_key_value)}}
-    if sort_key_value is not None:
-        key["sk"] = {"S": str(sort_key_value)}
-
-    request = {"TableName": table_name, "Key": key}
-
-    response = client.get_item(**request)
+    request = _requests.to_get_item_request(
+        table_name, partition_key_value, sort_key_value, projection
+    )
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    if single_flight is not None:
+        response = single_flight.call(
+            caching.single_flight_key(client, "get_item", request),
+            lambda: policy.call(client.get_item, **request),
+        )
+    else:
+        response = policy.call(client.get_item, **request)
     return definitions.SingleRowResponse(
         request=request,
         response=response,
@@ -41,6 +65,10 @@ def get_record(
     client: BaseClient,
     table_name: str,
     source: "recorder.Record",
+    projection: RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+    cache: "caching.RecordCache | None" = None,
+    single_flight: "caching.SingleFlight | None" = None,
 ) -> recorder.SingleRecordResponse:
     """Retrieve a single record from a DynamoDB table using a source record's keys.
 
@@ -48,64 +76,249 @@ def get_record(
         client: The boto3 DynamoDB client.
         table_name: The name of the DynamoDB table.
         source: The record containing the key values to query.
+        projection: Optional column names or Record class limiting the attributes
+            read. Columns that are not read are left empty in the record.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
+        cache: Optional record cache returning a cached response instead of
+            reading the table when the record was read recently.
+        single_flight: Optional single flight sharing the response of an
+            identical request that is already in flight.
 
     Returns:
         SingleRecordResponse containing the deserialized record if found.
     """
+    if cache is not None:
+        return cache.read(
+            table_name,
+            definitions.Indexes.STANDARD,
+            source,
+            projection,
+            lambda: get_record(
+                client,
+                table_name,
+                source,
+                projection,
+                retry_policy,
+                single_flight=single_flight,
+            ),
+        )
+
+    attribute_keys = _requests.record_projection(projection, [type(source)])
     response = get_row(
-        client, table_name, source.partition_key_value, source.sort_key_value
+        client,
+        table_name,
+        source.partition_key_value,
+        source.sort_key_value,
+        projection=attribute_keys,
+        retry_policy=retry_policy,
+        single_flight=single_flight,
     )
+    row = response.row
     return recorder.SingleRecordResponse(
         request=response.request,
         response=response.response,
-        row=response.row,
-        record=source.from_row(response.row) if response.row else None,
+        row=row,
+        record=source.from_row(row, attribute_keys) if row else None,
     )
 
 
-def _assemble_get_rows_for_partition_key_params(
-    index: definitions.Index,
-    partition_key_value: str,
-    sort_key_starts: typing.Optional[str],
-    before_sort_key: typing.Optional[str],
-    after_sort_key: typing.Optional[str],
-) -> typing.Tuple[dict, dict, str]:
+#: Hashable identity of the primary key values of a row.
+_KeyIdentity = typing.Tuple[typing.Optional[str], typing.Optional[str]]
+
+
+def _key_identity(row: dict) -> _KeyIdentity:
+    """Returns a hashable identity for the primary key values of the row."""
+    return (row.get("pk", {}).get("S"), row.get("sk", {}).get("S"))
+
+
+def _unprocessed_keys(response: dict, table_name: str) -> typing.List[dict]:
+    """Returns the keys of the table that the batch get did not process."""
+    unprocessed = (response.get("UnprocessedKeys") or {}).get(table_name) or {}
+    return unprocessed.get("Keys") or []
+
+
+def _batch_get_chunk(
+    client: BaseClient,
+    table_name: str,
+    keys: typing.List[dict],
+    consistent_read: bool,
+    projection: typing.Optional[typing.Sequence[str]],
+    retry_policy: typing.Optional[retries.RetryPolicy],
+) -> typing.Tuple[typing.List[dict], typing.List[dict]]:
     """
-    Assemble the attribute names, values and key expression required for dynamo.
+    Retrieves the rows for up to 100 keys with a batch get, retrying any
+    unprocessed keys and retryable errors according to the retry policy,
+    with both counting towards the same attempts. Returns a tuple
+    containing the raw responses and the retrieved rows.
+    """
+    responses: typing.List[dict] = []
+    rows: typing.List[dict] = []
+    remaining = keys
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    error: typing.Optional[Exception] = None
+
+    for _ in policy.attempts():
+        table_request = {"Keys": remaining, "ConsistentRead": consistent_read}
+        try:
+            response = client.batch_get_item(
+                RequestItems={
+                    table_name: _requests.apply_projection(table_request, projection)
+                }
+            )
+        except Exception as caught:
+            if not policy.is_retryable(caught):
+                raise
+            error = caught
+            continue
+        responses.append(response)
+        rows += (response.get("Responses") or {}).get(table_name) or []
+        remaining = _unprocessed_keys(response, table_name)
+        if not remaining:
+            return responses, rows
+
+    raise error or RuntimeError("Failed to get all records.")
+
+
+def _unique_keys(
+    sources: typing.Sequence["recorder.Record"],
+) -> typing.Tuple[typing.List[_KeyIdentity], typing.List[dict]]:
+    """
+    Returns the key identities of the sources in order along with the
+    de-duplicated table keys of the sources.
+    """
+    identities = []
+    unique_keys: typing.Dict[_KeyIdentity, dict] = {}
+    for source in sources:
+        key = source.table_key
+        identities.append(_key_identity(key))
+        unique_keys.setdefault(identities[-1], key)
+    return identities, list(unique_keys.values())
 
-    :param index:
-        Object describing the indexes of the dynamo table.
-    :param partition_key_value:
-        The value defining the partition to query.
-    :param sort_key_starts:
-        The value the sort key must begin with.
-    :param before_sort_key:
-        The sort key value that all records must be before.
-    :param after_sort_key:
-        The sort key value that all records must be after.
+
+def batch_get_records(
+    client: BaseClient,
+    table_name: str,
+    sources: typing.Sequence["recorder.Record"],
+    max_workers: int = 1,
+    consistent_read: bool = False,
+    projection: RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> recorder.BatchRecordResponse:
+    """
+    Retrieves multiple records by their primary keys using batch get calls
+    of up to 100 keys each instead of one get call per record. Duplicate
+    keys are only requested once and unprocessed keys are retried according
+    to the retry policy. If keys still remain unprocessed once the policy
+    is exhausted a RuntimeError is raised.
+
+    :param client:
+        Boto client used to retrieve the records.
+    :param table_name:
+        Name of the table to retrieve the records from.
+    :param sources:
+        Records containing the key values to retrieve. Each retrieved row
+        is converted using the `from_row` method of its source record.
+    :param max_workers:
+        Number of batch get calls to run concurrently. Defaults to running
+        them sequentially.
+    :param consistent_read:
+        Whether to use strongly consistent reads.
+    :param projection:
+        Column names or a Record class limiting the attributes read. Columns
+        that are not read are left empty in the records.
+    :param retry_policy:
+        Policy for retrying throttled requests and unprocessed keys, which
+        defaults to `retries.DEFAULT_RETRY_POLICY`.
     :return:
-        A tuple of attribute_names, attribute_values, and key_conditions.
+        A batch record response with the rows and records aligned to the
+        order of the sources, containing None for keys that do not exist.
     """
-    attribute_names = {"#k0": index.partition_key}
-    attribute_values = {":v0": {"S": str(partition_key_value)}}
-    key_condition = "#k0=:v0"
+    identities, keys = _unique_keys(sources)
+
+    record_classes = list(dict.fromkeys(type(s) for s in sources))
+    attribute_keys = _requests.record_projection(projection, record_classes)
+
+    def get_chunk(index: int, chunk: typing.List[dict]) -> typing.Tuple[list, list]:
+        return _batch_get_chunk(
+            client, table_name, chunk, consistent_read, attribute_keys, retry_policy
+        )
+
+    results = _batching.map_bounded(
+        get_chunk, _batching.iter_batches(keys, 100), max_workers
+    )
+    responses = [response for result in results for response in result[0]]
+    found = {_key_identity(row): row for result in results for row in result[1]}
+    rows = [found.get(identity) for identity in identities]
+
+    return recorder.BatchRecordResponse(
+        request={
+            "RequestItems": {
+                table_name: _requests.apply_projection({"Keys": keys}, attribute_keys)
+            }
+        },
+        responses=tuple(responses),
+        rows=tuple(rows),
+        records=tuple(
+            source.from_row(row, attribute_keys) if row else None
+            for source, row in zip(sources, rows)
+        ),
+    )
+
+
+def _iter_pages(
+    client: BaseClient,
+    operation: str,
+    request: dict,
+    max_items: int = 0,
+    retry_policy: typing.Optional[retries.RetryPolicy] = None,
+) -> typing.Iterator[dict]:
+    """
+    Yields the response pages for the paginated operation request. When
+    a positive max items is specified, pages are requested directly from
+    the client instead and page requests stop as soon as that many items
+    have been returned, with the final page request sized to the remainder.
+    Throttled page requests are retried according to the retry policy.
+    """
+    if max_items <= 0:
+        yield from retries.paginate(client, operation, request, retry_policy)
+        return
+
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+
+    remaining = max_items
+    page_request = dict(request)
+    while remaining > 0:
+        page_request["Limit"] = min(request.get("Limit") or remaining, remaining)
+        page = policy.call(getattr(client, operation), **page_request)
+        yield page
 
-    if index.sort_key and sort_key_starts:
-        attribute_names["#k1"] = index.sort_key
-        attribute_values[":v1"] = {"S": str(sort_key_starts)}
-        key_condition += " AND begins_with ( #k1, :v1 )"
+        remaining -= len(page.get("Items") or [])
+        last_evaluated_key = page.get("LastEvaluatedKey")
+        if not last_evaluated_key:
+            return
+        page_request["ExclusiveStartKey"] = last_evaluated_key
 
-    if index.sort_key and before_sort_key:
-        attribute_names["#k2"] = index.sort_key
-        attribute_values[":v2"] = {"S": str(before_sort_key)}
-        key_condition += " AND #k2 < :v2"
 
-    if index.sort_key and after_sort_key:
-        attribute_names["#k3"] = index.sort_key
-        attribute_values[":v3"] = {"S": str(after_sort_key)}
-        key_condition += " AND #k3 > :v3"
+def _query_partition(
+    client: BaseClient,
+    request: dict,
+    max_items: int,
+    retry_policy: typing.Optional[retries.RetryPolicy],
+) -> definitions.PagedRowResponse:
+    """Reads the rows of the partition query request into a paged response."""
+    rows: typing.List[dict] = []
+    pages: typing.List[dict] = []
+
+    for page in _iter_pages(client, "query", request, max_items, retry_policy):
+        pages.append(page)
+        rows += page.get("Items") or []
 
-    return attribute_names, attribute_values, key_condition
+    return definitions.PagedRowResponse(
+        request=request,
+        pages=tuple(pages or []),
+        rows=tuple(rows or []),
+    )
 
 
 def get_rows_for_partition(
@@ -117,6 +330,13 @@ def get_rows_for_partition(
     after_sort_key: str | None = None,
     index: definitions.Index = definitions.Indexes.STANDARD,
     limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+    cache: "caching.PartitionCache | None" = None,
+    single_flight: "caching.SingleFlight | None" = None,
 ) -> definitions.PagedRowResponse:
     """
     Get the raw dynamodb rows from the specified partition.
@@ -136,48 +356,54 @@ def get_rows_for_partition(
     :param index:
         Object describing the indexes of the dynamo table.
     :param limit:
-        The number of rows to pull.
+        The number of rows to pull per page, which is passed to DynamoDB
+        as the query Limit.
+    :param max_items:
+        The maximum number of rows to pull in total. Once reached no further
+        pages are requested. Zero, the default, reads the entire partition.
+    :param exclusive_start_key:
+        The LastEvaluatedKey of a previous read from which to resume.
+    :param cursor:
+        The cursor of a previous response for the same partition query from
+        which to resume. Takes precedence over the exclusive start key.
+    :param projection:
+        The attribute keys to read instead of the whole items.
+    :param retry_policy:
+        Policy for retrying throttled requests, which defaults to
+        `retries.DEFAULT_RETRY_POLICY`.
+    :param cache:
+        Partition cache returning the cached result of the same query
+        instead of querying the table when the partition was not written
+        since it was cached.
+    :param single_flight:
+        Single flight sharing the response of an identical query that is
+        already in flight.
     :return:
         A paged row response for the specified rows.
     """
-    (
-        attribute_names,
-        attribute_values,
-        key_condition,
-    ) = _assemble_get_rows_for_partition_key_params(
-        index,
-        partition_key_value,
-        sort_key_starts,
-        before_sort_key,
-        after_sort_key,
+    request = _requests.assemble_get_rows_for_partition_request(
+        table_name=table_name,
+        partition_key_value=partition_key_value,
+        sort_key_starts=sort_key_starts,
+        before_sort_key=before_sort_key,
+        after_sort_key=after_sort_key,
+        index=index,
+        limit=limit,
     )
+    _requests.apply_start_key(request, exclusive_start_key, cursor)
+    _requests.apply_projection(request, projection)
+
+    def query() -> definitions.PagedRowResponse:
+        if single_flight is None:
+            return _query_partition(client, request, max_items, retry_policy)
+        return single_flight.call(
+            caching.single_flight_key(client, "query", request, max_items),
+            lambda: _query_partition(client, request, max_items, retry_policy),
+        )
 
-    request: dict = {
-        "TableName": table_name,
-        "ExpressionAttributeNames": attribute_names,
-        "ExpressionAttributeValues": attribute_values,
-        "KeyConditionExpression": key_condition,
-    }
-
-    if limit > 0:
-        request["Limit"] = limit
-
-    if index.name:
-        request["IndexName"] = index.name
-
-    paginator = client.get_paginator("query")
-    rows: typing.List[dict] = []
-    pages: typing.List[dict] = []
-
-    for page in paginator.paginate(**request):
-        pages.append(page)
-        rows += page.get("Items") or []
-
-    return definitions.PagedRowResponse(
-        request=request,
-        pages=tuple(pages or []),
-        rows=tuple(rows or []),
-    )
+    if cache is None:
+        return query()
+    return cache.read(client, request, max_items, query)
 
 
 def get_records_for_partition(
@@ -190,6 +416,13 @@ def get_records_for_partition(
     index: definitions.Index = definitions.Indexes.STANDARD,
     record_classes: typing.List[typing.Type["recorder.Record"]] | None = None,
     limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+    cache: "caching.PartitionCache | None" = None,
+    single_flight: "caching.SingleFlight | None" = None,
 ) -> recorder.PagedRecordResponse:
     """Retrieve multiple records for a partition key from a DynamoDB table.
 
@@ -202,11 +435,26 @@ def get_records_for_partition(
         after_sort_key: Optional lower bound for the sort key range.
         index: The index to query (defaults to STANDARD).
         record_classes: Optional list of record classes to match against rows.
-        limit: Optional limit on the number of items to return (0 means no limit).
+        limit: Optional number of items to request per page (0 means no limit).
+        max_items: Optional cap on the total number of items read, after which no
+            further pages are requested (0 means no limit).
+        exclusive_start_key: Optional LastEvaluatedKey of a previous read from
+            which to resume.
+        cursor: Optional cursor of a previous response for the same partition
+            query from which to resume.
+        projection: Optional column names or Record class limiting the attributes
+            read. Columns that are not read are left empty in the records.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
+        cache: Optional partition cache returning the cached rows of the same
+            query when the partition was not written since they were cached.
+        single_flight: Optional single flight sharing the rows of an identical
+            query that is already in flight.
 
     Returns:
         PagedRecordResponse containing all matching records.
     """
+    attribute_keys = _requests.record_projection(projection, record_classes or [])
     result = get_rows_for_partition(
         client=client,
         table_name=table_name,
@@ -216,14 +464,19 @@ def get_records_for_partition(
         after_sort_key=after_sort_key,
         index=index,
         limit=limit,
+        max_items=max_items,
+        exclusive_start_key=exclusive_start_key,
+        cursor=cursor,
+        projection=attribute_keys,
+        retry_policy=retry_policy,
+        cache=cache,
+        single_flight=single_flight,
     )
 
+    dispatcher = dispatching.get_dispatcher(tuple(record_classes or []))
     records = []
     for row in result.rows or []:
-        match = next(
-            (r.from_row(row) for r in (record_classes or []) if r.schema.matches(row)),
-            None,
-        )
+        match = dispatcher.to_record(row, attribute_keys)
         if match:
             records.append(match)
 
@@ -235,10 +488,152 @@ def get_records_for_partition(
     )
 
 
+def iter_rows_for_partition(
+    client: BaseClient,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: str | None = None,
+    before_sort_key: str | None = None,
+    after_sort_key: str | None = None,
+    index: definitions.Index = definitions.Indexes.STANDARD,
+    limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.StreamedRowResponse:
+    """
+    Stream the raw dynamodb rows from the specified partition page by page.
+    Unlike `get_rows_for_partition`, pages are requested lazily as the
+    returned response is iterated and neither pages nor rows are retained,
+    which keeps memory bounded by the page size for large partitions.
+
+    :param client:
+        The client to use in pulling the rows from dynamodb.
+    :param table_name:
+        The table to pull rows from.
+    :param partition_key_value:
+        The value defining the partition to query.
+    :param sort_key_starts:
+        The value the sort key must begin with.
+    :param before_sort_key:
+        The sort key value that all records must be before.
+    :param after_sort_key:
+        The sort key value that all records must be after.
+    :param index:
+        Object describing the indexes of the dynamo table.
+    :param limit:
+        The number of rows to pull per page.
+    :param max_items:
+        The maximum number of rows to pull in total. Once reached no further
+        pages are requested. Zero, the default, reads the entire partition.
+    :param exclusive_start_key:
+        The LastEvaluatedKey of a previous read from which to resume.
+    :param cursor:
+        The cursor of a previous response for the same partition query from
+        which to resume. Takes precedence over the exclusive start key.
+    :param projection:
+        The attribute keys to read instead of the whole items.
+    :param retry_policy:
+        Policy for retrying throttled requests, which defaults to
+        `retries.DEFAULT_RETRY_POLICY`.
+    :return:
+        A streamed row response that yields the rows when iterated and
+        holds the page count, last evaluated key and consumed capacity
+        once iteration has finished.
+    """
+    request = _requests.assemble_get_rows_for_partition_request(
+        table_name=table_name,
+        partition_key_value=partition_key_value,
+        sort_key_starts=sort_key_starts,
+        before_sort_key=before_sort_key,
+        after_sort_key=after_sort_key,
+        index=index,
+        limit=limit,
+    )
+    _requests.apply_start_key(request, exclusive_start_key, cursor)
+    _requests.apply_projection(request, projection)
+    request["ReturnConsumedCapacity"] = "TOTAL"
+    return definitions.StreamedRowResponse(
+        request=request,
+        pages=_iter_pages(client, "query", request, max_items, retry_policy),
+    )
+
+
+def iter_records_for_partition(
+    client: BaseClient,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: str | None = None,
+    before_sort_key: str | None = None,
+    after_sort_key: str | None = None,
+    index: definitions.Index = definitions.Indexes.STANDARD,
+    record_classes: typing.List[typing.Type["recorder.Record"]] | None = None,
+    limit: int = 0,
+    max_items: int = 0,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    projection: RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> recorder.StreamedRecordResponse:
+    """Stream the records for a partition key page by page.
+
+    Args:
+        client: The boto3 DynamoDB client.
+        table_name: The name of the DynamoDB table.
+        partition_key_value: The partition key value to query.
+        sort_key_starts: Optional prefix for the sort key to filter results.
+        before_sort_key: Optional upper bound for the sort key range.
+        after_sort_key: Optional lower bound for the sort key range.
+        index: The index to query (defaults to STANDARD).
+        record_classes: Optional list of record classes to match against rows.
+        limit: Optional number of items to request per page (0 means no limit).
+        max_items: Optional cap on the total number of items read, after which no
+            further pages are requested (0 means no limit).
+        exclusive_start_key: Optional LastEvaluatedKey of a previous read from
+            which to resume.
+        cursor: Optional cursor of a previous response for the same partition
+            query from which to resume.
+        projection: Optional column names or Record class limiting the attributes
+            read. Columns that are not read are left empty in the records.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
+
+    Returns:
+        StreamedRecordResponse that yields the matching records when iterated.
+    """
+    request = _requests.assemble_get_rows_for_partition_request(
+        table_name=table_name,
+        partition_key_value=partition_key_value,
+        sort_key_starts=sort_key_starts,
+        before_sort_key=before_sort_key,
+        after_sort_key=after_sort_key,
+        index=index,
+        limit=limit,
+    )
+    attribute_keys = _requests.record_projection(projection, record_classes or [])
+    _requests.apply_start_key(request, exclusive_start_key, cursor)
+    _requests.apply_projection(request, attribute_keys)
+    request["ReturnConsumedCapacity"] = "TOTAL"
+    dispatcher = dispatching.get_dispatcher(tuple(record_classes or []))
+    return recorder.StreamedRecordResponse(
+        request=request,
+        pages=_iter_pages(client, "query", request, max_items, retry_policy),
+        converter=lambda row: dispatcher.to_record(row, attribute_keys),
+    )
+
+
 def read_entire_table(
     client: BaseClient,
     table_name: str,
     max_page_count: int = 100,
+    exclusive_start_key: dict | None = None,
+    cursor: str | None = None,
+    total_segments: int = 1,
+    max_workers: int = 0,
+    checkpoint: str | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
 ) -> definitions.ScannedRowResponse:
     """
     Reads entire table contents via a scan. Use with caution and only
@@ -247,14 +642,36 @@ def read_entire_table(
     prevent extremely costly large scans. The return is a tuple where
     the first argument is whether or not the scan completed and returned
     all rows. If the page limit is hit this value will be false. The
-    second argument is the returned list of raw dynamodb rows.
+    second argument is the returned list of raw dynamodb rows. When the
+    scan did not complete, the cursor of the response can be passed to
+    a subsequent call to continue the scan where it stopped.
+
+    Specifying more than one total segment scans the segments in parallel
+    as described in `iter_entire_table`, in which case the max page count
+    applies to the pages across all segments and the checkpoint of an
+    incomplete response resumes the scan instead of the cursor. Throttled
+    page requests are retried according to the retry policy.
     """
-    paginator = client.get_paginator("scan")
+    if total_segments > 1:
+        return _read_segmented_table(
+            client=client,
+            table_name=table_name,
+            max_page_count=max_page_count,
+            total_segments=total_segments,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+            retry_policy=retry_policy,
+        )
+
     rows: typing.List[dict] = []
     pages: typing.List[dict] = []
     completed = True
-    request = {"TableName": table_name}
-    for index, page in enumerate(paginator.paginate(**request)):
+    request = _requests.apply_start_key(
+        {"TableName": table_name}, exclusive_start_key, cursor
+    )
+    for index, page in enumerate(
+        _iter_pages(client, "scan", request, retry_policy=retry_policy)
+    ):
         if index > max_page_count:
             completed = False
             break
@@ -270,6 +687,117 @@ def read_entire_table(
     )
 
 
+def _initial_segment_progress(
+    request: dict,
+    checkpoint: typing.Optional[str],
+) -> typing.Dict[int, definitions.SegmentProgress]:
+    """Returns the starting progress of each segment of a parallel scan."""
+    if not checkpoint:
+        return {
+            i: definitions.SegmentProgress(segment=i)
+            for i in range(request["TotalSegments"])
+        }
+
+    states = _cursors.decode(checkpoint, request)
+    return {
+        i: definitions.SegmentProgress(
+            segment=i,
+            last_evaluated_key=state["key"],
+            completed=state["completed"],
+        )
+        for i, state in enumerate(states)
+    }
+
+
+def iter_entire_table(
+    client: BaseClient,
+    table_name: str,
+    total_segments: int = 4,
+    max_workers: int = 0,
+    queue_size: int = 16,
+    checkpoint: str | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.SegmentedScanResponse:
+    """
+    Streams the entire table contents via a parallel scan that divides the
+    table into segments scanned concurrently on a thread pool. Rows are
+    yielded as pages arrive from any segment, with pages buffered in a
+    bounded queue so that the workers pause when the consumer falls behind.
+    The response tracks the progress of each segment and exposes a
+    checkpoint from which an interrupted scan can be resumed.
+
+    :param client:
+        Boto client used to scan the table.
+    :param table_name:
+        Name of the table to scan.
+    :param total_segments:
+        Number of segments into which the table is divided.
+    :param max_workers:
+        Number of segments scanned concurrently. Defaults to scanning all
+        segments concurrently.
+    :param queue_size:
+        Maximum number of pages buffered ahead of the consumer.
+    :param checkpoint:
+        Checkpoint of a previous scan of the table with the same total
+        segments from which to resume.
+    :param retry_policy:
+        Policy for retrying throttled requests, which defaults to
+        `retries.DEFAULT_RETRY_POLICY`.
+    :return:
+        A segmented scan response that yields the rows when iterated.
+    """
+    request = {"TableName": table_name, "TotalSegments": total_segments}
+    progress = _initial_segment_progress(request, checkpoint)
+    return definitions.SegmentedScanResponse(
+        request=request,
+        pages=_scanning.iter_segment_pages(
+            client=client,
+            request=request,
+            progress=progress,
+            max_workers=max_workers or total_segments,
+            queue_size=queue_size,
+            retry_policy=retry_policy,
+        ),
+        progress=progress,
+    )
+
+
+def _read_segmented_table(
+    client: BaseClient,
+    table_name: str,
+    max_page_count: int,
+    total_segments: int,
+    max_workers: int,
+    checkpoint: typing.Optional[str],
+    retry_policy: typing.Optional[retries.RetryPolicy],
+) -> definitions.ScannedRowResponse:
+    """Reads the table with a parallel scan up to the max page count."""
+    streamed = iter_entire_table(
+        client=client,
+        table_name=table_name,
+        total_segments=total_segments,
+        max_workers=max_workers,
+        checkpoint=checkpoint,
+        retry_policy=retry_policy,
+    )
+    rows: typing.List[dict] = []
+    pages: typing.List[dict] = []
+    for page in streamed.iter_pages():
+        pages.append(page)
+        rows += page.get("Items") or []
+        if len(pages) > max_page_count:
+            break
+    streamed.close()
+
+    return definitions.ScannedRowResponse(
+        completed=streamed.completed,
+        request=streamed.request,
+        pages=tuple(pages),
+        rows=tuple(rows),
+        checkpoint=streamed.checkpoint,
+    )
+
+
 def get_indexed_rows(
     client: BaseClient,
     table_name: str,
@@ -277,6 +805,9 @@ def get_indexed_rows(
     sort_key_value: typing.Optional[str],
     index: definitions.Index = definitions.Indexes.STANDARD,
     limit: int = 1,
+    max_items: int = 0,
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
 ) -> definitions.PagedRowResponse:
     """Query rows from a DynamoDB table index by partition and sort keys.
 
@@ -286,7 +817,12 @@ def get_indexed_rows(
         partition_key_value: The partition key value to query.
         sort_key_value: Optional sort key value to query.
         index: The index to query (defaults to STANDARD).
-        limit: Maximum number of items to return (defaults to 1).
+        limit: Number of items to request per page (defaults to 1).
+        max_items: Optional cap on the total number of items read, after which no
+            further pages are requested (0 means no limit).
+        projection: Optional attribute keys to read instead of the whole item.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
 
     Returns:
         PagedRowResponse containing the matching rows.
@@ -313,10 +849,11 @@ def get_indexed_rows(
     if limit > 0:
         request["Limit"] = limit
 
-    paginator = client.get_paginator("query")
+    _requests.apply_projection(request, projection)
+
     rows: typing.List[dict] = []
     pages: typing.List[dict] = []
-    for page in paginator.paginate(**request):
+    for page in _iter_pages(client, "query", request, max_items, retry_policy):
         pages.append(page)
         rows += page.get("Items") or []
 
@@ -333,6 +870,8 @@ def get_indexed_row(
     partition_key_value: str,
     sort_key_value: str,
     index: definitions.Index = definitions.Indexes.STANDARD,
+    projection: typing.Sequence[str] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
 ) -> definitions.SingleRowResponse:
     """Retrieve a single row from a DynamoDB table index.
 
@@ -342,6 +881,9 @@ def get_indexed_row(
         partition_key_value: The partition key value to query.
         sort_key_value: The sort key value to query.
         index: The index to query (defaults to STANDARD).
+        projection: Optional attribute keys to read instead of the whole item.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
 
     Returns:
         SingleRowResponse containing the first matching row.
@@ -353,6 +895,9 @@ def get_indexed_row(
         sort_key_value=sort_key_value,
         index=index,
         limit=1,
+        max_items=1,
+        projection=projection,
+        retry_policy=retry_policy,
     )
     return definitions.SingleRowResponse(
         request=result.request,
@@ -367,6 +912,9 @@ def get_indexed_records(
     source: "recorder.Record",
     index: definitions.Index = definitions.Indexes.STANDARD,
     limit: int = 1,
+    max_items: int = 0,
+    projection: RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
 ) -> recorder.PagedRecordResponse:
     """Query records from a DynamoDB table index using a source record.
 
@@ -375,24 +923,20 @@ def get_indexed_records(
         table_name: The name of the DynamoDB table.
         source: The record containing the key values to query.
         index: The index to query (defaults to STANDARD).
-        limit: Maximum number of items to return (defaults to 1).
+        limit: Number of items to request per page (defaults to 1).
+        max_items: Optional cap on the total number of items read, after which no
+            further pages are requested (0 means no limit).
+        projection: Optional column names or Record class limiting the attributes
+            read instead of the whole item.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
 
     Returns:
         PagedRecordResponse containing the matching deserialized records.
     """
-    columns = [
-        source.schema.partition_key,
-        source.schema.sort_key,
-        # Common keys cannot be GSIs, so we ignore them here.
-        *source.schema.columns,
-    ]
-
-    partition_column = next(
-        (c for c in columns if c and index.partition_key in (c.name, c.key)), None
-    )
-    sort_column = next(
-        (c for c in columns if c and index.sort_key in (c.name, c.key)), None
-    )
+    partition_column = source.schema.get_column(index.partition_key)
+    sort_column = source.schema.get_column(index.sort_key)
+    attribute_keys = _requests.record_projection(projection, [type(source)])
 
     result = get_indexed_rows(
         client=client,
@@ -401,9 +945,12 @@ def get_indexed_records(
         sort_key_value=source.get_value_for(sort_column),
         index=index,
         limit=limit,
+        max_items=max_items,
+        projection=attribute_keys,
+        retry_policy=retry_policy,
     )
 
-    records = [source.from_row(row) for row in result.rows or []]
+    records = [source.from_row(row, attribute_keys) for row in result.rows or []]
     return recorder.PagedRecordResponse(
         request=result.request,
         pages=result.pages,
@@ -417,6 +964,9 @@ def get_indexed_record(
     table_name: str,
     source: "recorder.Record",
     index: definitions.Index = definitions.Indexes.STANDARD,
+    projection: RecordProjection = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
+    cache: "caching.RecordCache | None" = None,
 ) -> recorder.SingleRecordResponse:
     """Retrieve a single record from a DynamoDB table index using a source record.
 
@@ -425,16 +975,36 @@ def get_indexed_record(
         table_name: The name of the DynamoDB table.
         source: The record containing the key values to query.
         index: The index to query (defaults to STANDARD).
+        projection: Optional column names or Record class limiting the attributes
+            read instead of the whole item.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
+        cache: Optional record cache returning a cached response instead of
+            querying the index when the record was read recently.
 
     Returns:
         SingleRecordResponse containing the first matching deserialized record.
     """
+    if cache is not None:
+        return cache.read(
+            table_name,
+            index,
+            source,
+            projection,
+            lambda: get_indexed_record(
+                client, table_name, source, index, projection, retry_policy
+            ),
+        )
+
     result = get_indexed_records(
         client=client,
         table_name=table_name,
         source=source,
         index=index,
         limit=1,
+        max_items=1,
+        projection=projection,
+        retry_policy=retry_policy,
     )
     return recorder.SingleRecordResponse(
         request=result.request,
@@ -2,16 +2,48 @@ import dataclasses
 import datetime
 import typing
 
-from dynamo_io import _deserializer
-from dynamo_io import _serializer
 from dynamo_io import definitions
+from dynamo_io import sizing
+from dynamo_io.recorder import _plans
+
+
+class _LazyRecord:
+    """
+    Descriptor for the record field of a SingleRecordResponse, which holds
+    the record it was created with or otherwise converts the row of the
+    response into the record with the loader the first time it is read.
+    """
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, instance: typing.Any, owner: typing.Any = None):
+        if instance is None:
+            return None
+        if self.name not in instance.__dict__:
+            row, loader = instance.row, instance.loader
+            instance.__dict__[self.name] = loader(row) if row and loader else None
+        return instance.__dict__[self.name]
+
+    def __set__(self, instance: typing.Any, value: typing.Optional["Record"]):
+        if value is not None:
+            instance.__dict__[self.name] = value
 
 
 @dataclasses.dataclass(frozen=True)
 class SingleRecordResponse(definitions.SingleRowResponse):
-    """Response containing a single record from a DynamoDB operation."""
+    """
+    Response containing a single record from a DynamoDB operation. When
+    created with a loader instead of a record, the record is only converted
+    from the row once it is accessed, so callers that never read it do not
+    pay for deserializing the row.
+    """
 
-    record: typing.Optional["Record"]
+    record: typing.Optional["Record"] = _LazyRecord()  # type: ignore[assignment]
+    #: Converts the row into the record when the record is first accessed.
+    loader: typing.Optional[typing.Callable[[dict], "Record"]] = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
 
     def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
         return {
@@ -42,6 +74,59 @@ class PagedRecordResponse(definitions.PagedRowResponse):
         }
 
 
+@dataclasses.dataclass(frozen=True)
+class BatchRecordResponse(definitions.BatchRowResponse):
+    """Response containing records from DynamoDB batch get operations."""
+
+    #: Records aligned to the order of the source records with None for
+    #: sources that did not exist in the table.
+    records: typing.Tuple[typing.Optional["Record"], ...]
+
+    def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
+        types = list(set([str(type(r)) for r in self.records or [] if r]))
+        return {
+            "record_count": len(self.records or []),
+            "record_types": types,
+            **super(BatchRecordResponse, self).to_debug_dict(),
+        }
+
+
+class StreamedRecordResponse(definitions.StreamedRowResponse):
+    """
+    Response that yields records page by page as they are returned from a
+    paginated DynamoDB query. Rows that do not convert into a record are
+    skipped, but are still counted in the row count.
+    """
+
+    def __init__(
+        self,
+        request: dict,
+        pages: typing.Iterable[dict],
+        converter: typing.Callable[[dict], typing.Optional["Record"]],
+    ):
+        super(StreamedRecordResponse, self).__init__(request=request, pages=pages)
+        #: Number of records yielded so far.
+        self.record_count = 0
+        self._converter = converter
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return self.iter_records()
+
+    def iter_records(self) -> typing.Iterator["Record"]:
+        """Yields the records converted from each row as pages are consumed."""
+        for row in self.iter_rows():
+            record = self._converter(row)
+            if record is not None:
+                self.record_count += 1
+                yield record
+
+    def to_debug_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "record_count": self.record_count,
+            **super(StreamedRecordResponse, self).to_debug_dict(),
+        }
+
+
 @dataclasses.dataclass(frozen=True)
 class ScannedRecordResponse(definitions.ScannedRowResponse):
     """Response containing records from a DynamoDB table scan operation."""
@@ -57,6 +142,59 @@ class ScannedRecordResponse(definitions.ScannedRowResponse):
         }
 
 
+class UpdateRequest(typing.NamedTuple):
+    """Arguments of a DynamoDB update item request for upserting a record."""
+
+    #: Table key identifying the item to update.
+    key: typing.Dict[str, typing.Dict[str, typing.Any]]
+    #: Expression attribute names following the `#kN` format.
+    names: typing.Dict[str, str]
+    #: Expression attribute values following the `:vN` format.
+    values: typing.Dict[str, typing.Dict[str, typing.Any]]
+    #: Update expression setting and removing the attributes.
+    expression: str
+
+    def to_request(self, table_name: str) -> typing.Dict[str, typing.Any]:
+        """Returns the keyword arguments of an update call for the table."""
+        return {
+            "TableName": table_name,
+            "Key": self.key,
+            "ExpressionAttributeNames": self.names,
+            "ExpressionAttributeValues": self.values,
+            "UpdateExpression": self.expression,
+        }
+
+
+def _join_update_expression(clauses: typing.Dict[str, typing.List[str]]) -> str:
+    """
+    Joins the actions of the SET, REMOVE, ADD and DELETE clauses into a
+    single update expression, leaving out clauses without actions.
+    """
+    return " ".join(
+        "{} {}".format(keyword, ", ".join(actions))
+        for keyword, actions in clauses.items()
+        if actions
+    )
+
+
+def _to_update_action(
+    column: _plans.ColumnPlan,
+    key_code: str,
+    value_code: str,
+    value: typing.Any,
+) -> typing.Tuple[str, str, typing.Any]:
+    """
+    Returns the clause keyword, the action and the operand value for
+    updating the column to the value within an update expression.
+    """
+    if isinstance(value, definitions.SpecialOperation):
+        action = f"{key_code} {value_code}"
+        return value.operation.upper(), action, value.value
+    if column.name == "created_at":
+        return "SET", f"{key_code}=if_not_exists({key_code}, {value_code})", value
+    return "SET", f"{key_code}={value_code}", value
+
+
 @dataclasses.dataclass(frozen=True)
 class Record:
     """
@@ -120,6 +258,30 @@ class Record:
         sort_key=definitions.SortColumn("sk", "sk:"),
         columns=tuple(),
     )
+    #: Compiled conversion plan for the record class, which is created when
+    #: first needed. Use the `_get_plan` method to access it.
+    _plan: typing.ClassVar[typing.Optional[_plans.RecordPlan]] = None
+
+    @classmethod
+    def _get_plan(cls) -> _plans.RecordPlan:
+        """
+        Returns the conversion plan compiled for this Record class. Plans
+        are stored on each class separately so that subclasses never use
+        the plan of their parent class, and are recompiled if the schema
+        of the class is replaced.
+        """
+        plan = cls.__dict__.get("_plan")
+        if plan is None or plan.schema is not cls.schema:
+            plan = _plans.compile_plan(cls.schema)
+            cls._plan = plan
+        return plan
+
+    def _get_plan_value(self, column: _plans.ColumnPlan) -> typing.Any:
+        """Returns the value for the planned column like `get_value_for`."""
+        value = getattr(self, column.name, None)
+        if value is None and column.defaults_to_now:
+            return datetime.datetime.utcnow()
+        return value
 
     @property
     def columns(self) -> typing.Tuple[definitions.ColumnType, ...]:
@@ -147,20 +309,10 @@ class Record:
         operations on this Record.
         """
         keys = dict()
-        pk_serialized = _serializer.serialize(
-            self.get_value_for(self.schema.partition_key), self.schema.partition_key
-        )
-        if pk_serialized:
-            keys["pk"] = pk_serialized
-
-        if self.schema.sort_key:
-            sk_serialized = _serializer.serialize(
-                self.get_value_for(self.schema.sort_key),
-                self.schema.sort_key,
-            )
-            if sk_serialized:
-                keys["sk"] = sk_serialized
-
+        for column in self._get_plan().keys:
+            serialized = column.encode(self._get_plan_value(column))
+            if serialized:
+                keys[column.key] = serialized
         return keys
 
     def get_value_for(
@@ -185,16 +337,77 @@ class Record:
         a DynamoDB table. Empty values will be excluded from this record as
         DynamoDB does not accept null fields.
         """
-        ignores = (None, "", definitions.DELETE)
+        ignores = (None, "")
         fields = {
-            (column.key or column.name): _serializer.serialize(
-                value=value, column=column
-            )
-            for column in self.columns
-            if (value := self.get_value_for(column)) not in ignores
+            column.key: column.encode(value)
+            for column in self._get_plan().columns
+            if (value := self._get_plan_value(column)) not in ignores
+            and not isinstance(value, definitions.SpecialOperation)
         }
         return {**self.table_key, **fields}
 
+    def estimated_size_bytes(self) -> int:
+        """
+        Returns the size in bytes of the row that `to_row` creates for the
+        record according to the DynamoDB item size rules, which can be
+        checked against `sizing.MAX_ITEM_SIZE_BYTES` before writing.
+        """
+        return sizing.item_size(self.to_row())
+
+    def to_update_request(self) -> UpdateRequest:
+        """
+        Returns the table key, expression attribute names and values, and
+        the update expression for upserting the record data into DynamoDB,
+        all created in a single pass over the columns of the record. Empty
+        timestamps that default to the current time share the same time.
+
+        Expression names and values follow the `#kN` and `:vN` formats,
+        where N is the index of the column in the schema columns, to prevent
+        actual key names from colliding with the DynamoDB expression
+        language. Values set to `None` are left out of the request and
+        remain unchanged, while values set to an empty string or DELETE
+        are removed. Special operations with a value, such as increments
+        and set additions, are applied atomically with ADD and DELETE
+        clauses instead of replacing the stored value.
+        """
+        now = datetime.datetime.utcnow()
+        names: typing.Dict[str, str] = {}
+        values: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        clauses: typing.Dict[str, typing.List[str]] = {
+            "SET": [],
+            "REMOVE": [],
+            "ADD": [],
+            "DELETE": [],
+        }
+
+        for index, column in enumerate(self._get_plan().columns):
+            value = getattr(self, column.name, None)
+            if value is None and column.defaults_to_now:
+                value = now
+            if value is None:
+                continue
+
+            key_code = f"#k{index}"
+            value_code = f":v{index}"
+            names[key_code] = column.key
+
+            if value in ("", definitions.DELETE):
+                clauses["REMOVE"].append(key_code)
+                continue
+
+            keyword, action, operand = _to_update_action(
+                column, key_code, value_code, value
+            )
+            values[value_code] = typing.cast(dict, column.encode(operand))
+            clauses[keyword].append(action)
+
+        return UpdateRequest(
+            key=self.table_key,
+            names=names,
+            values=values,
+            expression=_join_update_expression(clauses),
+        )
+
     def to_attribute_names(self) -> typing.Dict[str, str]:
         """
         Returns a dictionary containing expression attribute name mappings
@@ -205,11 +418,7 @@ class Record:
         `None` will not be included in the returned dictionary as they are
         intended to be left unchanged.
         """
-        return {
-            f"#k{index}": column.key or column.name
-            for index, column in enumerate(self.columns)
-            if self.get_value_for(column) is not None
-        }
+        return self.to_update_request().names
 
     def to_attribute_values(self) -> typing.Dict[str, typing.Dict[str, str]]:
         """
@@ -221,14 +430,7 @@ class Record:
         `None` will not be included in the returned dictionary as they are
         intended to be left unchanged.
         """
-        ignores = ("", None, definitions.DELETE)
-        # noinspection PyUnboundLocalVariable
-        return {
-            f":v{i}": s
-            for i, column in enumerate(self.columns)
-            if (v := self.get_value_for(column)) not in ignores
-            and (s := _serializer.serialize(v, column)) is not None
-        }
+        return self.to_update_request().values
 
     def to_update_expression(self) -> str:
         """
@@ -240,62 +442,41 @@ class Record:
         methods. Values set to `None` will be left out of this expression
         and remain unchanged.
         """
-        modifications = []
-        removals = []
-
-        for index, column in enumerate(self.columns):
-            key_code = f"#k{index}"
-            value_code = f":v{index}"
-            value = self.get_value_for(column)
-
-            if value is None:
-                continue
-            elif value in ("", definitions.DELETE):
-                removals.append(key_code)
-            elif column.name == "created_at":
-                modifications.append(
-                    f"{key_code}=if_not_exists({key_code}, {value_code})"
-                )
-            else:
-                modifications.append(f"{key_code}={value_code}")
-
-        set_expression = "SET {}".format(", ".join(modifications))
-        remove_expression = "REMOVE {}".format(", ".join(removals))
-        return " ".join(
-            [
-                set_expression if len(modifications) > 0 else "",
-                remove_expression if len(removals) > 0 else "",
-            ]
-        ).strip()
+        return self.to_update_request().expression
 
     @classmethod
-    def from_row(cls, row: dict) -> "Record":
+    def from_row(
+        cls,
+        row: dict,
+        projection: typing.Optional[typing.Collection[str]] = None,
+    ) -> "Record":
         """
         Converts a DynamoDB row item response object into an instance of
         this Record class.
-        """
-        keys = {}
-
-        pk = cls.schema.partition_key
-        if not pk.computed:
-            keys[pk.name] = _deserializer.deserialize(row[pk.key], pk)
-
-        sk = cls.schema.sort_key
-        if sk and not sk.computed:
-            keys[sk.name] = _deserializer.deserialize(row[sk.key], sk)
 
+        :param row:
+            A DynamoDB row record.
+        :param projection:
+            Attribute keys the row was read with, if it was read with a
+            projection. Timestamps excluded by the projection remain empty
+            instead of defaulting to the current time.
+        """
+        plan = cls._get_plan()
+        keys = {c.name: c.decode(row[c.key]) for c in plan.loaded_keys}
+        # Loaded columns already exclude computed columns, which are
+        # effectively read only, and columns that share a name with a key,
+        # e.g. wanting to store accountId in both the key and a field.
         fields = {
-            c.name: _deserializer.deserialize(row[c.key or c.name], c)
-            for c in cls.schema.all_columns
-            if (c.key or c.name) in row
-            # Field names can duplicate names in the primary keys, e.g.
-            # wanting to store accountId in both the key and a field. To
-            # avoid issues, we ignore fields that are already populated by
-            # the key (a many to one scenario).
-            and c.name not in keys
-            # Fields can be computed from other fields and are effectively
-            # read only. Those fields should not be included in the record.
-            and not c.computed
+            c.name: c.decode(row[c.key]) for c in plan.loaded_columns if c.key in row
+        }
+        # Timestamps projected out of the row should remain empty instead
+        # of defaulting to the current time as they would for new records.
+        timestamps = {
+            c.name: None
+            for c in plan.loaded_columns
+            if projection is not None
+            and c.name in ("created_at", "updated_at")
+            and c.key not in projection
         }
         # noinspection PyArgumentList
-        return cls(**keys, **fields)
+        return cls(**keys, **{**timestamps, **fields})
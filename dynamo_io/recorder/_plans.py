@@ -0,0 +1,71 @@
+import typing
+
+from dynamo_io import _deserializer
+from dynamo_io import _serializer
+from dynamo_io import definitions
+
+#: Columns that default to the current time when written without a value.
+TIMESTAMP_DEFAULTS = ("created_at", "updated_at")
+
+
+class ColumnPlan(typing.NamedTuple):
+    """Conversion functions for a column resolved when the plan is compiled."""
+
+    #: Name of the record field holding the column value.
+    name: str
+    #: Name of the attribute in the table.
+    key: str
+    #: Serializes a field value into a DynamoDB attribute value.
+    encode: typing.Callable[[typing.Any], typing.Optional[dict]]
+    #: Deserializes a DynamoDB attribute value into a field value.
+    decode: typing.Callable[[dict], typing.Any]
+    #: Whether an empty value defaults to the current time when written.
+    defaults_to_now: bool
+
+
+class RecordPlan(typing.NamedTuple):
+    """Compiled serialization and deserialization plan for a Record class."""
+
+    #: Schema from which the plan was compiled.
+    schema: definitions.Schema
+    #: Plans for the primary key columns in the schema.
+    keys: typing.Tuple[ColumnPlan, ...]
+    #: Plans for all custom and common columns in the schema.
+    columns: typing.Tuple[ColumnPlan, ...]
+    #: Plans for the primary key columns loaded into records.
+    loaded_keys: typing.Tuple[ColumnPlan, ...]
+    #: Plans for the columns loaded into records.
+    loaded_columns: typing.Tuple[ColumnPlan, ...]
+
+
+def _compile_column(column: typing.Any) -> ColumnPlan:
+    """Resolves the conversion functions for the column."""
+    return ColumnPlan(
+        name=column.name,
+        key=column.key or column.name,
+        encode=_serializer.compile_serializer(column),
+        decode=_deserializer.compile_deserializer(column),
+        defaults_to_now=column.name in TIMESTAMP_DEFAULTS,
+    )
+
+
+def compile_plan(schema: definitions.Schema) -> RecordPlan:
+    """
+    Compiles the plan for converting records with the specified schema to
+    and from DynamoDB rows, such that converting each record only iterates
+    over the columns calling the conversion functions resolved here.
+    """
+    compiled = {
+        id(column): _compile_column(column)
+        for column in (schema.partition_key, schema.sort_key, *schema.all_columns)
+        if column
+    }
+    return RecordPlan(
+        schema=schema,
+        keys=tuple(
+            compiled[id(c)] for c in (schema.partition_key, schema.sort_key) if c
+        ),
+        columns=tuple(compiled[id(c)] for c in schema.all_columns),
+        loaded_keys=tuple(compiled[id(c)] for c in schema.loaded_key_columns),
+        loaded_columns=tuple(compiled[id(c)] for c in schema.loaded_columns),
+    )
@@ -0,0 +1,214 @@
+import asyncio
+import dataclasses
+import random
+import time
+import typing
+
+from botocore.client import BaseClient
+
+T = typing.TypeVar("T")
+
+#: Error codes of DynamoDB requests that failed due to throttling, transient
+#: service errors or conflicting transactions, which may succeed if retried.
+RETRYABLE_ERROR_CODES = frozenset(
+    {
+        "InternalServerError",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "ServiceUnavailable",
+        "ThrottlingException",
+        "TransactionConflictException",
+    }
+)
+
+#: Cancellation reason codes of canceled transactions that may succeed if
+#: retried. Transactions canceled for any other reason, such as a failed
+#: condition check, are not retried.
+RETRYABLE_CANCELLATION_CODES = frozenset(
+    {
+        "None",
+        "ProvisionedThroughputExceeded",
+        "ThrottlingError",
+        "TransactionConflict",
+    }
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Defines how DynamoDB requests are retried when they are throttled or
+    otherwise fail transiently, and how batch requests retry unprocessed
+    items. Delays between attempts use exponential backoff with full jitter,
+    where each delay is a random duration between zero and the exponential
+    backoff cap, which spreads out the retries of concurrent callers. The
+    first attempt is never delayed.
+    """
+
+    #: Maximum number of attempts, including the first attempt.
+    max_attempts: int = 10
+    #: Delay cap in seconds for the first retry, doubling for each retry.
+    base_delay: float = 0.05
+    #: Largest delay cap in seconds for any single retry.
+    max_delay: float = 5.0
+    #: Seconds after which no further retries are started, or None to only
+    #: limit the number of attempts.
+    max_elapsed: typing.Optional[float] = 30.0
+    #: Error codes of failed requests that are retried.
+    retryable_error_codes: typing.FrozenSet[str] = RETRYABLE_ERROR_CODES
+    #: Cancellation reason codes of canceled transactions that are retried.
+    retryable_cancellation_codes: typing.FrozenSet[str] = RETRYABLE_CANCELLATION_CODES
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Returns a random delay in seconds before the specified attempt.
+
+        :param attempt:
+            Zero-based number of the attempt that is about to be made.
+        """
+        if attempt <= 0:
+            return 0.0
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Determines whether the error raised by a DynamoDB request is one that
+        may succeed if the request is retried.
+
+        :param error:
+            Error raised by a boto client call.
+        """
+        response = getattr(error, "response", None) or {}
+        code = (response.get("Error") or {}).get("Code")
+        if code in self.retryable_error_codes:
+            return True
+
+        if code != "TransactionCanceledException":
+            return False
+
+        reasons = response.get("CancellationReasons") or []
+        codes = {r.get("Code") or "None" for r in reasons}
+        return bool(codes - {"None"}) and codes <= self.retryable_cancellation_codes
+
+    def delays(self) -> typing.Iterator[float]:
+        """
+        Yields the delay in seconds to wait before each attempt, until the
+        maximum number of attempts is reached or the next retry would start
+        after the maximum elapsed time. Callers wait for each delay before
+        making the attempt and stop iterating once an attempt succeeds.
+        """
+        started = time.monotonic()
+        for attempt in range(self.max_attempts):
+            delay = self.get_delay(attempt)
+            elapsed = time.monotonic() - started
+            if attempt and self.max_elapsed is not None:
+                if elapsed + delay > self.max_elapsed:
+                    return
+            yield delay
+
+    def attempts(self) -> typing.Iterator[int]:
+        """
+        Yields the zero-based number of each attempt, sleeping before each
+        retry, until the maximum number of attempts is reached or the next
+        retry would start after the maximum elapsed time. Callers should stop
+        iterating once an attempt succeeds.
+        """
+        for attempt, delay in enumerate(self.delays()):
+            if delay:
+                time.sleep(delay)
+            yield attempt
+
+    def call(self, function: typing.Callable[..., T], *args, **kwargs) -> T:
+        """
+        Calls the function with the arguments, retrying it while it raises
+        retryable errors. The last error is raised if no attempts remain.
+
+        :param function:
+            Boto client method or other function making a DynamoDB request.
+        """
+        error: typing.Optional[Exception] = None
+        for _ in self.attempts():
+            try:
+                return function(*args, **kwargs)
+            except Exception as caught:
+                if not self.is_retryable(caught):
+                    raise
+                error = caught
+        raise typing.cast(Exception, error)
+
+    async def call_async(
+        self,
+        function: typing.Callable[..., typing.Awaitable[T]],
+        *args,
+        **kwargs,
+    ) -> T:
+        """
+        Awaits the coroutine function with the arguments, retrying it while
+        it raises retryable errors and waiting between attempts without
+        blocking the event loop. The last error is raised if no attempts
+        remain.
+
+        :param function:
+            Async client method or other coroutine function making a
+            DynamoDB request.
+        """
+        error: typing.Optional[Exception] = None
+        for delay in self.delays():
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                return await function(*args, **kwargs)
+            except Exception as caught:
+                if not self.is_retryable(caught):
+                    raise
+                error = caught
+        raise typing.cast(Exception, error)
+
+
+#: Retry policy used when none is specified.
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def paginate(
+    client: BaseClient,
+    operation: str,
+    request: dict,
+    retry_policy: typing.Optional[RetryPolicy] = None,
+) -> typing.Iterator[dict]:
+    """
+    Yields the pages of the paginated operation using the client paginator.
+    If fetching a page fails with a retryable error, pagination is resumed
+    after the last page that was yielded according to the retry policy.
+    Every page has its own retry budget, so slow consumers of long
+    paginations are retried the same as short ones.
+
+    :param client:
+        Boto client used to paginate the operation.
+    :param operation:
+        Name of the paginated operation, e.g. "query" or "scan".
+    :param request:
+        Arguments of the paginated operation request.
+    :param retry_policy:
+        Policy for retrying failed page requests.
+    """
+    policy = retry_policy or DEFAULT_RETRY_POLICY
+    start_key = request.get("ExclusiveStartKey")
+    pages: typing.Optional[typing.Iterator[dict]] = None
+
+    def next_page() -> typing.Optional[dict]:
+        nonlocal pages
+        if pages is None:
+            resumed = (
+                {**request, "ExclusiveStartKey": start_key} if start_key else request
+            )
+            pages = iter(client.get_paginator(operation).paginate(**resumed))
+        try:
+            return next(pages, None)
+        except Exception:
+            pages = None
+            raise
+
+    while (page := policy.call(next_page)) is not None:
+        yield page
+        start_key = page.get("LastEvaluatedKey")
@@ -0,0 +1,116 @@
+import decimal
+import math
+import typing
+
+#: Largest item size in bytes that DynamoDB accepts, including attribute names.
+MAX_ITEM_SIZE_BYTES = 400 * 1024
+
+#: Bytes of item size covered by one write capacity unit.
+WRITE_UNIT_BYTES = 1024
+
+#: Bytes of item size covered by one strongly consistent read capacity unit.
+READ_UNIT_BYTES = 4096
+
+#: Fixed overhead in bytes of list and map attribute values.
+_DOCUMENT_OVERHEAD_BYTES = 3
+
+_SET_TYPES = ("SS", "NS", "BS")
+
+
+def _text_size(value: typing.Union[str, bytes, bytearray]) -> int:
+    """Returns the size of a string in UTF-8 encoding or of binary data."""
+    return len(value.encode("utf-8") if isinstance(value, str) else value)
+
+
+def _number_size(value: str) -> int:
+    """
+    Returns the size of a number, which is one byte per two significant
+    digits plus one byte, with leading and trailing zeroes trimmed.
+    """
+    digits = len(decimal.Decimal(value).normalize().as_tuple().digits)
+    return (digits + 1) // 2 + 1
+
+
+def _scalar_size(data_type: str, value: typing.Any) -> int:
+    """Returns the size of a string, number, binary, boolean or null value."""
+    if data_type == "N":
+        return _number_size(value)
+    if data_type in ("BOOL", "NULL"):
+        return 1
+    return _text_size(value)
+
+
+def attribute_value_size(value: dict) -> int:
+    """
+    Returns the size in bytes of a serialized DynamoDB attribute value
+    following the DynamoDB item size rules. Lists and maps have a fixed
+    overhead plus one byte per element, and the keys of maps count as
+    attribute names.
+
+    :param value:
+        Attribute value in the low-level format, e.g. `{"S": "foo"}`.
+    """
+    data_type, data = next(iter(value.items()))
+    if data_type in _SET_TYPES:
+        return sum(_scalar_size(data_type[0], element) for element in data)
+    if data_type == "L":
+        elements = [attribute_value_size(element) for element in data]
+        return _DOCUMENT_OVERHEAD_BYTES + len(elements) + sum(elements)
+    if data_type == "M":
+        return _DOCUMENT_OVERHEAD_BYTES + len(data) + item_size(data)
+    return _scalar_size(data_type, data)
+
+
+def item_size(row: dict) -> int:
+    """
+    Returns the size in bytes of a serialized row, such as the output of
+    `Record.to_row`, as the sum of its attribute name and value sizes.
+    """
+    return sum(_text_size(k) + attribute_value_size(v) for k, v in row.items())
+
+
+def check_item_size(row: dict) -> int:
+    """
+    Returns the size in bytes of the serialized row, raising a ValueError
+    if it exceeds the maximum size DynamoDB accepts for an item.
+    """
+    size = item_size(row)
+    if size > MAX_ITEM_SIZE_BYTES:
+        raise ValueError(
+            f"Item size of {size} bytes exceeds the maximum of "
+            f"{MAX_ITEM_SIZE_BYTES} bytes."
+        )
+    return size
+
+
+def write_capacity_units(size: int, transactional: bool = False) -> int:
+    """
+    Returns the write capacity units consumed by writing an item of the
+    specified size in bytes, which is one unit per started kilobyte and
+    twice that within transactions.
+    """
+    units = max(1, math.ceil(size / WRITE_UNIT_BYTES))
+    return units * 2 if transactional else units
+
+
+def read_capacity_units(
+    size: int,
+    consistent_read: bool = False,
+    transactional: bool = False,
+) -> float:
+    """
+    Returns the read capacity units consumed by reading the specified size
+    in bytes, which is one unit per started 4 kilobytes for strongly
+    consistent reads, half that for eventually consistent reads and twice
+    that within transactions. For queries and scans the size is the total
+    size of the items read.
+    """
+    units = max(1, math.ceil(size / READ_UNIT_BYTES))
+    if transactional:
+        return float(units * 2)
+    return float(units) if consistent_read else units / 2
+
+
+def batch_write_capacity_units(rows: typing.Iterable[dict]) -> int:
+    """Returns the write capacity units consumed by putting the rows."""
+    return sum(write_capacity_units(item_size(row)) for row in rows)
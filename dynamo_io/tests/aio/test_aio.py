@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+import dynamo_io as dio
+from dynamo_io import aio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _foo(index: int) -> fixtures.Foo:
+    """Creates a record with a distinct key in the same partition."""
+    return fixtures.Foo(
+        first_key="first:a", second_key=f"second:{index}", foo_bar=index
+    )
+
+
+def test_aio_reads():
+    """Should read rows and records with an async client."""
+    client = mock.AsyncMockDynamoClient()
+    dio.insert_records(client.client, "foo", [_foo(index) for index in range(5)])
+
+    async def read():
+        record = await aio.get_record(client, "foo", _foo(1))
+        rows = await aio.get_rows_for_partition(client, "foo", "first:a", limit=2)
+        records = await aio.get_records_for_partition(
+            client, "foo", "first:a", record_classes=[fixtures.Foo], max_items=3
+        )
+        streamed = [
+            r.foo_bar
+            async for r in aio.iter_records_for_partition(
+                client, "foo", "first:a", record_classes=[fixtures.Foo], limit=2
+            )
+        ]
+        return record, rows, records, streamed
+
+    record, rows, records, streamed = asyncio.run(read())
+    assert record.record.foo_bar == 1
+    assert len(rows.rows) == 5 and len(rows.pages) == 3
+    assert [r.foo_bar for r in records.records] == [0, 1, 2]
+    assert streamed == [0, 1, 2, 3, 4]
+
+
+def test_aio_writes():
+    """Should write records with an async client."""
+    client = mock.AsyncMockDynamoClient()
+
+    async def write():
+        inserted = await aio.insert_records(
+            client, "foo", (_foo(index) for index in range(60)), max_workers=4
+        )
+        upserted = await aio.upsert(client, "foo", _foo(60))
+        await aio.remove(client, "foo", _foo(0))
+        await aio.transacts(client, "foo", puts=[_foo(61)], deletes=[_foo(1)])
+        return inserted, upserted
+
+    inserted, upserted = asyncio.run(write())
+    assert [s.batch for s in inserted.batches] == [0, 1, 2]
+    assert inserted.item_count == 60
+    assert upserted.record.foo_bar == 60
+    assert len(client.table.rows) == 60
+
+
+def test_aio_concurrent_lookups():
+    """Should share the event loop between concurrent lookups."""
+    client = mock.AsyncMockDynamoClient(latency=0.001)
+    dio.insert_records(client.client, "foo", [_foo(index) for index in range(20)])
+
+    async def read():
+        lookups = (aio.get_record(client, "foo", _foo(i)) for i in range(20))
+        return await asyncio.gather(*lookups)
+
+    responses = asyncio.run(read())
+    assert [r.record.foo_bar for r in responses] == list(range(20))
+
+
+def test_aio_retries():
+    """Should retry throttled requests without blocking the event loop."""
+    error = ClientError({"Error": {"Code": "ThrottlingException"}}, "DeleteItem")
+    client = AsyncMock()
+    client.delete_item.side_effect = [error, {}]
+    policy = dio.RetryPolicy(base_delay=0.001)
+
+    asyncio.run(aio.remove(client, "foo", _foo(0), retry_policy=policy))
+    assert client.delete_item.call_count == 2
+
+
+def test_aio_insert_records_failed_batch():
+    """Should stop writing the other batches once one batch fails."""
+    calls = []
+
+    async def batch_write_item(RequestItems: dict) -> dict:
+        calls.append(RequestItems)
+        if len(calls) == 1:
+            raise ValueError("foo")
+        await asyncio.sleep(0.01)
+        return {}
+
+    client = AsyncMock()
+    client.batch_write_item.side_effect = batch_write_item
+
+    async def write():
+        records = [_foo(i) for i in range(6)]
+        with pytest.raises(ValueError):
+            await aio.insert_records(
+                client, "foo", records, max_workers=2, batch_size=1
+            )
+        await asyncio.sleep(0.1)
+
+    asyncio.run(write())
+    assert len(calls) == 2
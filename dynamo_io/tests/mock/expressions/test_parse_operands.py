@@ -0,0 +1,34 @@
+from dynamo_io.mock import _expressions
+
+
+def test_parse_adds_and_deletes():
+    """Should extract the operands of the ADD and DELETE clauses."""
+    expression = "SET #k0=:v0 ADD #k1 :v1, #k2  :v2 DELETE #k3 :v3"
+    assert _expressions.parse_adds(expression) == [
+        _expressions.Update("ADD", "#k1", ":v1", "add"),
+        _expressions.Update("ADD", "#k2", ":v2", "add"),
+    ]
+    assert _expressions.parse_deletes(expression) == [
+        _expressions.Update("DELETE", "#k3", ":v3", "delete"),
+    ]
+
+
+def test_row_update_add_and_delete():
+    """Should add to numbers and sets and delete from sets."""
+    out = _expressions.row_update_from_expression(
+        expression="ADD #k0 :v0, #k1 :v1, #k2 :v2 DELETE #k3 :v3, #k4 :v4",
+        names={"#k0": "a", "#k1": "b", "#k2": "c", "#k3": "d", "#k4": "e"},
+        values={
+            ":v0": {"N": "-2"},
+            ":v1": {"N": "1.5"},
+            ":v2": {"SS": ["y", "z"]},
+            ":v3": {"SS": ["x"]},
+            ":v4": {"NS": ["1"]},
+        },
+        existing_row={"a": {"N": "5"}, "c": {"SS": ["x", "y"]}, "d": {"SS": ["x"]}},
+    )
+    assert out == {
+        "a": {"N": "3"},
+        "b": {"N": "1.5"},
+        "c": {"SS": ["x", "y", "z"]},
+    }
@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+from dynamo_io import mock
+
+
+def _row(sort_key: str) -> dict:
+    """Creates a raw row in the foo partition."""
+    return {"pk": mock.string("foo"), "sk": mock.string(sort_key)}
+
+
+def test_shared_table():
+    """Should read and write the table of the wrapped synchronous client."""
+    client = mock.MockDynamoClient()
+    client.table.add_row(_row("bar"))
+    async_client = mock.AsyncMockDynamoClient(client)
+
+    async def run():
+        async with async_client as c:
+            item = await c.get_item(TableName="NA", Key=_row("bar"))
+            await c.batch_write_item(
+                RequestItems={"NA": [{"PutRequest": {"Item": _row("baz")}}]}
+            )
+            return item
+
+    assert asyncio.run(run())["Item"] == _row("bar")
+    assert async_client.table is client.table
+    assert len(client.table.rows) == 2
+    assert async_client.call_count == 2
+
+
+def test_async_paginator():
+    """Should yield the pages of the paginated operation asynchronously."""
+    client = mock.AsyncMockDynamoClient()
+    client.table.add_rows(*(_row(f"bar{i}") for i in range(5)))
+
+    async def run():
+        paginator = client.get_paginator("scan")
+        return [p async for p in paginator.paginate(TableName="NA", Limit=2)]
+
+    pages = asyncio.run(run())
+    assert [len(p["Items"]) for p in pages] == [2, 2, 1]
+
+
+def test_latency():
+    """Should wait for the latency concurrently across calls."""
+    client = mock.AsyncMockDynamoClient(latency=0.05)
+    client.table.add_row(_row("bar"))
+
+    async def run():
+        calls = (client.get_item(TableName="NA", Key=_row("bar")) for _ in range(10))
+        return await asyncio.gather(*calls)
+
+    started = time.monotonic()
+    responses = asyncio.run(run())
+    elapsed = time.monotonic() - started
+    assert len(responses) == 10
+    assert 0.05 <= elapsed < 0.5
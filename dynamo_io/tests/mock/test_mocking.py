@@ -116,3 +116,35 @@ def test_get_indexed_row(client: m.MockDynamoClient):
         index=dio.Indexes.G1_PARTITION,
     )
     assert result.row["sk"]["S"] in ("bar1", "bar2")
+
+
+def test_query_max_items(client: m.MockDynamoClient):
+    """Should page through the partition until max items are returned."""
+    result = dio.get_rows_for_partition(
+        client=client,
+        table_name="NA",
+        partition_key_value="foo",
+        limit=2,
+        max_items=3,
+    )
+    assert [r["sk"]["S"] for r in result.rows] == ["bar1", "bar2", "bar3"]
+    assert len(result.pages) == 2
+
+
+def test_query_cursor(client: m.MockDynamoClient):
+    """Should page through the partition by resuming from cursors."""
+    sort_keys = []
+    cursor = None
+    for _ in range(3):
+        result = dio.get_rows_for_partition(
+            client=client,
+            table_name="NA",
+            partition_key_value="foo",
+            max_items=2,
+            cursor=cursor,
+        )
+        sort_keys += [r["sk"]["S"] for r in result.rows]
+        cursor = result.cursor
+
+    assert cursor is None
+    assert sort_keys == ["bar1", "bar2", "bar3", "baz4", "baz5"]
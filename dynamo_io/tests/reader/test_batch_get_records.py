@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _row(first: str, second: str) -> dict:
+    return {
+        "pk": {"S": first},
+        "sk": {"S": second},
+        "created_at": {"S": "2020-01-01T01:01:01Z"},
+        "updated_at": {"S": "2020-01-01T01:01:01Z"},
+    }
+
+
+def test_batch_get_records():
+    """Should return records aligned to the sources including missing keys."""
+    client = mock.MockDynamoClient()
+    client.table.add_rows(*[_row("first:a", f"second:{i}") for i in range(150)])
+
+    sources = [
+        fixtures.Foo(first_key="first:a", second_key=f"second:{i}")
+        for i in (149, 3, 200, 3, *range(120))
+    ]
+    result = dio.batch_get_records(client, "foo", sources, max_workers=2)
+
+    assert len(result.records) == len(sources)
+    assert result.records[0].second_key == "second:149"
+    assert result.records[1].second_key == "second:3"
+    assert result.records[2] is None
+    assert result.records[3] == result.records[1]
+    assert len(result.responses) == 2
+    assert len(result.request["RequestItems"]["foo"]["Keys"]) == 122
+
+
+@patch("time.sleep")
+def test_batch_get_records_unprocessed(sleep: MagicMock):
+    """Should retry unprocessed keys until all have been retrieved."""
+    key = {"pk": {"S": "first:a"}, "sk": {"S": "second:b"}}
+    client = MagicMock()
+    client.batch_get_item.side_effect = [
+        {"Responses": {"foo": []}, "UnprocessedKeys": {"foo": {"Keys": [key]}}},
+        {"Responses": {"foo": [_row("first:a", "second:b")]}},
+    ]
+
+    result = dio.batch_get_records(
+        client, "foo", [fixtures.Foo(first_key="first:a", second_key="second:b")]
+    )
+
+    assert result.records[0].second_key == "second:b"
+    assert client.batch_get_item.call_count == 2
+    assert sleep.call_count == 1
+
+
+@patch("time.sleep")
+def test_batch_get_records_failed(sleep: MagicMock):
+    """Should raise an error if keys remain unprocessed."""
+    key = {"pk": {"S": "first:a"}, "sk": {"S": "second:b"}}
+    client = MagicMock()
+    client.batch_get_item.return_value = {
+        "Responses": {"foo": []},
+        "UnprocessedKeys": {"foo": {"Keys": [key]}},
+    }
+
+    with pytest.raises(RuntimeError):
+        dio.batch_get_records(
+            client, "foo", [fixtures.Foo(first_key="first:a", second_key="second:b")]
+        )
@@ -6,21 +6,19 @@ from dynamo_io.tests import fixtures
 
 
 def test_get_indexed_record():
-    """Should get indexed record via a query on a GSI."""
+    """Should get indexed record via a single query page on a GSI."""
     client = MagicMock()
-    paginator = client.get_paginator.return_value
-    paginator.paginate.return_value = [
-        {
-            "Items": [
-                {
-                    "pk": {"S": "first:foo"},
-                    "sk": {"S": "second:foo"},
-                    "g1k": {"S": "third:foo"},
-                    "foo_bar": {"N": "42"},
-                }
-            ]
-        }
-    ]
+    client.query.return_value = {
+        "Items": [
+            {
+                "pk": {"S": "first:foo"},
+                "sk": {"S": "second:foo"},
+                "g1k": {"S": "third:foo"},
+                "foo_bar": {"N": "42"},
+            }
+        ],
+        "LastEvaluatedKey": {"pk": {"S": "first:foo"}},
+    }
 
     result = dio.get_indexed_record(
         client=client,
@@ -38,7 +36,8 @@ def test_get_indexed_record():
     assert record.third_key == "third:foo"
     assert record.foo_bar == 42
 
-    query_kwargs = paginator.paginate.call_args[1]
+    assert client.query.call_count == 1
+    query_kwargs = client.query.call_args[1]
     assert query_kwargs == {
         "TableName": "FAKE",
         "ExpressionAttributeNames": {"#k0": "g1k", "#k1": "pk"},
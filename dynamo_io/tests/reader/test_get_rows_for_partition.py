@@ -0,0 +1,182 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _page(count: int, last_key: str | None) -> dict:
+    page: dict = {"Items": [{"pk": {"S": "a"}, "sk": {"S": "b"}}] * count}
+    if last_key:
+        page["LastEvaluatedKey"] = {"pk": {"S": "a"}, "sk": {"S": last_key}}
+    return page
+
+
+def test_get_rows_for_partition_max_items():
+    """Should stop requesting pages once max items rows have been read."""
+    client = MagicMock()
+    client.query.side_effect = [_page(4, "x"), _page(4, "y"), _page(2, "z")]
+
+    result = dio.get_rows_for_partition(
+        client=client,
+        table_name="foo",
+        partition_key_value="a",
+        limit=4,
+        max_items=10,
+    )
+
+    assert len(result.rows) == 10
+    assert client.query.call_count == 3
+    assert client.get_paginator.call_count == 0
+
+    limits = [c[1]["Limit"] for c in client.query.call_args_list]
+    assert limits == [4, 4, 2]
+
+    last_request = client.query.call_args_list[-1][1]
+    assert last_request["ExclusiveStartKey"] == {"pk": {"S": "a"}, "sk": {"S": "y"}}
+
+
+def test_get_rows_for_partition_max_items_exhausted():
+    """Should stop when the partition runs out before max items."""
+    client = MagicMock()
+    client.query.side_effect = [_page(3, "x"), _page(1, None)]
+
+    result = dio.get_rows_for_partition(
+        client=client,
+        table_name="foo",
+        partition_key_value="a",
+        max_items=10,
+    )
+
+    assert len(result.rows) == 4
+    assert client.query.call_count == 2
+    assert [c[1]["Limit"] for c in client.query.call_args_list] == [10, 7]
+
+
+def test_get_rows_for_partition_cursor():
+    """Should resume the query from the cursor of a previous response."""
+    client = MagicMock()
+    client.query.side_effect = [_page(2, "x"), _page(2, None)]
+
+    first = dio.get_rows_for_partition(
+        client=client,
+        table_name="foo",
+        partition_key_value="a",
+        max_items=2,
+    )
+    assert first.last_evaluated_key == {"pk": {"S": "a"}, "sk": {"S": "x"}}
+
+    second = dio.get_rows_for_partition(
+        client=client,
+        table_name="foo",
+        partition_key_value="a",
+        max_items=2,
+        cursor=first.cursor,
+    )
+    assert second.cursor is None
+    assert client.query.call_args[1]["ExclusiveStartKey"] == {
+        "pk": {"S": "a"},
+        "sk": {"S": "x"},
+    }
+
+
+def _resumable_client() -> mock.MockDynamoClient:
+    """Creates a mock client with three rows in the first:a partition."""
+    client = mock.MockDynamoClient()
+    dio.insert_records(
+        client,
+        "foo",
+        [fixtures.Foo(first_key="first:a", second_key=f"second:{i}") for i in "abc"],
+    )
+    return client
+
+
+def test_get_rows_for_partition_resume_paginated():
+    """Should resume from a cursor or start key without max items."""
+    client = _resumable_client()
+    first = dio.get_rows_for_partition(client, "foo", "first:a", max_items=1)
+    assert [r["sk"]["S"] for r in first.rows] == ["second:a"]
+
+    from_cursor = dio.get_rows_for_partition(
+        client, "foo", "first:a", limit=1, cursor=first.cursor
+    )
+    from_key = dio.get_rows_for_partition(
+        client, "foo", "first:a", exclusive_start_key=first.last_evaluated_key
+    )
+    expected = ["second:b", "second:c"]
+    assert [r["sk"]["S"] for r in from_cursor.rows] == expected
+    assert [r["sk"]["S"] for r in from_key.rows] == expected
+
+
+def test_iter_rows_for_partition_resume_paginated():
+    """Should stream from a cursor or start key without max items."""
+    client = _resumable_client()
+    first = dio.get_rows_for_partition(client, "foo", "first:a", max_items=1)
+
+    from_cursor = dio.iter_rows_for_partition(
+        client, "foo", "first:a", cursor=first.cursor
+    )
+    from_key = dio.iter_rows_for_partition(
+        client, "foo", "first:a", exclusive_start_key=first.last_evaluated_key
+    )
+    expected = ["second:b", "second:c"]
+    assert [r["sk"]["S"] for r in from_cursor.iter_rows()] == expected
+    assert [r["sk"]["S"] for r in from_key.iter_rows()] == expected
+
+
+def test_get_rows_for_partition_cursor_mismatch():
+    """Should reject a cursor that originated from a different query."""
+    client = MagicMock()
+    client.query.return_value = _page(2, "x")
+
+    first = dio.get_rows_for_partition(
+        client=client,
+        table_name="foo",
+        partition_key_value="a",
+        max_items=2,
+    )
+
+    with pytest.raises(ValueError):
+        dio.get_rows_for_partition(
+            client=client,
+            table_name="foo",
+            partition_key_value="b",
+            cursor=first.cursor,
+        )
+
+
+def test_read_entire_table_cursor():
+    """Should start the scan from the decoded cursor."""
+    client = MagicMock()
+    paginator = client.get_paginator.return_value
+    paginator.paginate.return_value = [
+        {"Items": [], "LastEvaluatedKey": {"pk": {"S": "a"}, "sk": {"S": "x"}}},
+        {"Items": []},
+    ]
+
+    first = dio.read_entire_table(client, "foo", max_page_count=0)
+    assert not first.completed
+
+    dio.read_entire_table(client, "foo", cursor=first.cursor)
+    assert paginator.paginate.call_args[1]["ExclusiveStartKey"] == {
+        "pk": {"S": "a"},
+        "sk": {"S": "x"},
+    }
+
+
+def test_get_rows_for_partition_estimates():
+    """Should estimate the size and read capacity of the returned rows."""
+    client = mock.MockDynamoClient()
+    records = [
+        fixtures.Foo(first_key="first:a", second_key=f"second:{i}", foo_bar=i)
+        for i in range(3)
+    ]
+    dio.insert_records(client, "foo", records)
+
+    response = dio.get_rows_for_partition(client, "foo", "first:a")
+
+    expected = sum(r.estimated_size_bytes() for r in records)
+    assert response.estimated_size_bytes == expected
+    assert response.estimated_read_capacity_units == 0.5
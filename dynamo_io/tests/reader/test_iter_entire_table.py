@@ -0,0 +1,86 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+
+
+def _row(segment: int, index: int) -> dict:
+    return {"pk": {"S": f"segment:{segment}"}, "sk": {"S": f"row:{index}"}}
+
+
+def _paginate(**kwargs) -> list:
+    """Returns two pages of two rows for the requested segment."""
+    segment = kwargs["Segment"]
+    last_key = {"pk": {"S": f"segment:{segment}"}, "sk": {"S": "row:1"}}
+    first = {
+        "Items": [_row(segment, 0), _row(segment, 1)],
+        "LastEvaluatedKey": last_key,
+    }
+    second = {"Items": [_row(segment, 2), _row(segment, 3)]}
+    if kwargs.get("ExclusiveStartKey") == last_key:
+        return [second]
+    return [first, second]
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = _paginate
+    return client
+
+
+def test_iter_entire_table():
+    """Should yield the rows of all segments and complete every segment."""
+    client = mock.MockDynamoClient()
+    client.table.add_rows(*[_row(0, i) for i in range(20)])
+
+    result = dio.iter_entire_table(client, "foo", total_segments=3)
+    rows = list(result)
+
+    assert len(rows) == 20
+    assert len({r["sk"]["S"] for r in rows}) == 20
+    assert result.completed
+    assert result.checkpoint is None
+    assert sorted(result.progress) == [0, 1, 2]
+
+
+def test_iter_entire_table_checkpoint():
+    """Should resume incomplete segments from the checkpoint."""
+    client = _client()
+    first = dio.iter_entire_table(client, "foo", total_segments=2, max_workers=1)
+    iterator = iter(first)
+    consumed = [next(iterator) for _ in range(3)]
+    first.close()
+
+    assert not first.completed
+    assert first.row_count == 2
+
+    second = dio.iter_entire_table(
+        client, "foo", total_segments=2, checkpoint=first.checkpoint
+    )
+    remaining = list(second)
+
+    assert second.completed
+    assert len(consumed) + len(remaining) == 9
+
+
+def test_iter_entire_table_checkpoint_mismatch():
+    """Should reject a checkpoint for a different number of segments."""
+    client = _client()
+    first = dio.iter_entire_table(client, "foo", total_segments=2)
+    next(iter(first.iter_pages()))
+    first.close()
+
+    with pytest.raises(ValueError):
+        dio.iter_entire_table(
+            client, "foo", total_segments=3, checkpoint=first.checkpoint
+        )
+
+
+def test_read_entire_table_segmented():
+    """Should stop reading after the max page count across segments."""
+    result = dio.read_entire_table(_client(), "foo", max_page_count=1, total_segments=2)
+    assert len(result.pages) == 2
+    assert not result.completed
+    assert result.checkpoint is not None
@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock
+
+import dynamo_io as dio
+from dynamo_io.tests import fixtures
+
+
+def _row(sort_key: str) -> dict:
+    return {
+        "pk": {"S": "first:abc"},
+        "sk": {"S": sort_key},
+        "created_at": {"S": "2020-01-01T01:01:01Z"},
+        "updated_at": {"S": "2020-01-01T01:01:01Z"},
+    }
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    paginator = client.get_paginator()
+    paginator.paginate.return_value = [
+        {
+            "Items": [_row("second:1"), _row("third:2")],
+            "LastEvaluatedKey": {"pk": {"S": "first:abc"}, "sk": {"S": "third:2"}},
+            "ConsumedCapacity": {"CapacityUnits": 0.5},
+        },
+        {
+            "Items": [_row("second:3")],
+            "ConsumedCapacity": {"CapacityUnits": 0.5},
+        },
+    ]
+    return client
+
+
+def test_iter_rows_for_partition():
+    """Should yield all rows and record the summary metadata."""
+    result = dio.iter_rows_for_partition(
+        client=_client(),
+        table_name="foo",
+        partition_key_value="first:abc",
+    )
+    assert not result.completed
+
+    rows = list(result)
+    assert len(rows) == 3
+    assert result.completed
+    assert result.page_count == 2
+    assert result.row_count == 3
+    assert result.last_evaluated_key is None
+    assert result.consumed_capacity_units == 1.0
+
+
+def test_iter_rows_for_partition_lazy():
+    """Should not request pages until the response is iterated."""
+    client = _client()
+    result = dio.iter_rows_for_partition(
+        client=client,
+        table_name="foo",
+        partition_key_value="first:abc",
+    )
+    assert client.get_paginator().paginate.call_count == 0
+
+    rows = iter(result)
+    next(rows)
+    assert client.get_paginator().paginate.call_count == 1
+    assert result.page_count == 0
+    assert result.last_evaluated_key is None
+
+    next(rows)
+    next(rows)
+    assert result.page_count == 1
+    assert result.last_evaluated_key == {
+        "pk": {"S": "first:abc"},
+        "sk": {"S": "third:2"},
+    }
+
+
+def test_iter_records_for_partition():
+    """Should yield only the rows that match the record classes."""
+    result = dio.iter_records_for_partition(
+        client=_client(),
+        table_name="foo",
+        partition_key_value="first:abc",
+        record_classes=[fixtures.Foo],
+    )
+    records = list(result)
+    assert [r.second_key for r in records] == ["second:1", "second:3"]
+    assert result.row_count == 3
+    assert result.record_count == 2
+    assert result.to_debug_dict()["page_count"] == 2
+
+
+def test_iter_rows_for_partition_resume_mid_page():
+    """Should not skip the rest of a page when resuming from its cursor."""
+    first_key = {"pk": {"S": "first:abc"}, "sk": {"S": "second:2"}}
+    second_key = {"pk": {"S": "first:abc"}, "sk": {"S": "second:4"}}
+    client = MagicMock()
+    client.get_paginator().paginate.return_value = [
+        {"Items": [_row("second:1"), _row("second:2")], "LastEvaluatedKey": first_key},
+        {"Items": [_row("second:3"), _row("second:4")], "LastEvaluatedKey": second_key},
+        {"Items": [_row("second:5")]},
+    ]
+
+    result = dio.iter_rows_for_partition(client, "foo", "first:abc", limit=2)
+    rows = iter(result)
+    assert [next(rows)["sk"]["S"] for _ in range(3)] == [
+        "second:1",
+        "second:2",
+        "second:3",
+    ]
+    assert result.page_count == 1
+    assert result.last_evaluated_key == first_key
+
+    resumed = dio.iter_rows_for_partition(
+        client, "foo", "first:abc", limit=2, cursor=result.cursor
+    )
+    list(resumed)
+    paginate = client.get_paginator().paginate
+    assert paginate.call_args.kwargs["ExclusiveStartKey"] == first_key
@@ -0,0 +1,93 @@
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _row(first: str, second: str) -> dict:
+    return {
+        "pk": {"S": first},
+        "sk": {"S": second},
+        "foo_bar": {"N": "42"},
+        "baz": {"BOOL": True},
+        "created_at": {"S": "2020-01-01T01:01:01Z"},
+        "updated_at": {"S": "2020-01-01T01:01:01Z"},
+    }
+
+
+def test_get_record_projection():
+    """Should only read the projected columns along with the keys."""
+    client = mock.MockDynamoClient()
+    client.table.add_rows(_row("first:a", "second:b"))
+
+    source = fixtures.Foo(first_key="first:a", second_key="second:b")
+    result = dio.get_record(client, "foo", source, projection=["foo_bar"])
+
+    assert result.request["ProjectionExpression"] == "#p0, #p1, #p2"
+    assert result.request["ExpressionAttributeNames"] == {
+        "#p0": "pk",
+        "#p1": "sk",
+        "#p2": "foo_bar",
+    }
+    assert set(result.row) == {"pk", "sk", "foo_bar"}
+    assert result.record.foo_bar == 42
+    assert result.record.baz is None
+    assert result.record.created_at is None
+
+
+def test_get_record_without_projection_timestamps():
+    """Should keep the default timestamps of rows read without projection."""
+    client = mock.MockDynamoClient()
+    row = _row("first:a", "second:b")
+    del row["created_at"], row["updated_at"]
+    client.table.add_rows(row)
+
+    source = fixtures.Foo(first_key="first:a", second_key="second:b")
+    result = dio.get_record(client, "foo", source)
+
+    assert result.record.created_at is not None
+    assert result.record.updated_at is not None
+
+
+def test_get_records_for_partition_projection():
+    """Should project every row in the partition query."""
+    client = mock.MockDynamoClient()
+    client.table.add_rows(*[_row("first:a", f"second:{i}") for i in range(3)])
+
+    result = dio.get_records_for_partition(
+        client,
+        "foo",
+        "first:a",
+        record_classes=[fixtures.Foo],
+        projection=["baz"],
+    )
+
+    assert len(result.records) == 3
+    assert all(r.baz is True and r.foo_bar is None for r in result.records)
+    assert result.request["KeyConditionExpression"] == "#k0=:v0"
+    assert result.request["ExpressionAttributeNames"]["#k0"] == "pk"
+
+
+def test_batch_get_records_projection():
+    """Should project the keys requested in the batch."""
+    client = mock.MockDynamoClient()
+    client.table.add_rows(_row("first:a", "second:b"))
+
+    source = fixtures.Foo(first_key="first:a", second_key="second:b")
+    result = dio.batch_get_records(client, "foo", [source], projection=["foo_bar"])
+
+    request = result.request["RequestItems"]["foo"]
+    assert request["ProjectionExpression"] == "#p0, #p1, #p2"
+    assert result.records[0].foo_bar == 42
+    assert result.records[0].baz is None
+
+
+def test_get_row_projection_class():
+    """Should project every stored column of a record class."""
+    client = mock.MockDynamoClient()
+    client.table.add_rows({**_row("first:a", "second:b"), "extra": {"S": "x"}})
+
+    source = fixtures.Foo(first_key="first:a", second_key="second:b")
+    result = dio.get_record(client, "foo", source, projection=fixtures.Foo)
+
+    assert "extra" not in result.row
+    assert result.record.foo_bar == 42
@@ -0,0 +1,126 @@
+import threading
+import time
+from concurrent import futures
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import caching
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _run_concurrently(flight: dio.SingleFlight, count: int, read, release):
+    """
+    Starts the reads on threads and releases the in-flight request once
+    every other read is waiting for it, returning the results of the reads.
+    """
+    with futures.ThreadPoolExecutor(count) as executor:
+        pending = [executor.submit(read) for _ in range(count)]
+        deadline = time.monotonic() + 5
+        while flight.shared_count < count - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        return [future.result() for future in pending]
+
+
+def _blocking(function, release: threading.Event):
+    """Wraps the function such that calls wait until released."""
+
+    def call(*args, **kwargs):
+        release.wait(5)
+        return function(*args, **kwargs)
+
+    return MagicMock(side_effect=call)
+
+
+def test_shared_get_item():
+    """Should share one get_item call among concurrent identical reads."""
+    client = mock.MockDynamoClient()
+    dio.upsert(client, "foo", fixtures.Foo(first_key="first:a", second_key="second:a"))
+    release = threading.Event()
+    client.get_item = _blocking(client.get_item, release)  # type: ignore
+    flight = dio.SingleFlight()
+
+    def read():
+        source = fixtures.Foo(first_key="first:a", second_key="second:a")
+        return dio.get_record(client, "foo", source, single_flight=flight)
+
+    responses = _run_concurrently(flight, 5, read, release)
+    assert client.get_item.call_count == 1
+    assert flight.shared_count == 4
+    assert {r.record.second_key for r in responses} == {"second:a"}
+
+    read()
+    assert client.get_item.call_count == 2
+
+
+def test_shared_query():
+    """Should share one query among concurrent identical partition reads."""
+    client = mock.MockDynamoClient()
+    dio.insert_records(
+        client, "foo", [fixtures.Foo(first_key="first:a", second_key="second:a")]
+    )
+    release = threading.Event()
+    client.get_paginator = _blocking(client.get_paginator, release)  # type: ignore
+    flight = dio.SingleFlight()
+
+    def read():
+        return dio.get_rows_for_partition(
+            client, "foo", "first:a", single_flight=flight
+        )
+
+    responses = _run_concurrently(flight, 4, read, release)
+    assert client.get_paginator.call_count == 1
+    assert all(r is responses[0] for r in responses)
+
+
+def test_shared_error():
+    """Should raise the error of the in-flight request in every read."""
+    release = threading.Event()
+    client = MagicMock()
+    client.get_item = _blocking(MagicMock(side_effect=ValueError("foo")), release)
+    flight = dio.SingleFlight()
+
+    def read():
+        with pytest.raises(ValueError):
+            dio.get_row(client, "foo", "first:a", "second:a", single_flight=flight)
+
+    _run_concurrently(flight, 3, read, release)
+    assert client.get_item.call_count == 1
+
+
+def test_not_shared_between_clients():
+    """Should not share in-flight requests made by different clients."""
+    release = threading.Event()
+    clients = [MagicMock(), MagicMock()]
+    for client in clients:
+        client.get_item = _blocking(MagicMock(return_value={}), release)
+    flight = dio.SingleFlight()
+
+    with futures.ThreadPoolExecutor(2) as executor:
+        pending = [
+            executor.submit(
+                dio.get_row, c, "foo", "first:a", "second:a", single_flight=flight
+            )
+            for c in clients
+        ]
+        deadline = time.monotonic() + 5
+        while not all(c.get_item.called for c in clients):
+            if time.monotonic() > deadline:
+                break
+            time.sleep(0.001)
+        release.set()
+        futures.wait(pending)
+    assert flight.shared_count == 0
+    assert all(c.get_item.call_count == 1 for c in clients)
+
+
+def test_key_not_shared_on_reused_ids():
+    """Should key clients by a token that is not reused like their ids."""
+    first, second = MagicMock(), MagicMock()
+    with patch("builtins.id", return_value=1):
+        keys = {caching.single_flight_key(c, "get_item", {}) for c in (first, second)}
+    assert len(keys) == 2
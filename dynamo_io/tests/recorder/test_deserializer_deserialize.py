@@ -84,3 +84,21 @@ def test_deserialize_map():
         "b": True,
         "c": 42,
     }
+
+
+@mark.parametrize("value, expected, data_type", SCENARIOS)
+def test_compile_deserializer(
+    value: str, expected: typing.Any, data_type: dio.DynamoType
+):
+    """Should deserialize the value the same as the deserialize function."""
+    column = dio.Column("foo", data_type)
+    deserialize = _deserializer.compile_deserializer(column)
+    assert deserialize({data_type.value: value}) == expected
+
+
+def test_compile_deserializer_map():
+    """Should deserialize a map column."""
+    column = dio.MapColumn("foo", children=(dio.Column("c", dio.DynamoTypes.INTEGER),))
+    deserialize = _deserializer.compile_deserializer(column)
+    assert deserialize({"M": {"c": {"N": "42"}}}) == {"c": 42}
+    assert _deserializer.compile_deserializer(None)({"S": "x"}) is None
@@ -118,3 +118,35 @@ def test_from_row():
         Expect the special operation to be ignored and the value
         set to None through the to and from record process.
         """
+
+
+def test_record_plans():
+    """Should compile a separate plan for each record class."""
+    foo_plan = fixtures.Foo._get_plan()
+    assert foo_plan is fixtures.Foo._get_plan()
+    assert foo_plan.schema is fixtures.Foo.schema
+    assert [c.key for c in foo_plan.keys] == ["pk", "sk"]
+
+    no_sort_plan = fixtures.FooNoSort._get_plan()
+    assert no_sort_plan is not foo_plan
+    assert [c.key for c in no_sort_plan.keys] == ["pk"]
+    assert [c.name for c in no_sort_plan.loaded_keys] == ["first_key"]
+    assert dio.Record._plan is None
+
+
+def test_to_update_request():
+    """Should produce the key, names, values and expression in one pass."""
+    update = record.to_update_request()
+    assert update.key == record.table_key
+    assert update.names == record.to_attribute_names()
+    assert update.values.keys() == record.to_attribute_values().keys()
+    assert update.values[":v0"] == {"N": "42"}
+    assert update.expression == record.to_update_expression()
+    assert update.to_request("foo")["TableName"] == "foo"
+
+
+def test_to_update_request_timestamps():
+    """Should default both timestamps to the same time."""
+    update = fixtures.Foo(first_key="spam", second_key="ham").to_update_request()
+    assert update.values[":v3"] == update.values[":v4"]
+    assert update.expression == "SET #k3=if_not_exists(#k3, :v3), #k4=:v4"
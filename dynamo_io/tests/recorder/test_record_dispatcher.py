@@ -0,0 +1,51 @@
+import itertools
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io.tests import fixtures
+
+CLASSES = (
+    fixtures.FooAndGsi,
+    fixtures.Foo,
+    fixtures.FooRooted,
+    fixtures.FooSlashes,
+    fixtures.FooNoSort,
+)
+
+ROWS = (
+    {"pk": {"S": "first:a"}, "sk": {"S": "second:b"}},
+    {"pk": {"S": "first:a"}, "sk": {"S": "second:b"}, "g1k": {"S": "third:c"}},
+    {"pk": {"S": "first:a"}, "sk": {"S": "second:b"}, "baz": {"BOOL": True}},
+    {"pk": {"S": "first:a"}, "baz": {"BOOL": True}},
+    {"pk": {"S": ":first:a"}, "sk": {"S": ":second:b"}},
+    {"pk": {"S": "/first/a"}, "sk": {"S": "/second/b"}},
+    {"pk": {"S": "/first/a"}, "sk": {"S": "other:b"}},
+    {"pk": {"S": "first:a"}, "sk": {"S": "second:b"}, "unknown": {"S": "x"}},
+    {"pk": {"S": "other:a"}, "sk": {"S": "second:b"}},
+    {"pk": {"S": "first"}},
+)
+
+
+@pytest.mark.parametrize("classes", list(itertools.permutations(CLASSES, 3)))
+def test_dispatcher_matches_schemas(classes):
+    """Should select the same record class as matching each schema in order."""
+    dispatcher = dio.RecordDispatcher(classes)
+    for row in ROWS:
+        expected = next((c for c in classes if c.schema.matches(row)), None)
+        assert dispatcher.match(row) == expected, row
+
+
+def test_dispatcher_to_record():
+    """Should convert the row into the matching record class."""
+    dispatcher = dio.RecordDispatcher([fixtures.FooNoSort, fixtures.Foo])
+
+    record = dispatcher.to_record(ROWS[2])
+    assert isinstance(record, fixtures.Foo)
+    assert record.baz is True
+    assert dispatcher.to_record(ROWS[8]) is None
+
+
+def test_dispatcher_empty():
+    """Should not match any rows without record classes."""
+    assert dio.RecordDispatcher([]).match(ROWS[0]) is None
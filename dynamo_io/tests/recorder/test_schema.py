@@ -0,0 +1,65 @@
+import dataclasses
+
+import dynamo_io as dio
+from dynamo_io.tests import fixtures
+
+
+@dataclasses.dataclass(frozen=True)
+class Computed(dio.Record):
+    """Test class with computed columns and a field sharing a key name."""
+
+    first_key: dio.TypeHints.KeyColumn = None
+    second_key: dio.TypeHints.KeyColumn = None
+    label: dio.TypeHints.String = None
+
+    schema: dio.SchemaType = dio.Schema(
+        partition_key=dio.PartitionColumn("first_key", "first:"),
+        sort_key=dio.SortColumn("second_key", "second:", computed=True),
+        columns=(
+            dio.Column("first_key", dio.DynamoTypes.STRING, key="fk"),
+            dio.Column("label", dio.DynamoTypes.STRING, computed=True),
+        ),
+    )
+
+
+def test_schema_lookups():
+    """Should compute the column lookups when the schema is created."""
+    schema = fixtures.FooAndGsi.schema
+
+    assert schema.all_columns == (*schema.columns, *schema.common)
+    assert schema.columns_by_key["pk"] is schema.partition_key
+    assert schema.columns_by_key["g1k"].name == "third_key"
+    assert schema.columns_by_name["foo_bar"].key is None
+    assert schema.stored_keys == {
+        "pk",
+        "sk",
+        "g1k",
+        "foo_bar",
+        "created_at",
+        "updated_at",
+        "expires_at",
+    }
+    assert schema.get_column("g1k") == schema.get_column("third_key")
+    assert schema.get_column(None) is None
+
+
+def test_schema_loaded_columns():
+    """Should exclude computed columns and columns duplicating loaded keys."""
+    schema = Computed.schema
+
+    assert schema.loaded_key_columns == (schema.partition_key,)
+    assert [c.name for c in schema.loaded_columns] == [
+        "created_at",
+        "updated_at",
+        "expires_at",
+    ]
+
+
+def test_schema_equality():
+    """Should compare schemas without the derived lookups."""
+    assert fixtures.Foo.schema == dio.Schema(
+        partition_key=fixtures.Foo.schema.partition_key,
+        sort_key=fixtures.Foo.schema.sort_key,
+        columns=fixtures.Foo.schema.columns,
+    )
+    assert hash(fixtures.Foo.schema)
@@ -89,3 +89,28 @@ def test_serialize_none():
     """Should return None for a None value."""
     column = dio.Column("foo", dio.DynamoTypes.STRING)
     assert _serializer.serialize(None, column) is None
+
+
+@mark.parametrize("value, expected, data_type", SCENARIOS)
+def test_compile_serializer(
+    value: str, expected: typing.Any, data_type: dio.DynamoType
+):
+    """Should serialize the value the same as the serialize function."""
+    column = dio.Column("foo", data_type)
+    serialize = _serializer.compile_serializer(column)
+    assert serialize(value) == _serializer.serialize(value, column)
+    assert serialize(None) is None
+    assert serialize("") is None
+
+
+def test_compile_serializer_map():
+    """Should serialize a map column skipping empty children."""
+    column = dio.MapColumn(
+        "foo",
+        children=(
+            dio.Column("a", dio.DynamoTypes.STRING),
+            dio.Column("b", dio.DynamoTypes.INTEGER),
+        ),
+    )
+    serialize = _serializer.compile_serializer(column)
+    assert serialize({"a": "hello", "b": None}) == {"M": {"a": {"S": "hello"}}}
@@ -0,0 +1,309 @@
+import gc
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _foo(second: str = "a", foo_bar: int = 1) -> fixtures.Foo:
+    """Creates a record in the first:a partition."""
+    return fixtures.Foo(
+        first_key="first:a", second_key=f"second:{second}", foo_bar=foo_bar
+    )
+
+
+def _counting_client() -> mock.MockDynamoClient:
+    """Creates a mock client whose get_item calls are counted."""
+    client = mock.MockDynamoClient()
+    client.get_item = MagicMock(side_effect=client.get_item)  # type: ignore
+    return client
+
+
+def test_cache_hit():
+    """Should read a cached record without calling the table again."""
+    client = _counting_client()
+    dio.upsert(client, "foo", _foo())
+    cache = dio.RecordCache()
+
+    first = dio.get_record(client, "foo", _foo(), cache=cache)
+    second = dio.get_record(client, "foo", _foo(), cache=cache)
+    assert second is first
+    assert first.record.foo_bar == 1
+    assert client.get_item.call_count == 1
+    assert (cache.hit_count, cache.miss_count) == (1, 1)
+
+
+def test_cache_keys():
+    """Should cache reads separately per projection and table."""
+    client = _counting_client()
+    dio.upsert(client, "foo", _foo())
+    cache = dio.RecordCache()
+
+    dio.get_record(client, "foo", _foo(), cache=cache)
+    dio.get_record(client, "foo", _foo(), projection=["foo_bar"], cache=cache)
+    dio.get_record(client, "bar", _foo(), cache=cache)
+    assert client.get_item.call_count == 3
+    assert len(cache) == 3
+
+
+@patch("time.monotonic")
+def test_cache_ttls(monotonic: MagicMock):
+    """Should expire reads after the TTL of the record class."""
+    monotonic.return_value = 0.0
+    client = _counting_client()
+    dio.upsert(client, "foo", _foo())
+    cache = dio.RecordCache(ttl=100.0, ttls={fixtures.Foo: 10.0})
+    assert cache.get_ttl(fixtures.Foo) == 10.0
+    assert cache.get_ttl(fixtures.FooAndGsi) == 100.0
+
+    dio.get_record(client, "foo", _foo(), cache=cache)
+    monotonic.return_value = 9.0
+    dio.get_record(client, "foo", _foo(), cache=cache)
+    monotonic.return_value = 11.0
+    dio.get_record(client, "foo", _foo(), cache=cache)
+    assert client.get_item.call_count == 2
+
+
+def test_cache_eviction():
+    """Should evict the least recently used reads once full."""
+    client = _counting_client()
+    cache = dio.RecordCache(max_size=2)
+
+    for second in ("a", "b", "a", "c", "a", "b"):
+        dio.get_record(client, "foo", _foo(second), cache=cache)
+    assert client.get_item.call_count == 4
+    assert len(cache) == 2
+
+
+def test_negative_caching():
+    """Should cache misses unless negative caching is disabled."""
+    client = _counting_client()
+    cache = dio.RecordCache()
+    uncached = dio.RecordCache(negative_ttl=0)
+
+    for _ in range(2):
+        assert dio.get_record(client, "foo", _foo(), cache=cache).record is None
+        dio.get_record(client, "foo", _foo("b"), cache=uncached)
+    assert client.get_item.call_count == 3
+
+
+def test_invalidated_by_writes():
+    """Should invalidate cached reads of keys written in this process."""
+    client = _counting_client()
+    cache = dio.RecordCache()
+
+    def read(second: str = "a"):
+        return dio.get_record(client, "foo", _foo(second), cache=cache).record
+
+    assert read() is None
+    assert read("b") is None
+    dio.upsert(client, "foo", _foo(foo_bar=2))
+    assert read().foo_bar == 2
+    dio.insert_records(client, "foo", [_foo("b", foo_bar=3)])
+    assert read("b").foo_bar == 3
+    dio.transacts(client, "foo", updates=[_foo(foo_bar=4)])
+    assert read().foo_bar == 4
+    dio.remove(client, "foo", _foo())
+    assert read() is None
+    assert read("b").foo_bar == 3
+    assert client.get_item.call_count == 6
+
+
+def test_invalidated_by_partial_batch_write():
+    """Should invalidate rows written before the batch retries ran out."""
+    client = _counting_client()
+    cache = dio.RecordCache()
+    batch_write_item = client.batch_write_item
+
+    def write_first(RequestItems: dict) -> dict:
+        first, *rest = RequestItems["foo"]
+        batch_write_item(RequestItems={"foo": [first]})
+        return {"UnprocessedItems": {"foo": rest} if rest else {}}
+
+    client.batch_write_item = MagicMock(side_effect=write_first)  # type: ignore
+    assert dio.get_record(client, "foo", _foo(), cache=cache).record is None
+    policy = dio.RetryPolicy(max_attempts=1, base_delay=0)
+    with pytest.raises(RuntimeError):
+        dio.insert_records(client, "foo", [_foo("a"), _foo("b")], retry_policy=policy)
+    assert dio.get_record(client, "foo", _foo(), cache=cache).record is not None
+
+
+def test_indexed_record_invalidated():
+    """Should invalidate cached index reads of written rows."""
+    client = mock.MockDynamoClient()
+    cache = dio.RecordCache()
+    record = fixtures.FooAndGsi(
+        first_key="first:a", second_key="second:a", third_key="third:a"
+    )
+
+    def read():
+        return dio.get_indexed_record(
+            client, "foo", record, index=dio.Indexes.G1_PARTITION, cache=cache
+        ).record
+
+    assert read() is None
+    dio.upsert(client, "foo", record)
+    assert read().third_key == "third:a"
+    dio.remove(client, "foo", record)
+    assert read() is None
+
+
+def test_cached_despite_concurrent_writes():
+    """Should only skip caching reads whose keys were written in flight."""
+    client = _counting_client()
+    cache = dio.RecordCache()
+    get_item = client.get_item.side_effect
+
+    def write_during_read(second: str):
+        def side_effect(**kwargs):
+            dio.upsert(client, "foo", _foo(second, foo_bar=2))
+            return get_item(**kwargs)
+
+        client.get_item.side_effect = side_effect
+        dio.get_record(client, "foo", _foo(), cache=cache)
+        client.get_item.side_effect = get_item
+
+    write_during_read("b")
+    assert len(cache) == 1
+    cache.clear()
+    write_during_read("a")
+    assert len(cache) == 0
+
+
+def _counting_query_client() -> mock.MockDynamoClient:
+    """Creates a mock client whose paginated queries are counted."""
+    client = mock.MockDynamoClient()
+    client.get_paginator = MagicMock(side_effect=client.get_paginator)  # type: ignore
+    return client
+
+
+def test_partition_cache_hit():
+    """Should return cached partition results for the same query only."""
+    client = _counting_query_client()
+    dio.insert_records(client, "foo", [_foo("a"), _foo("b")])
+    cache = dio.PartitionCache()
+
+    first = dio.get_rows_for_partition(client, "foo", "first:a", cache=cache)
+    second = dio.get_rows_for_partition(client, "foo", "first:a", cache=cache)
+    bounded = dio.get_rows_for_partition(
+        client, "foo", "first:a", after_sort_key="second:a", cache=cache
+    )
+    records = dio.get_records_for_partition(
+        client, "foo", "first:a", record_classes=[fixtures.Foo], cache=cache
+    )
+    assert second is first
+    assert len(first.rows) == 2 and len(bounded.rows) == 1
+    assert [r.second_key for r in records.records] == ["second:a", "second:b"]
+    assert client.get_paginator.call_count == 2
+    assert (cache.hit_count, cache.miss_count) == (2, 2)
+
+
+def test_partition_cache_per_client():
+    """Should not share cached partition results between clients."""
+    first, second = _counting_query_client(), _counting_query_client()
+    dio.insert_records(first, "foo", [_foo("a")])
+    cache = dio.PartitionCache()
+
+    for client in (first, second, first):
+        dio.get_rows_for_partition(client, "foo", "first:a", cache=cache)
+    assert first.get_paginator.call_count == 1
+    assert second.get_paginator.call_count == 1
+
+
+def test_partition_cache_client_collected():
+    """Should not return results cached for a client that was collected."""
+    cache = dio.PartitionCache()
+    for _ in range(3):
+        client = _counting_query_client()
+        dio.get_rows_for_partition(client, "foo", "first:a", cache=cache)
+        assert client.get_paginator.call_count == 1
+        del client
+        gc.collect()
+
+
+def test_partition_cache_binary_values():
+    """Should cache requests containing binary attribute values."""
+    client = _counting_query_client()
+    cache = dio.PartitionCache()
+    start_key = {"pk": {"S": "first:a"}, "sk": {"B": b"second"}}
+
+    for _ in range(2):
+        dio.get_rows_for_partition(
+            client, "foo", "first:a", exclusive_start_key=start_key, cache=cache
+        )
+    assert client.get_paginator.call_count == 1
+
+
+def test_partition_cache_cleared_in_flight():
+    """Should not return results read while the cache was cleared."""
+    client = _counting_query_client()
+    cache = dio.PartitionCache()
+    get_paginator = client.get_paginator.side_effect
+
+    def clear_during_read(operation: str):
+        cache.clear()
+        return get_paginator(operation)
+
+    client.get_paginator.side_effect = clear_during_read
+    dio.get_rows_for_partition(client, "foo", "first:a", cache=cache)
+    client.get_paginator.side_effect = get_paginator
+    dio.get_rows_for_partition(client, "foo", "first:a", cache=cache)
+    assert client.get_paginator.call_count == 2
+
+
+def test_partition_cache_invalidated():
+    """Should invalidate cached results of partitions written in this process."""
+    client = _counting_query_client()
+    dio.insert_records(client, "foo", [_foo("a")])
+    other = fixtures.Foo(first_key="first:b", second_key="second:a")
+    cache = dio.PartitionCache()
+
+    def read():
+        return dio.get_rows_for_partition(client, "foo", "first:a", cache=cache).rows
+
+    assert len(read()) == 1
+    dio.upsert(client, "foo", other)
+    assert len(read()) == 1
+    dio.upsert(client, "foo", _foo("b"))
+    assert len(read()) == 2
+    dio.remove(client, "foo", _foo("a"))
+    assert len(read()) == 1
+    assert client.get_paginator.call_count == 3
+
+
+def test_partition_cache_index_rows():
+    """Should invalidate index results when their rows are written."""
+    client = mock.MockDynamoClient()
+    record = fixtures.FooAndGsi(
+        first_key="first:a", second_key="second:a", third_key="third:a"
+    )
+    dio.insert_records(client, "foo", [record])
+    cache = dio.PartitionCache()
+
+    def read():
+        return dio.get_rows_for_partition(
+            client, "foo", "third:a", index=dio.Indexes.G1_PARTITION, cache=cache
+        ).rows
+
+    assert len(read()) == 1
+    dio.remove(client, "foo", record)
+    assert len(read()) == 0
+
+
+@patch("time.monotonic")
+def test_partition_cache_expiry(monotonic: MagicMock):
+    """Should expire cached results and evict the least recently used."""
+    monotonic.return_value = 0.0
+    client = _counting_query_client()
+    cache = dio.PartitionCache(max_size=1, ttl=10.0)
+
+    for partition in ("first:a", "first:a", "first:b", "first:a"):
+        dio.get_rows_for_partition(client, "foo", partition, cache=cache)
+    monotonic.return_value = 11.0
+    dio.get_rows_for_partition(client, "foo", "first:a", cache=cache)
+    assert client.get_paginator.call_count == 4
+    assert len(cache) == 1
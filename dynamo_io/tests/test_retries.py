@@ -0,0 +1,155 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+import dynamo_io as dio
+from dynamo_io import retries
+from dynamo_io.tests import fixtures
+
+
+def _error(code: str, reasons: list | None = None) -> ClientError:
+    """Creates a client error with the specified error code."""
+    response: dict = {"Error": {"Code": code, "Message": code}}
+    if reasons is not None:
+        response["CancellationReasons"] = [{"Code": r} for r in reasons]
+    return ClientError(response, "Operation")  # type: ignore
+
+
+def test_get_delay():
+    """Should jitter delays within the capped exponential backoff."""
+    policy = dio.RetryPolicy(base_delay=0.1, max_delay=1.0)
+    assert policy.get_delay(0) == 0
+    for attempt in range(1, 10):
+        cap = min(1.0, 0.1 * 2 ** (attempt - 1))
+        assert all(0 <= policy.get_delay(attempt) <= cap for _ in range(50))
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (_error("ProvisionedThroughputExceededException"), True),
+        (_error("ThrottlingException"), True),
+        (_error("ConditionalCheckFailedException"), False),
+        (_error("TransactionCanceledException", ["None", "TransactionConflict"]), True),
+        (_error("TransactionCanceledException", ["ConditionalCheckFailed"]), False),
+        (_error("TransactionCanceledException", ["None"]), False),
+        (ValueError("foo"), False),
+    ],
+)
+def test_is_retryable(error: Exception, expected: bool):
+    """Should only retry throttled and transiently failed requests."""
+    assert dio.DEFAULT_RETRY_POLICY.is_retryable(error) is expected
+
+
+@patch("time.sleep")
+def test_call(sleep: MagicMock):
+    """Should retry a throttled call until it succeeds."""
+    function = MagicMock(side_effect=[_error("ThrottlingException"), {"foo": 1}])
+    assert dio.DEFAULT_RETRY_POLICY.call(function, a=1) == {"foo": 1}
+    assert function.call_count == 2
+    assert sleep.call_count == 1
+
+
+@patch("time.sleep")
+def test_call_exhausted(sleep: MagicMock):
+    """Should raise the last error once all attempts have failed."""
+    function = MagicMock(side_effect=_error("ThrottlingException"))
+    with pytest.raises(ClientError):
+        dio.RetryPolicy(max_attempts=3).call(function)
+    assert function.call_count == 3
+    assert sleep.call_count == 2
+
+
+@patch("time.sleep")
+def test_call_not_retryable(sleep: MagicMock):
+    """Should raise errors that are not retryable immediately."""
+    function = MagicMock(side_effect=_error("ValidationException"))
+    with pytest.raises(ClientError):
+        dio.DEFAULT_RETRY_POLICY.call(function)
+    assert function.call_count == 1
+    assert sleep.call_count == 0
+
+
+@patch("time.monotonic")
+@patch("time.sleep")
+def test_attempts_elapsed(sleep: MagicMock, monotonic: MagicMock):
+    """Should stop retrying once the elapsed time budget is spent."""
+    monotonic.side_effect = [0, 0, 0.5, 2.0]
+    policy = dio.RetryPolicy(base_delay=0.1, max_elapsed=1.0)
+    assert list(policy.attempts()) == [0, 1]
+
+
+@patch("time.sleep")
+def test_paginate_resumes(sleep: MagicMock):
+    """Should resume pagination after the last page that was received."""
+
+    def paginate(**kwargs):
+        if "ExclusiveStartKey" not in kwargs:
+            yield {"Items": [1], "LastEvaluatedKey": {"pk": "a"}}
+            raise _error("ThrottlingException")
+        yield {"Items": [2]}
+
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = paginate
+
+    pages = list(retries.paginate(client, "query", {"TableName": "foo"}))
+    assert [p["Items"] for p in pages] == [[1], [2]]
+    last_call = client.get_paginator.return_value.paginate.call_args
+    assert last_call.kwargs["ExclusiveStartKey"] == {"pk": "a"}
+    assert sleep.call_count == 1
+
+
+@patch("time.sleep")
+def test_paginate_retries_each_page(sleep: MagicMock):
+    """Should give every page its own retry budget."""
+
+    def paginate(**kwargs):
+        start = int(kwargs.get("ExclusiveStartKey", {}).get("pk", 0))
+        yield {"Items": [start], "LastEvaluatedKey": {"pk": start + 1}}
+        if start < 4:
+            raise _error("ThrottlingException")
+
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = paginate
+
+    policy = dio.RetryPolicy(max_attempts=2)
+    pages = list(retries.paginate(client, "query", {"TableName": "foo"}, policy))
+    assert [p["Items"] for p in pages] == [[0], [1], [2], [3], [4]]
+    assert sleep.call_count == 4
+
+
+@patch("time.monotonic")
+@patch("time.sleep")
+def test_paginate_elapsed_per_page(sleep: MagicMock, monotonic: MagicMock):
+    """Should retry a page after the elapsed budget of the pagination passed."""
+    monotonic.return_value = 0.0
+
+    def paginate(**kwargs):
+        if "ExclusiveStartKey" not in kwargs:
+            yield {"Items": [1], "LastEvaluatedKey": {"pk": "a"}}
+            raise _error("ThrottlingException")
+        yield {"Items": [2]}
+
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.side_effect = paginate
+
+    policy = dio.RetryPolicy(base_delay=0, max_elapsed=30.0)
+    pages = retries.paginate(client, "query", {"TableName": "foo"}, policy)
+    assert next(pages)["Items"] == [1]
+    monotonic.return_value = 100.0
+    assert [p["Items"] for p in pages] == [[2]]
+
+
+@patch("time.sleep")
+def test_upsert_retried(sleep: MagicMock):
+    """Should retry a throttled upsert with the specified policy."""
+    client = MagicMock()
+    client.update_item.side_effect = [
+        _error("ProvisionedThroughputExceededException"),
+        {"Attributes": {"pk": {"S": "first:a"}, "sk": {"S": "second:a"}}},
+    ]
+    record = fixtures.Foo(first_key="first:a", second_key="second:a")
+    dio.upsert(client, "foo", record, retry_policy=dio.RetryPolicy(base_delay=0))
+    assert client.update_item.call_count == 2
@@ -0,0 +1,57 @@
+import pytest
+
+from dynamo_io import sizing
+from dynamo_io.tests import fixtures
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ({"S": "hello"}, 5),
+        ({"S": "é"}, 2),
+        ({"B": b"\x00\x01"}, 2),
+        ({"N": "123"}, 3),
+        ({"N": "-12.500"}, 3),
+        ({"N": "0"}, 2),
+        ({"BOOL": True}, 1),
+        ({"NULL": True}, 1),
+        ({"SS": ["a", "bc"]}, 3),
+        ({"NS": ["1", "22"]}, 4),
+        ({"L": [{"S": "a"}, {"N": "1"}]}, 8),
+        ({"M": {"a": {"S": "b"}}}, 6),
+    ],
+)
+def test_attribute_value_size(value: dict, expected: int):
+    """Should size attribute values following the DynamoDB rules."""
+    assert sizing.attribute_value_size(value) == expected
+
+
+def test_item_size():
+    """Should include the attribute names in the item size."""
+    row = {"pk": {"S": "first:a"}, "count": {"N": "10"}}
+    assert sizing.item_size(row) == 2 + 7 + 5 + 2
+
+
+def test_check_item_size():
+    """Should reject items larger than DynamoDB accepts."""
+    assert sizing.check_item_size({"a": {"S": "b"}}) == 2
+    with pytest.raises(ValueError):
+        sizing.check_item_size({"a": {"S": "b" * sizing.MAX_ITEM_SIZE_BYTES}})
+
+
+def test_capacity_units():
+    """Should round sizes up to whole capacity units."""
+    assert sizing.write_capacity_units(0) == 1
+    assert sizing.write_capacity_units(1025) == 2
+    assert sizing.write_capacity_units(1025, transactional=True) == 4
+    assert sizing.read_capacity_units(4096) == 0.5
+    assert sizing.read_capacity_units(4097, consistent_read=True) == 2
+    assert sizing.read_capacity_units(4097, transactional=True) == 4
+    assert sizing.batch_write_capacity_units([{"a": {"S": "b"}}] * 3) == 3
+
+
+def test_record_estimated_size_bytes():
+    """Should estimate the size of the row written for the record."""
+    record = fixtures.Foo(first_key="first:a", second_key="second:a", foo_bar=1)
+    assert record.estimated_size_bytes() == sizing.item_size(record.to_row())
+    assert record.estimated_size_bytes() > len("first:a") + len("second:a")
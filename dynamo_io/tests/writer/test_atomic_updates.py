@@ -0,0 +1,79 @@
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+
+
+@dataclasses.dataclass(frozen=True)
+class Counter(dio.Record):
+    """Record with a counter and a set to update atomically."""
+
+    counter_id: dio.TypeHints.KeyColumn = None
+    name: dio.TypeHints.KeyColumn = None
+    count: dio.TypeHints.Integer = None
+    tags: dio.TypeHints.StringSet = None
+
+    schema: dio.SchemaType = dio.Schema(
+        partition_key=dio.PartitionColumn("counter_id", "counter:"),
+        sort_key=dio.SortColumn("name", "name:"),
+        columns=(
+            dio.Column("count", dio.DynamoTypes.INTEGER),
+            dio.Column("tags", dio.DynamoTypes.STRING_SET),
+        ),
+    )
+
+
+def _counter(**kwargs) -> Counter:
+    """Creates a counter record for the same key."""
+    return Counter(counter_id="counter:a", name="name:a", **kwargs)
+
+
+def test_update_request_operations():
+    """Should compile special operations into ADD and DELETE clauses."""
+    request = _counter(
+        count=dio.increment(3), tags=dio.delete_from_set(["x"])
+    ).to_update_request()
+
+    assert request.expression.endswith(" ADD #k0 :v0 DELETE #k1 :v1")
+    assert request.values[":v0"] == {"N": "3"}
+    assert request.values[":v1"] == {"SS": ["x"]}
+
+
+def test_upsert_operations():
+    """Should apply the operations atomically without reading the item."""
+    client = mock.MockDynamoClient()
+    dio.upsert(client, "foo", _counter(count=dio.increment(5)))
+    dio.upsert(client, "foo", _counter(count=dio.decrement(2)))
+    dio.upsert(client, "foo", _counter(tags=dio.add_to_set(["x", "y"])))
+    response = dio.upsert(client, "foo", _counter(tags=dio.delete_from_set(["x"])))
+
+    assert response.record.count == 3
+    assert response.record.tags == ["y"]
+
+
+def test_transacts_operations():
+    """Should include the operations in transactional updates."""
+    client = MagicMock()
+    client.transact_write_items.return_value = {}
+    dio.transacts(client, "foo", updates=[_counter(count=dio.increment())])
+
+    request = client.transact_write_items.call_args.kwargs
+    update = request["TransactItems"][0]["Update"]
+    assert update["UpdateExpression"].endswith(" ADD #k0 :v0")
+
+
+def test_to_row_skips_operations():
+    """Should leave operations out of rows written as whole items."""
+    row = _counter(count=dio.increment(), tags=["x"]).to_row()
+    assert "count" not in row
+    assert row["tags"] == {"SS": ["x"]}
+
+
+def test_empty_set_operations():
+    """Should reject set operations without values."""
+    for operation in (dio.add_to_set, dio.delete_from_set):
+        with pytest.raises(ValueError):
+            operation(iter(()))
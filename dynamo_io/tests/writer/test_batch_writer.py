@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def test_batch_writer():
+    """Should auto-flush full batches and flush the remainder on exit."""
+    client = mock.MockDynamoClient()
+    with dio.BatchWriter(client, "foo") as batch:
+        for index in range(60):
+            batch.put(fixtures.Foo(first_key="first:a", second_key=f"second:{index}"))
+        assert len(batch.batches) == 2
+
+    assert [s.item_count for s in batch.batches] == [25, 25, 10]
+    assert batch.response.item_count == 60
+    assert len(client.table.rows) == 60
+
+
+def test_batch_writer_duplicates():
+    """Should only keep the last request buffered for each key."""
+    client = MagicMock()
+    client.batch_write_item.return_value = {"UnprocessedItems": {}}
+    record = fixtures.Foo(first_key="first:a", second_key="second:a")
+    with dio.BatchWriter(client, "foo") as batch:
+        batch.put(record)
+        batch.put(fixtures.Foo(first_key="first:b", second_key="second:b"))
+        batch.delete(record)
+
+    items = client.batch_write_item.call_args.kwargs["RequestItems"]["foo"]
+    assert len(items) == 2
+    assert items[-1] == {"DeleteRequest": {"Key": record.table_key}}
+
+
+@patch("time.sleep")
+def test_batch_writer_unprocessed(sleep: MagicMock):
+    """Should retry the unprocessed items of a flushed batch."""
+    client = MagicMock()
+    client.batch_write_item.side_effect = [
+        {"UnprocessedItems": {"foo": [{}]}},
+        {"UnprocessedItems": {}},
+    ]
+    with dio.BatchWriter(client, "foo", batch_size=1) as batch:
+        batch.put(fixtures.Foo(first_key="first:a", second_key="second:a"))
+        assert batch.flush() is None
+
+    assert batch.batches[0].attempt_count == 2
+    assert sleep.call_count == 1
+
+
+def test_batch_writer_batch_size():
+    """Should reject batch sizes that DynamoDB does not accept."""
+    with pytest.raises(ValueError):
+        dio.BatchWriter(MagicMock(), "foo", batch_size=26)
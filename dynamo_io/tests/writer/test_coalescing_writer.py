@@ -0,0 +1,144 @@
+import dataclasses
+import datetime
+import threading
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+@dataclasses.dataclass(frozen=True)
+class Tagged(dio.Record):
+    """Record with a set column for merging set operations."""
+
+    tag_id: dio.TypeHints.KeyColumn = None
+    tags: dio.TypeHints.StringSet = None
+
+    schema: dio.SchemaType = dio.Schema(
+        partition_key=dio.PartitionColumn("tag_id", "tag:"),
+        sort_key=None,
+        columns=(dio.Column("tags", dio.DynamoTypes.STRING_SET),),
+    )
+
+
+def _foo(**kwargs) -> fixtures.Foo:
+    """Creates a record for the same key."""
+    return fixtures.Foo(first_key="first:a", second_key="second:a", **kwargs)
+
+
+def test_coalescing_writer():
+    """Should write one update per key with the merged values."""
+    client = mock.MockDynamoClient()
+    with dio.CoalescingWriter(client, "foo", window=60) as writer:
+        writer.upsert(_foo(foo_bar=1, baz=True))
+        writer.upsert(_foo(foo_bar=2))
+        writer.upsert(_foo(baz=dio.DELETE))
+        writer.upsert(fixtures.Foo(first_key="first:b", second_key="second:b"))
+        assert writer.write_count == 0
+
+    assert writer.received_count == 4
+    assert writer.write_count == 2
+    row = client.table.rows[mock.Key("first:a", "second:a")].to_dict()
+    assert row["foo_bar"] == {"N": "2"}
+    assert "baz" not in row
+
+
+def test_coalescing_writer_operations():
+    """Should combine increments into a single increment."""
+    client = MagicMock()
+    with dio.CoalescingWriter(client, "foo", window=60) as writer:
+        for _ in range(3):
+            writer.upsert(_foo(foo_bar=dio.increment(2)))
+
+    assert client.update_item.call_count == 1
+    request = client.update_item.call_args.kwargs
+    assert " ADD #k0 :v0" in request["UpdateExpression"]
+    assert request["ExpressionAttributeValues"][":v0"] == {"N": "6"}
+    assert request["ReturnValues"] == "NONE"
+
+
+def test_coalescing_writer_conflict():
+    """Should write the held update before one it cannot be merged with."""
+    client = MagicMock()
+    writer = dio.CoalescingWriter(client, "foo", window=60)
+    writer.upsert(Tagged(tag_id="tag:a", tags=dio.add_to_set(["x"])))
+    writer.upsert(Tagged(tag_id="tag:a", tags=dio.delete_from_set(["y"])))
+
+    assert client.update_item.call_count == 1
+    assert writer.flush() == 1
+    expression = client.update_item.call_args.kwargs["UpdateExpression"]
+    assert expression.endswith(" DELETE #k0 :v0")
+
+
+def test_coalescing_writer_conflict_order():
+    """Should not write a newer update of a key before a conflicting one."""
+    tags: set = set()
+    writing = threading.Event()
+    release = threading.Event()
+
+    def update_item(**kwargs):
+        if not writing.is_set():
+            writing.set()
+            release.wait(5)
+        values = set(kwargs["ExpressionAttributeValues"][":v0"]["SS"])
+        if kwargs["UpdateExpression"].endswith(" DELETE #k0 :v0"):
+            tags.difference_update(values)
+        else:
+            tags.update(values)
+        return {}
+
+    client = MagicMock()
+    client.update_item.side_effect = update_item
+    writer = dio.CoalescingWriter(client, "foo", window=60)
+    writer.upsert(Tagged(tag_id="tag:a", tags=dio.add_to_set(["x"])))
+    conflicting = threading.Thread(
+        target=writer.upsert,
+        args=(Tagged(tag_id="tag:a", tags=dio.delete_from_set(["x"])),),
+    )
+    conflicting.start()
+    writing.wait(5)
+    flushing = threading.Thread(target=writer.flush)
+    flushing.start()
+    time.sleep(0.05)
+    release.set()
+    conflicting.join()
+    flushing.join()
+
+    assert client.update_item.call_count == 2
+    assert tags == set()
+
+
+def test_coalescing_writer_created_at():
+    """Should keep the earliest created_at as if_not_exists would."""
+    client = MagicMock()
+    first = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    second = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    with dio.CoalescingWriter(client, "foo") as writer:
+        writer.upsert(_foo(created_at=first))
+        writer.upsert(_foo(created_at=second))
+
+    values = client.update_item.call_args.kwargs["ExpressionAttributeValues"]
+    assert {"S": "2021-01-01T00:00:00Z"} in values.values()
+
+
+@patch("time.monotonic")
+def test_coalescing_writer_window(monotonic: MagicMock):
+    """Should write held updates once their window has expired."""
+    client = MagicMock()
+    monotonic.return_value = 0
+    writer = dio.CoalescingWriter(client, "foo", window=1.0)
+    writer.upsert(_foo(foo_bar=1))
+    assert client.update_item.call_count == 0
+
+    monotonic.return_value = 0.5
+    writer.upsert(_foo(foo_bar=2))
+    assert client.update_item.call_count == 0
+
+    monotonic.return_value = 1.5
+    assert writer.flush_expired() == 1
+    assert client.update_item.call_args.kwargs["ExpressionAttributeValues"][":v0"] == {
+        "N": "2"
+    }
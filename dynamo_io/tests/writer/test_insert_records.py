@@ -3,8 +3,10 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 import dynamo_io as dio
+from dynamo_io import mock
 from dynamo_io.tests import fixtures
 
 record = fixtures.Foo(
@@ -25,23 +27,35 @@ def test_insert_records(sleep: MagicMock):
     """Should insert records in the expected DynamoDB format."""
     client = MagicMock()
     client.batch_write_item.side_effect = [
-        {"UnprocessedItems": [{}, {}]},
-        {"UnprocessedItems": [{}]},
-        {"UnprocessedItems": []},
+        {"UnprocessedItems": {"foo": [{}, {}]}},
+        {"UnprocessedItems": {"foo": [{}]}},
+        {"UnprocessedItems": {}},
     ]
     assert dio.insert_records(
         client=client,
         table_name="foo",
         records=[record, record_no_sort],
     )
-    assert sleep.call_count == 3
+    assert sleep.call_count == 2
+
+
+def test_insert_records_request():
+    """Should return the BatchWriteItem request of the final batch."""
+    client = mock.MockDynamoClient()
+    records = [
+        fixtures.Foo(first_key="first:a", second_key=f"second:{i}") for i in range(3)
+    ]
+    response = dio.insert_records(client, "foo", records, batch_size=2)
+    assert response.request == {
+        "RequestItems": {"foo": [{"PutRequest": {"Item": records[2].to_row()}}]}
+    }
 
 
 @patch("time.sleep")
 def test_insert_records_failed(sleep: MagicMock):
     """Should insert records in the expected DynamoDB format."""
     client = MagicMock()
-    client.batch_write_item.return_value = {"UnprocessedItems": [{}]}
+    client.batch_write_item.return_value = {"UnprocessedItems": {"foo": [{}]}}
 
     with pytest.raises(RuntimeError):
         dio.insert_records(
@@ -50,4 +64,66 @@ def test_insert_records_failed(sleep: MagicMock):
             records=[record, record_no_sort],
         )
 
-    assert sleep.call_count == 10
+    assert sleep.call_count == 9
+
+
+@patch("time.sleep")
+def test_insert_records_batches(sleep: MagicMock):
+    """Should stream the records into concurrent batches of 25 items."""
+    client = mock.MockDynamoClient()
+    records = (
+        fixtures.Foo(first_key="first:a", second_key=f"second:{i}", foo_bar=i)
+        for i in range(110)
+    )
+
+    result = dio.insert_records(client, "foo", records, max_workers=3)
+
+    assert len(client.table.rows) == 110
+    assert result.batch_count == 5
+    assert result.item_count == 110
+    assert [b.item_count for b in result.batches] == [25, 25, 25, 25, 10]
+    assert [b.batch for b in result.batches] == [0, 1, 2, 3, 4]
+    assert result.attempt_count == 5
+    assert result.retried_item_count == 0
+
+
+@patch("time.sleep")
+def test_insert_records_batch_retries(sleep: MagicMock):
+    """Should retry the unprocessed items of each batch independently."""
+    client = MagicMock()
+    client.batch_write_item.side_effect = [
+        {"UnprocessedItems": {}},
+        {"UnprocessedItems": {"foo": [{}, {}]}},
+        {"UnprocessedItems": {}},
+    ]
+
+    result = dio.insert_records(client, "foo", [record] * 30, batch_size=15)
+
+    assert [b.attempt_count for b in result.batches] == [1, 2]
+    assert result.retried_item_count == 2
+    retry_call = client.batch_write_item.call_args_list[2]
+    assert retry_call[1]["RequestItems"] == {"foo": [{}, {}]}
+
+
+@patch("time.sleep")
+def test_insert_records_attempt_budget(sleep: MagicMock):
+    """Should count throttles and unprocessed items towards one attempt budget."""
+    throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "Batch")
+    client = MagicMock()
+    client.batch_write_item.side_effect = [
+        throttled,
+        {"UnprocessedItems": {"foo": [{}]}},
+        throttled,
+        {"UnprocessedItems": {"foo": [{}]}},
+    ]
+    policy = dio.RetryPolicy(max_attempts=3)
+
+    with pytest.raises(ClientError):
+        dio.insert_records(client, "foo", [record], retry_policy=policy)
+    assert client.batch_write_item.call_count == 3
+
+
+def test_insert_records_batch_size():
+    """Should reject batch sizes larger than DynamoDB accepts."""
+    with pytest.raises(ValueError):
+        dio.insert_records(MagicMock(), "foo", [record], batch_size=26)
@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _insert(client: mock.MockDynamoClient, partition: str, count: int):
+    """Inserts records with distinct sort keys into the partition."""
+    dio.insert_records(
+        client,
+        "foo",
+        (
+            fixtures.Foo(first_key=partition, second_key=f"second:{index}", foo_bar=1)
+            for index in range(count)
+        ),
+    )
+
+
+def test_purge_partition():
+    """Should delete every item in the partition and no others."""
+    client = mock.MockDynamoClient()
+    _insert(client, "first:a", 60)
+    _insert(client, "first:b", 5)
+
+    result = dio.purge_partition(client, "foo", "first:a", max_workers=2)
+
+    assert result.item_count == 60
+    assert len(client.table.rows) == 5
+
+
+def test_purge_partition_sort_key_starts():
+    """Should only delete the items whose sort key has the prefix."""
+    client = mock.MockDynamoClient()
+    _insert(client, "first:a", 12)
+
+    result = dio.purge_partition(client, "foo", "first:a", "second:1")
+
+    assert result.item_count == 3
+    assert len(client.table.rows) == 9
+
+
+def test_purge_partition_keys_only():
+    """Should only query the primary keys of the items."""
+    client = MagicMock()
+    key = {"pk": {"S": "first:a"}, "sk": {"S": "second:a"}}
+    client.get_paginator.return_value.paginate.return_value = [{"Items": [key]}]
+    client.batch_write_item.return_value = {"UnprocessedItems": {}}
+
+    dio.purge_partition(client, "foo", "first:a")
+
+    request = client.get_paginator.return_value.paginate.call_args.kwargs
+    assert set(request["ExpressionAttributeNames"].values()) == {"pk", "sk"}
+    items = client.batch_write_item.call_args.kwargs["RequestItems"]["foo"]
+    assert items == [{"DeleteRequest": {"Key": key}}]
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io.tests import fixtures
+
+
+def _records(count: int) -> list:
+    """Creates records with distinct keys in the same partition."""
+    return [
+        fixtures.Foo(first_key="first:a", second_key=f"second:{index}")
+        for index in range(count)
+    ]
+
+
+def test_remove_records():
+    """Should delete the records in concurrent batches of 25 keys."""
+    client = mock.MockDynamoClient()
+    records = _records(60)
+    dio.insert_records(client, "foo", records)
+    kept = fixtures.Foo(first_key="first:b", second_key="second:0")
+    dio.insert_records(client, "foo", [kept])
+
+    result = dio.remove_records(client, "foo", iter(records), max_workers=3)
+
+    assert [s.item_count for s in result.batches] == [25, 25, 10]
+    assert len(client.table.rows) == 1
+
+
+def test_remove_records_duplicates():
+    """Should only delete each key once within a batch."""
+    client = MagicMock()
+    client.batch_write_item.return_value = {"UnprocessedItems": {}}
+    records = _records(3)
+
+    result = dio.remove_records(client, "foo", [*records, records[0]])
+
+    items = client.batch_write_item.call_args.kwargs["RequestItems"]["foo"]
+    assert items == [{"DeleteRequest": {"Key": r.table_key}} for r in records]
+    assert result.item_count == 3
+
+
+@patch("time.sleep")
+def test_remove_records_failed(sleep: MagicMock):
+    """Should raise once the unprocessed items can no longer be retried."""
+    client = MagicMock()
+    client.batch_write_item.return_value = {"UnprocessedItems": {"foo": [{}]}}
+    with pytest.raises(RuntimeError):
+        dio.remove_records(client, "foo", _records(2))
+    assert client.batch_write_item.call_count == 10
@@ -1,7 +1,11 @@
 from unittest.mock import MagicMock
+from unittest.mock import patch
 import datetime
 
+import pytest
+
 import dynamo_io as dio
+from dynamo_io import mock
 from dynamo_io.tests import fixtures
 import aok
 
@@ -49,3 +53,46 @@ def test_upsert():
         }
     )
     expected.assert_all(observed)
+
+
+def test_upsert_return_none():
+    """Should skip returned attributes and the record for NONE."""
+    client = mock.MockDynamoClient()
+    response = dio.upsert(client, "foo", record, return_values="NONE")
+
+    assert client.table.rows
+    assert response.request["ReturnValues"] == "NONE"
+    assert response.row is None
+    assert response.record is None
+
+
+def test_upsert_updated_new():
+    """Should load the record from the updated attributes and the key."""
+    client = mock.MockDynamoClient()
+    dio.upsert(client, "foo", record)
+    update = fixtures.Foo(first_key="spam", second_key="ham", foo_bar=43)
+
+    response = dio.upsert(client, "foo", update, return_values="UPDATED_NEW")
+
+    assert "pk" not in response.row
+    assert response.record.first_key == "spam"
+    assert response.record.foo_bar == 43
+
+
+def test_upsert_lazy_record():
+    """Should only deserialize the record when it is first accessed."""
+    client = MagicMock()
+    client.update_item.return_value = {"Attributes": record.to_row()}
+    loader = MagicMock(return_value=record)
+
+    with patch.object(fixtures.Foo, "from_row", loader):
+        response = dio.upsert(client, "foo", record)
+        assert loader.call_count == 0
+        assert response.record is response.record
+    assert loader.call_count == 1
+
+
+def test_upsert_invalid_return_values():
+    """Should reject return values DynamoDB does not support for upserts."""
+    with pytest.raises(ValueError):
+        dio.upsert(MagicMock(), "foo", record, return_values="ALL")
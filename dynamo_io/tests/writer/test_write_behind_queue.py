@@ -0,0 +1,138 @@
+import queue
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import dynamo_io as dio
+from dynamo_io import mock
+from dynamo_io import writer
+from dynamo_io.tests import fixtures
+
+
+def _foo(index: int) -> fixtures.Foo:
+    """Creates a record with a distinct key."""
+    return fixtures.Foo(first_key="first:a", second_key=f"second:{index}")
+
+
+def _blocked_client() -> tuple:
+    """Creates a client whose writes wait until the event is set."""
+    release = threading.Event()
+    client = MagicMock()
+    client.update_item.side_effect = lambda **kwargs: release.wait() and {}
+    return client, release
+
+
+def test_write_behind_queue():
+    """Should perform the queued writes and resolve their futures."""
+    client = mock.MockDynamoClient()
+    with dio.WriteBehindQueue(client, "foo", workers=3) as writes:
+        upserted = [writes.upsert(_foo(index)) for index in range(10)]
+        inserted = writes.insert_records([_foo(index) for index in range(10, 20)])
+        writes.flush()
+        assert len(client.table.rows) == 20
+        removed = writes.remove(_foo(0))
+
+    assert all(f.result().record for f in upserted)
+    assert inserted.result().item_count == 10
+    assert removed.done()
+    assert len(client.table.rows) == 19
+
+
+def test_write_behind_queue_errors():
+    """Should set the errors of failed writes on their futures."""
+    client = MagicMock()
+    client.delete_item.side_effect = ValueError("foo")
+    with dio.WriteBehindQueue(client, "foo") as writes:
+        future = writes.remove(_foo(0))
+
+    assert isinstance(future.exception(), ValueError)
+    with pytest.raises(RuntimeError):
+        writes.remove(_foo(0))
+
+
+def test_write_behind_queue_drop():
+    """Should drop writes with cancelled futures while the queue is full."""
+    client, release = _blocked_client()
+    with dio.WriteBehindQueue(client, "foo", max_size=1, overflow="drop") as writes:
+        futures = [writes.upsert(_foo(index)) for index in range(5)]
+        assert writes.dropped_count >= 3
+        release.set()
+
+    assert sum(f.cancelled() for f in futures) == writes.dropped_count
+
+
+def test_write_behind_queue_raise():
+    """Should raise while the queue is full."""
+    client, release = _blocked_client()
+    writes = dio.WriteBehindQueue(client, "foo", max_size=1, overflow="raise")
+    with pytest.raises(queue.Full):
+        for index in range(5):
+            writes.upsert(_foo(index))
+    release.set()
+    writes.close()
+
+
+def test_write_behind_queue_overflow():
+    """Should reject unknown overflow policies."""
+    with pytest.raises(ValueError):
+        dio.WriteBehindQueue(MagicMock(), "foo", overflow="wait")
+
+
+def test_write_behind_queue_close_race():
+    """Should resolve every write that was queued while closing."""
+    client = mock.MockDynamoClient()
+    writes = dio.WriteBehindQueue(client, "foo", workers=2)
+    queued = []
+
+    def submit():
+        for index in range(200):
+            try:
+                queued.append(writes.upsert(_foo(index)))
+            except RuntimeError:
+                return
+
+    submitter = threading.Thread(target=submit)
+    submitter.start()
+    writes.close()
+    submitter.join()
+
+    assert all(f.done() for f in queued)
+    with pytest.raises(RuntimeError):
+        writes.upsert(_foo(0))
+
+
+def test_write_behind_queue_close_while_blocked():
+    """Should reject writes while closing waits for a blocked write."""
+    client, release = _blocked_client()
+    writes = dio.WriteBehindQueue(client, "foo", max_size=1)
+    first, second = writes.upsert(_foo(0)), writes.upsert(_foo(1))
+    blocked = threading.Thread(target=writes.upsert, args=(_foo(2),))
+    blocked.start()
+    closing = threading.Thread(target=writes.close)
+    while not writes._blocked_count:
+        time.sleep(0.001)
+    closing.start()
+    while not writes._closed:
+        time.sleep(0.001)
+
+    with pytest.raises(RuntimeError):
+        writes.upsert(_foo(3))
+    release.set()
+    blocked.join()
+    closing.join()
+    assert first.done() and second.done()
+    assert client.update_item.call_count == 3
+
+
+def test_write_behind_queue_closed_at_exit():
+    """Should write the queued writes of queues left open at exit."""
+    client = mock.MockDynamoClient()
+    writes = dio.WriteBehindQueue(client, "foo")
+    upserted = [writes.upsert(_foo(index)) for index in range(5)]
+
+    writer._close_open_queues()
+    assert all(f.done() for f in upserted)
+    assert len(client.table.rows) == 5
+    assert writes not in writer._open_queues
@@ -1,60 +1,362 @@
+import atexit
+import dataclasses
+import queue
+import threading
 import time
 import typing
+import weakref
+from concurrent import futures
 
 from botocore.client import BaseClient
 
+from dynamo_io import _batching
+from dynamo_io import _requests
+from dynamo_io import caching
 from dynamo_io import definitions
+from dynamo_io import reader
 from dynamo_io import recorder
+from dynamo_io import retries
+
+#: Maximum number of items DynamoDB accepts in a single batch write call.
+MAX_BATCH_WRITE_ITEMS = 25
+
+#: Values DynamoDB accepts for the ReturnValues of an update.
+UPSERT_RETURN_VALUES = _requests.UPSERT_RETURN_VALUES
+
+#: Policies for handling writes submitted to a full WriteBehindQueue.
+OVERFLOW_POLICIES = ("block", "drop", "raise")
+
+
+def _write_batch(
+    client: BaseClient,
+    table_name: str,
+    index: int,
+    items: typing.List[dict],
+    policy: retries.RetryPolicy = retries.DEFAULT_RETRY_POLICY,
+) -> _requests.BatchWriteResult:
+    """
+    Writes a single batch of write requests, retrying the unprocessed items
+    of the batch and retryable errors according to the retry policy, with
+    both counting towards the same attempts. Returns the stats of the batch,
+    its BatchWriteItem request and the final raw response.
+    """
+    progress = _requests.BatchWriteProgress(table_name, index, items)
+    error: typing.Optional[Exception] = None
+
+    for i in policy.attempts():
+        try:
+            response = client.batch_write_item(RequestItems=progress.unprocessed_items)
+        except Exception as caught:
+            if not policy.is_retryable(caught):
+                raise
+            error = caught
+            continue
+        stats = progress.update(i, response)
+        if stats is not None:
+            return stats, progress.request, response
+
+    raise error or RuntimeError("Failed to write all items in the batch.")
+
+
+def _write_items(
+    client: BaseClient,
+    table_name: str,
+    items: typing.Iterable[dict],
+    max_workers: int = 1,
+    batch_size: int = MAX_BATCH_WRITE_ITEMS,
+    retry_policy: typing.Optional[retries.RetryPolicy] = None,
+) -> definitions.BatchWriteResponse:
+    """
+    Streams the write requests into batches that are written concurrently
+    by up to `max_workers` threads, with each batch retried independently.
+    """
+    if not 0 < batch_size <= MAX_BATCH_WRITE_ITEMS:
+        raise ValueError(
+            f"Batch size must be between 1 and {MAX_BATCH_WRITE_ITEMS} items."
+        )
+
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    results = _batching.map_bounded(
+        lambda index, batch: _write_batch(client, table_name, index, batch, policy),
+        _batching.iter_batches(items, batch_size),
+        max_workers,
+    )
+    return _requests.to_batch_write_response(results)
 
 
 def insert_records(
     client: BaseClient,
     table_name: str,
     records: typing.Iterable["recorder.Record"],
-) -> "definitions.Response":
+    max_workers: int = 1,
+    batch_size: int = MAX_BATCH_WRITE_ITEMS,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.BatchWriteResponse:
     """
     Batch inserts records into the specified table. This method does
     not support upserting. It will only function if the records are
-    being created. The method will retry up to 10 times to ensure that
-    the records are inserted. However, if after 10 attempts, with
-    exponential backoff, the insertion fails for 1 or more of the
-    records the function will fail with a False return value. If it
-    succeeds the function will return True.
+    being created. The records are streamed into batches of up to 25
+    items, which is the most DynamoDB accepts in a single call, and the
+    batches are written concurrently when multiple workers are specified.
+    The unprocessed items of each batch and throttled requests are retried
+    with jittered exponential backoff according to the retry policy. If the
+    insertion still fails for 1 or more of the records in a batch once the
+    policy is exhausted, a RuntimeError is raised.
 
     :param client:
         Boto client used to insert the records.
     :param table_name:
         Name of the table to insert the records into.
     :param records:
-        A list of Record objects to insert into the specified table.
-        These records will be converted to DynamoDB row format prior
-        to the insert call.
-    """
-    initial_unprocessed_items = {
-        table_name: [{"PutRequest": {"Item": r.to_row()}} for r in records]
-    }
-    unprocessed_items = initial_unprocessed_items
-
-    for i in range(10):
-        time.sleep(i * 0.5)
-        response = client.batch_write_item(RequestItems=unprocessed_items)
-        unprocessed_items = response.get("UnprocessedItems") or {}
-        if not unprocessed_items:
-            return definitions.Response(
-                response=response,
-                request=initial_unprocessed_items,
+        An iterable of Record objects to insert into the specified table.
+        These records will be converted to DynamoDB row format as their
+        batch is created, so the iterable can be a lazy generator.
+    :param max_workers:
+        Number of batches to write concurrently. Defaults to writing the
+        batches sequentially.
+    :param batch_size:
+        Number of records written in each batch, up to 25.
+    :param retry_policy:
+        Policy for retrying throttled requests and unprocessed items, which
+        defaults to `retries.DEFAULT_RETRY_POLICY`.
+    :return:
+        A batch write response with the stats of each batch.
+    """
+    return _write_items(
+        client=client,
+        table_name=table_name,
+        items=({"PutRequest": {"Item": r.to_row()}} for r in records),
+        max_workers=max_workers,
+        batch_size=batch_size,
+        retry_policy=retry_policy,
+    )
+
+
+def purge_partition(
+    client: BaseClient,
+    table_name: str,
+    partition_key_value: str,
+    sort_key_starts: str | None = None,
+    max_workers: int = 1,
+    batch_size: int = MAX_BATCH_WRITE_ITEMS,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.BatchWriteResponse:
+    """
+    Deletes every item in the specified partition, optionally limited to
+    the items whose sort key begins with a prefix. The partition is queried
+    for the primary keys of its items only and the keys are streamed into
+    batch deletes as the pages arrive, such that the rows of the partition
+    are never read or held in memory in full.
+
+    :param client:
+        Boto client used to query and delete the items.
+    :param table_name:
+        Name of the table to delete the items from.
+    :param partition_key_value:
+        The value defining the partition to delete.
+    :param sort_key_starts:
+        The value the sort key of deleted items must begin with.
+    :param max_workers:
+        Number of batches to write concurrently. Defaults to writing the
+        batches sequentially.
+    :param batch_size:
+        Number of keys deleted in each batch, up to 25.
+    :param retry_policy:
+        Policy for retrying throttled requests and unprocessed items, which
+        defaults to `retries.DEFAULT_RETRY_POLICY`.
+    :return:
+        A batch write response with the stats of each batch.
+    """
+    index = definitions.Indexes.STANDARD
+    keys = reader.iter_rows_for_partition(
+        client=client,
+        table_name=table_name,
+        partition_key_value=partition_key_value,
+        sort_key_starts=sort_key_starts,
+        index=index,
+        projection=[k for k in (index.partition_key, index.sort_key) if k],
+        retry_policy=retry_policy,
+    )
+    return _write_items(
+        client=client,
+        table_name=table_name,
+        items=({"DeleteRequest": {"Key": key}} for key in keys),
+        max_workers=max_workers,
+        batch_size=batch_size,
+        retry_policy=retry_policy,
+    )
+
+
+def _key_identity(key: dict) -> typing.Tuple[typing.Any, ...]:
+    """Returns a hashable identity for the table key of a write request."""
+    return tuple(sorted((name, *value.items()) for name, value in key.items()))
+
+
+def _iter_delete_requests(
+    records: typing.Iterable["recorder.Record"],
+    batch_size: int,
+) -> typing.Iterator[dict]:
+    """
+    Yields delete requests for the keys of the records, skipping keys that
+    were already yielded for the current batch of `batch_size` requests,
+    since DynamoDB rejects batches containing the same key more than once.
+    """
+    seen: typing.Set[typing.Tuple[typing.Any, ...]] = set()
+    for record in records:
+        key = record.table_key
+        identity = _key_identity(key)
+        if identity in seen:
+            continue
+        if len(seen) == batch_size:
+            seen.clear()
+        seen.add(identity)
+        yield {"DeleteRequest": {"Key": key}}
+
+
+def remove_records(
+    client: BaseClient,
+    table_name: str,
+    records: typing.Iterable["recorder.Record"],
+    max_workers: int = 1,
+    batch_size: int = MAX_BATCH_WRITE_ITEMS,
+    retry_policy: "retries.RetryPolicy | None" = None,
+) -> definitions.BatchWriteResponse:
+    """
+    Batch deletes the items with the keys of the specified records. The
+    keys are streamed into batches of up to 25 delete requests, which are
+    written concurrently when multiple workers are specified. A key that
+    repeats within a batch is only deleted once. The unprocessed items of
+    each batch are retried according to the retry policy, and a RuntimeError
+    is raised if items of a batch still remain once it is exhausted.
+
+    :param client:
+        Boto client used to delete the items.
+    :param table_name:
+        Name of the table to delete the items from.
+    :param records:
+        An iterable of Record objects whose keys identify the items to
+        delete, which can be a lazy generator. Only key values are needed.
+    :param max_workers:
+        Number of batches to write concurrently. Defaults to writing the
+        batches sequentially.
+    :param batch_size:
+        Number of keys deleted in each batch, up to 25.
+    :param retry_policy:
+        Policy for retrying throttled requests and unprocessed items, which
+        defaults to `retries.DEFAULT_RETRY_POLICY`.
+    :return:
+        A batch write response with the stats of each batch.
+    """
+    return _write_items(
+        client=client,
+        table_name=table_name,
+        items=_iter_delete_requests(records, batch_size),
+        max_workers=max_workers,
+        batch_size=batch_size,
+        retry_policy=retry_policy,
+    )
+
+
+class BatchWriter:
+    """
+    Context manager that buffers put and delete requests for records and
+    writes them with batch write calls, such that records can be streamed
+    into a table with constant memory. Requests for a key that is already
+    buffered replace the earlier request, since DynamoDB rejects batches
+    containing the same key more than once. The buffer is flushed whenever
+    it reaches the batch size and when the context exits. Unprocessed items
+    are retried according to the retry policy. A BatchWriter is not safe to
+    share between threads.
+
+    .. code-block:: python
+
+        with dio.BatchWriter(client, "catalog") as batch:
+            for record in records:
+                batch.put(record)
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        table_name: str,
+        batch_size: int = MAX_BATCH_WRITE_ITEMS,
+        retry_policy: typing.Optional[retries.RetryPolicy] = None,
+    ):
+        if not 0 < batch_size <= MAX_BATCH_WRITE_ITEMS:
+            raise ValueError(
+                f"Batch size must be between 1 and {MAX_BATCH_WRITE_ITEMS} items."
             )
+        self.client = client
+        self.table_name = table_name
+        self.batch_size = batch_size
+        self.retry_policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+        #: Stats of each batch written so far.
+        self.batches: typing.List[definitions.BatchWriteStats] = []
+        self._buffer: typing.Dict[typing.Tuple[typing.Any, ...], dict] = {}
+        self._last_result: typing.Optional[_requests.BatchWriteResult] = None
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
+
+    def _add(self, key: dict, item: dict):
+        """Buffers the write request, flushing once the buffer is full."""
+        identity = _key_identity(key)
+        self._buffer.pop(identity, None)
+        self._buffer[identity] = item
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def put(self, record: "recorder.Record"):
+        """Buffers a request to put the record into the table."""
+        self._add(record.table_key, {"PutRequest": {"Item": record.to_row()}})
+
+    def delete(self, record: "recorder.Record"):
+        """Buffers a request to delete the item with the record's key."""
+        key = record.table_key
+        self._add(key, {"DeleteRequest": {"Key": key}})
 
-    raise RuntimeError("Failed to insert all records.")
+    def flush(self) -> typing.Optional[definitions.BatchWriteStats]:
+        """
+        Writes the buffered requests as a single batch, returning the stats
+        of the batch or None if the buffer was empty.
+        """
+        if not self._buffer:
+            return None
+
+        items = list(self._buffer.values())
+        self._buffer.clear()
+        result = _write_batch(
+            self.client, self.table_name, len(self.batches), items, self.retry_policy
+        )
+        self._last_result = result
+        self.batches.append(result[0])
+        return result[0]
+
+    @property
+    def response(self) -> definitions.BatchWriteResponse:
+        """Response summarizing the batches written so far."""
+        _, request, response = self._last_result or (None, {}, {})
+        return definitions.BatchWriteResponse(
+            request=request,
+            response=response,
+            batches=tuple(self.batches),
+        )
 
 
 def upsert(
     client: BaseClient,
     table_name: str,
     record: "recorder.Record",
+    retry_policy: "retries.RetryPolicy | None" = None,
+    return_values: str = "ALL_NEW",
 ) -> "recorder.SingleRecordResponse":
     """
-    Upserts the specified record to DynamoDB.
+    Upserts the specified record to DynamoDB. The record of the returned
+    response is only deserialized from the returned attributes when it is
+    first accessed, and is None when no attributes are returned.
 
     :param client:
         Boto client that will be used to upsert the record into the table.
@@ -62,29 +364,212 @@ def upsert(
         Name of the table that will be written to.
     :param record:
         A Record object configured for writing to the specified table.
+    :param retry_policy:
+        Policy for retrying throttled requests, which defaults to
+        `retries.DEFAULT_RETRY_POLICY`.
+    :param return_values:
+        Attributes returned by DynamoDB, which is one of "ALL_NEW" for the
+        whole updated item, "UPDATED_NEW" for only the updated attributes,
+        "ALL_OLD" for the whole item before the update, or "NONE" to skip
+        returning attributes for writes that do not need the result. The
+        record is loaded with the key of the upserted record when only the
+        updated attributes are returned.
     """
-    request = {
-        "TableName": table_name,
-        "Key": record.table_key,
-        "ExpressionAttributeNames": record.to_attribute_names(),
-        "ExpressionAttributeValues": record.to_attribute_values(),
-        "UpdateExpression": record.to_update_expression(),
-        "ReturnValues": "ALL_NEW",
-    }
-    response = client.update_item(**request)
-
-    return recorder.SingleRecordResponse(
-        response=response,
-        request=request,
-        row=response["Attributes"],
-        record=record.from_row(response["Attributes"]),
-    )
+    request = _requests.to_upsert_request(table_name, record, return_values)
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    response = policy.call(client.update_item, **request)
+    caching.invalidate_records(table_name, [record])
+    return _requests.to_upsert_response(record, request, response)
+
+
+#: Marks values of successive records that cannot be merged into one update.
+_CONFLICT = object()
+
+
+def _combine(previous: typing.Any, operation: str, operand: typing.Any) -> typing.Any:
+    """Applies the add or delete operation with the operand to the value."""
+    if operation == "delete":
+        return [v for v in previous if v not in operand] or definitions.DELETE
+    if isinstance(operand, list):
+        return previous + [v for v in operand if v not in previous]
+    return previous + operand
+
+
+def _coalesce_value(previous: typing.Any, value: typing.Any) -> typing.Any:
+    """
+    Returns the value for a column that has the same effect as updating it
+    to the previous value followed by the value, or `_CONFLICT` if no single
+    value has the same effect.
+    """
+    is_operation = isinstance(value, definitions.SpecialOperation)
+    if previous is None or not is_operation or value == definitions.DELETE:
+        return value
+    if previous in ("", definitions.DELETE):
+        return definitions.DELETE if value.operation == "delete" else value.value
+    if not isinstance(previous, definitions.SpecialOperation):
+        return _combine(previous, value.operation, value.value)
+    if previous.operation == value.operation:
+        combined = _combine(previous.value, "add", value.value)
+        return definitions.SpecialOperation(value.operation, combined)
+    return _CONFLICT
+
+
+def _coalesce(
+    held: "recorder.Record",
+    record: "recorder.Record",
+) -> typing.Optional["recorder.Record"]:
+    """
+    Merges the non-None values of the record into the held record with the
+    same key, returning None if the records cannot be merged into a single
+    update. A held created_at is kept as it would be by if_not_exists.
+    """
+    changes = {}
+    for column in record.schema.all_columns:
+        value = getattr(record, column.name, None)
+        previous = getattr(held, column.name, None)
+        if value is None or (column.name == "created_at" and previous is not None):
+            continue
+        merged = _coalesce_value(previous, value)
+        if merged is _CONFLICT:
+            return None
+        changes[column.name] = merged
+    return dataclasses.replace(held, **changes)
+
+
+class CoalescingWriter:
+    """
+    Context manager that holds upserts for a window of time and merges the
+    records upserted for the same key during the window, such that only one
+    update is written per key and window. Later non-None values replace
+    earlier ones, DELETE removals and counter and set operations combine as
+    they would if the updates were applied in order, and the earliest
+    created_at is kept. If an update cannot be merged, e.g. a set addition
+    followed by a set deletion, the held update is written first.
+
+    Held updates are written by the next upsert once their window expires,
+    by `flush_expired` or `flush`, and when the context exits. A
+    CoalescingWriter may be shared between threads, and the updates of each
+    key are written in the order they were upserted.
+
+    .. code-block:: python
+
+        with dio.CoalescingWriter(client, "catalog", window=0.5) as writer:
+            for event in events:
+                writer.upsert(Product(product_id=event.id, sku=event.sku))
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        table_name: str,
+        window: float = 1.0,
+        return_values: str = "NONE",
+        retry_policy: typing.Optional[retries.RetryPolicy] = None,
+    ):
+        self.client = client
+        self.table_name = table_name
+        self.window = window
+        self.return_values = return_values
+        self.retry_policy = retry_policy
+        #: Number of records upserted into the writer.
+        self.received_count = 0
+        #: Number of updates written to the table.
+        self.write_count = 0
+        self._held: typing.Dict[typing.Tuple[typing.Any, ...], typing.Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks = [threading.Lock() for _ in range(64)]
+
+    def __enter__(self) -> "CoalescingWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.flush()
+
+    def _key_lock(self, identity: typing.Tuple[typing.Any, ...]) -> threading.Lock:
+        """
+        Returns the lock held while taking and writing the updates of the key,
+        which orders the writes of a key across threads.
+        """
+        return self._key_locks[hash(identity) % len(self._key_locks)]
+
+    def upsert(self, record: "recorder.Record"):
+        """
+        Holds the record for upserting, merged with any record already held
+        for its key, and writes the held updates whose window has expired.
+        """
+        identity = (type(record), _key_identity(record.table_key))
+        with self._key_lock(identity):
+            now = time.monotonic()
+            conflicting = []
+            with self._lock:
+                self.received_count += 1
+                started, held = self._held.get(identity, (now, None))
+                merged = _coalesce(held, record) if held else record
+                if merged is None:
+                    conflicting.append(self._held.pop(identity)[1])
+                    started, merged = now, record
+                self._held[identity] = (started, merged)
+            self._write(conflicting)
+        self.flush_expired()
+
+    def _take(self, identity: typing.Tuple[typing.Any, ...], expired_before: float):
+        """Removes and returns the held record if started before the time."""
+        with self._lock:
+            started, record = self._held.get(identity, (expired_before, None))
+            if record is None or started > expired_before:
+                return None
+            del self._held[identity]
+            return record
+
+    def _write(self, records: typing.List["recorder.Record"]):
+        """Upserts the records to the table."""
+        for record in records:
+            upsert(
+                self.client,
+                self.table_name,
+                record,
+                retry_policy=self.retry_policy,
+                return_values=self.return_values,
+            )
+            with self._lock:
+                self.write_count += 1
+
+    def _flush(self, expired_before: float) -> int:
+        """
+        Writes the held updates started before the time, taking and writing
+        each while its key lock is held such that a newer update of the key
+        cannot be written before it.
+        """
+        with self._lock:
+            identities = []
+            for identity, (started, _) in self._held.items():
+                if started > expired_before:
+                    break
+                identities.append(identity)
+
+        count = 0
+        for identity in identities:
+            with self._key_lock(identity):
+                record = self._take(identity, expired_before)
+                if record is not None:
+                    self._write([record])
+                    count += 1
+        return count
+
+    def flush_expired(self) -> int:
+        """Writes the held updates whose window has expired."""
+        return self._flush(time.monotonic() - self.window)
+
+    def flush(self) -> int:
+        """Writes all held updates, returning the number written."""
+        return self._flush(float("inf"))
 
 
 def remove(
     client: BaseClient,
     table_name: str,
     record: "recorder.Record",
+    retry_policy: "retries.RetryPolicy | None" = None,
 ) -> "definitions.Response":
     """Delete a record from a DynamoDB table.
 
@@ -92,12 +577,16 @@ def remove(
         client: The boto3 DynamoDB client.
         table_name: The name of the DynamoDB table.
         record: The record to delete from the table.
+        retry_policy: Optional policy for retrying throttled requests, which
+            defaults to `retries.DEFAULT_RETRY_POLICY`.
 
     Returns:
         Response object containing the request and response data.
     """
     request = {"TableName": table_name, "Key": record.table_key}
-    response = client.delete_item(**request)
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    response = policy.call(client.delete_item, **request)
+    caching.invalidate(table_name, [record.table_key])
     return definitions.Response(
         response=response,
         request=request,
@@ -110,6 +599,7 @@ def transacts(
     puts: typing.Iterable["recorder.Record"] | None = None,
     updates: typing.Iterable["recorder.Record"] | None = None,
     deletes: typing.Iterable["recorder.Record"] | None = None,
+    retry_policy: "retries.RetryPolicy | None" = None,
 ) -> "definitions.Response":
     """Execute multiple DynamoDB operations as a single transaction.
 
@@ -119,53 +609,194 @@ def transacts(
         puts: Optional iterable of records to insert or replace.
         updates: Optional iterable of records to update.
         deletes: Optional iterable of records to delete.
+        retry_policy: Optional policy for retrying throttled requests and
+            transaction conflicts, which defaults to
+            `retries.DEFAULT_RETRY_POLICY`.
 
     Returns:
         Response object containing the request and response data for the transaction.
     """
-    put_items = [
-        {
-            "Put": dict(
-                TableName=table_name,
-                Item=record.to_row(),
-            )
-        }
-        for record in (puts or [])
-    ]
-
-    update_items = [
-        {
-            "Update": dict(
-                TableName=table_name,
-                Key=record.table_key,
-                ExpressionAttributeNames=record.to_attribute_names(),
-                ExpressionAttributeValues=record.to_attribute_values(),
-                UpdateExpression=record.to_update_expression(),
-            )
-        }
-        for record in (updates or [])
-    ]
-
-    delete_items = [
-        {
-            "Delete": dict(
-                TableName=table_name,
-                Key=record.table_key,
-            )
-        }
-        for record in (deletes or [])
-    ]
-
-    request = {
-        "TransactItems": [
-            *put_items,
-            *update_items,
-            *delete_items,
-        ]
-    }
-    response = client.transact_write_items(**request)
+    records = [list(r or []) for r in (puts, updates, deletes)]
+    request = _requests.to_transact_request(table_name, *records)
+    policy = retry_policy or retries.DEFAULT_RETRY_POLICY
+    response = policy.call(client.transact_write_items, **request)
+    caching.invalidate_records(table_name, (r for group in records for r in group))
 
     return definitions.Response(
         response=response,
         request=request,
     )
+
+
+#: Marker placed on the queue to stop a worker once the queue is closed.
+_STOP = object()
+
+#: Queues that have not been closed, which are closed at interpreter exit.
+_open_queues: "weakref.WeakSet[WriteBehindQueue]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_queues():
+    """Writes everything still queued by queues that were never closed."""
+    for write_queue in list(_open_queues):
+        write_queue.close()
+
+
+class WriteBehindQueue:
+    """
+    Context manager that performs writes on background worker threads so
+    that callers do not wait for DynamoDB. Each write is placed on a bounded
+    queue and returns a future holding the response of the write, which may
+    be awaited or ignored. When the queue is full, further writes either
+    block until there is space, are dropped with a cancelled future, or
+    raise `queue.Full`, depending on the overflow policy. Closing the queue,
+    including when the context exits, writes everything still queued.
+    Queues that are still open when the interpreter exits are closed then.
+
+    .. code-block:: python
+
+        with dio.WriteBehindQueue(client, "catalog", workers=4) as writes:
+            for product in products:
+                writes.upsert(product)
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        table_name: str,
+        max_size: int = 1000,
+        workers: int = 1,
+        overflow: str = "block",
+        retry_policy: typing.Optional[retries.RetryPolicy] = None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Overflow must be one of {OVERFLOW_POLICIES}.")
+        self.client = client
+        self.table_name = table_name
+        self.overflow = overflow
+        self.retry_policy = retry_policy
+        #: Number of writes dropped because the queue was full.
+        self.dropped_count = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max(max_size, 1))
+        self._closed = False
+        #: Number of writes blocked waiting for space on the queue.
+        self._blocked_count = 0
+        self._lock = threading.Lock()
+        self._unblocked = threading.Condition(self._lock)
+        self._workers = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(max(workers, 1))
+        ]
+        for worker in self._workers:
+            worker.start()
+        _open_queues.add(self)
+
+    def __enter__(self) -> "WriteBehindQueue":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _work(self):
+        """Performs the queued writes until the stop marker is received."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                future, function, kwargs = item
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(function(**kwargs))
+                    except BaseException as error:
+                        future.set_exception(error)
+            finally:
+                self._queue.task_done()
+
+    def _submit(
+        self,
+        function: typing.Callable[..., typing.Any],
+        **kwargs,
+    ) -> futures.Future:
+        """
+        Queues the write according to the overflow policy. The queue is
+        checked for being closed under the lock that closing takes. Writes
+        waiting for space do so without the lock and are counted, so that
+        closing waits for them before stopping the workers and no write is
+        queued after the workers are stopped.
+        """
+        future: futures.Future = futures.Future()
+        kwargs.update(client=self.client, table_name=self.table_name)
+        item = (future, function, kwargs)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot write to a closed queue.")
+            try:
+                self._queue.put_nowait(item)
+                return future
+            except queue.Full:
+                if self.overflow == "raise":
+                    raise
+                if self.overflow == "drop":
+                    self.dropped_count += 1
+                    future.cancel()
+                    return future
+            self._blocked_count += 1
+
+        try:
+            self._queue.put(item)
+        finally:
+            with self._lock:
+                self._blocked_count -= 1
+                self._unblocked.notify_all()
+        return future
+
+    def upsert(self, record: "recorder.Record", **kwargs) -> futures.Future:
+        """
+        Queues an upsert of the record, returning a future for its
+        SingleRecordResponse. Additional arguments are passed to `upsert`.
+        """
+        kwargs.setdefault("retry_policy", self.retry_policy)
+        return self._submit(upsert, record=record, **kwargs)
+
+    def insert_records(
+        self,
+        records: typing.Iterable["recorder.Record"],
+        **kwargs,
+    ) -> futures.Future:
+        """
+        Queues a batch insert of the records, returning a future for its
+        BatchWriteResponse. The records are converted on a worker thread.
+        Additional arguments are passed to `insert_records`.
+        """
+        kwargs.setdefault("retry_policy", self.retry_policy)
+        return self._submit(insert_records, records=records, **kwargs)
+
+    def remove(self, record: "recorder.Record", **kwargs) -> futures.Future:
+        """
+        Queues the deletion of the record, returning a future for its
+        Response. Additional arguments are passed to `remove`.
+        """
+        kwargs.setdefault("retry_policy", self.retry_policy)
+        return self._submit(remove, record=record, **kwargs)
+
+    def flush(self):
+        """Waits until every write queued so far has been performed."""
+        self._queue.join()
+
+    def close(self):
+        """
+        Stops accepting writes, waits for the queued writes to be performed
+        and stops the workers. Closing a closed queue has no effect.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            while self._blocked_count:
+                self._unblocked.wait()
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        for worker in self._workers:
+            worker.join()
+        _open_queues.discard(self)